@@ -1 +1,7 @@
-# Core app for Django template project 
\ No newline at end of file
+# Core app for Django template project
+
+# Load the Celery app whenever Django starts, so tasks queued from web processes use its
+# configuration (routing, priorities) and not Celery's default app
+from .celery import app as celery_app
+
+__all__ = ('celery_app',)
@@ -1,6 +1,8 @@
 import os
 from celery import Celery
+from celery.signals import worker_process_init
 from django.conf import settings
+from kombu import Queue
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
@@ -17,7 +19,8 @@ app.autodiscover_tasks()
 # Simple file-based scheduler configuration
 app.conf.beat_schedule = {
     'example-periodic-task': {
-        'task': 'example.tasks.example_of_periodic_task',
+        # Fans out one fetch task per entry in EXAMPLE_FETCH_SOURCES
+        'task': 'example.tasks.example_of_fan_out_task.example_of_scheduled_fan_out_task',
         'schedule': 3600,  # Run every hour (3600 seconds)
         'options': {
             'expires': 3000,  # Task expires after 50 minutes if not picked up
@@ -32,6 +35,65 @@ app.conf.beat_schedule_filename = 'celerybeat-schedule'
 
 app.conf.timezone = 'UTC'
 
+# ====== SUMMARY QUEUE ROUTING ======
+# Each processing model gets its own queue, so a backlog for one model cannot delay the
+# others or the hourly fetch (which stays on the default queue). Workers subscribe per
+# queue with their own --concurrency and --prefetch-multiplier; see docker-compose.yml.
+SUMMARY_TASKS = (
+    'example.tasks.example_of_async_task.example_of_async_processing_task',
+    'example.tasks.example_of_async_task.example_of_batch_processing_task',
+)
+SUMMARY_QUEUES = {
+    'example-model-pro': 'summaries-pro',
+    'example-model-lite': 'summaries-lite',
+}
+# Models without a dedicated queue (example-model-v1, example-model-v2, ...)
+SUMMARY_DEFAULT_QUEUE = 'summaries'
+
+# Priority names accepted by the API. With the Redis broker a lower number is served first.
+SUMMARY_PRIORITIES = {'high': 0, 'normal': 4, 'low': 9}
+SUMMARY_DEFAULT_PRIORITY = 'normal'
+
+app.conf.task_default_queue = 'default'
+app.conf.task_queues = [
+    Queue('default'),
+    Queue(SUMMARY_DEFAULT_QUEUE),
+    *(Queue(queue) for queue in SUMMARY_QUEUES.values()),
+]
+app.conf.task_default_priority = SUMMARY_PRIORITIES[SUMMARY_DEFAULT_PRIORITY]
+app.conf.broker_transport_options = {
+    # One Redis list per priority level, consumed in priority order
+    'queue_order_strategy': 'priority',
+    'priority_steps': list(range(10)),
+    'sep': ':',
+}
+
+
+def summary_queue(processing_model):
+    """Celery queue for summary tasks of a processing model."""
+    return SUMMARY_QUEUES.get(processing_model, SUMMARY_DEFAULT_QUEUE)
+
+
+def route_summary_task(name, args, kwargs, options, task=None, **kw):
+    """Route summary tasks by their processing_model argument; everything else uses the default queue."""
+    if name not in SUMMARY_TASKS:
+        return None
+    processing_model = kwargs.get('processing_model') if kwargs else None
+    if processing_model is None and args and len(args) > 1:
+        processing_model = args[1]
+    return {'queue': summary_queue(processing_model)}
+
+
+app.conf.task_routes = (route_summary_task,)
+
+
+@worker_process_init.connect
+def warm_ai_clients(**kwargs):
+    """Create the pooled AI clients in each worker process before it takes its first task."""
+    from example.services import ExampleOfAiService
+    ExampleOfAiService().warm_clients()
+
+
 @app.task(bind=True)
 def debug_task(self):
     print(f'Request: {self.request!r}')
\ No newline at end of file
@@ -0,0 +1,62 @@
+from rest_framework.pagination import BasePagination, CursorPagination, PageNumberPagination
+
+
+class ExampleOfCursorPagination(CursorPagination):
+    """
+    Example of keyset pagination over (published_date DESC, id DESC).
+    Each page is an index range scan from the cursor position, so page 10,000 costs the
+    same as page 1 and no COUNT(*) is run. Needs a matching index on the model.
+    """
+    ordering = ('-published_date', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class ExampleOfOptInCursorPagination(BasePagination):
+    """
+    Example of pagination that keeps page numbers by default and switches to cursor
+    pagination per request (`?pagination=cursor`, or any request carrying a `cursor`) or
+    per view (`pagination_mode = 'cursor'`).
+    """
+    page_number_class = PageNumberPagination
+    cursor_class = ExampleOfCursorPagination
+
+    def __init__(self):
+        self.paginator = None
+
+    def _use_cursor(self, request, view):
+        mode = request.query_params.get('pagination') or getattr(view, 'pagination_mode', 'page')
+        return mode == 'cursor' or self.cursor_class.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None):
+        paginator_class = self.cursor_class if self._use_cursor(request, view) else self.page_number_class
+        self.paginator = paginator_class()
+        return self.paginator.paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return self.page_number_class().get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        parameters = self.page_number_class().get_schema_operation_parameters(view)
+        parameters += self.cursor_class().get_schema_operation_parameters(view)
+        parameters.append({
+            'name': 'pagination',
+            'required': False,
+            'in': 'query',
+            'description': "Set to 'cursor' for keyset pagination",
+            'schema': {'type': 'string', 'enum': ['page', 'cursor']},
+        })
+        return parameters
+
+
+class ExampleOfSearchCursorPagination(ExampleOfCursorPagination):
+    """
+    Example of keyset pagination over search results, best match first. The queryset
+    must annotate a `rank`. The cursor keys on the rank alone: rows sharing the rank of
+    the cursor position are skipped with an offset, and id only keeps their order stable,
+    so a long run of equal ranks is paged through by offset.
+    """
+    ordering = ('-rank', '-id')
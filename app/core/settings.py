@@ -21,6 +21,31 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # Example API configurations - replace with your actual API keys
 EXAMPLE_API_KEY = os.environ.get('EXAMPLE_API_KEY', '')
 EXAMPLE_AI_API_KEY = os.environ.get('EXAMPLE_AI_API_KEY', '')
+# Maximum number of item ids accepted by one batch processing request
+EXAMPLE_AI_MAX_BATCH_ITEMS = int(os.environ.get('EXAMPLE_AI_MAX_BATCH_ITEMS', 100))
+# Pooled AI clients: one per model per process, with at most EXAMPLE_AI_MAX_CONCURRENCY calls in flight
+EXAMPLE_AI_BASE_URL = os.environ.get('EXAMPLE_AI_BASE_URL', 'https://ai.example.com/v1')
+EXAMPLE_AI_MAX_CONCURRENCY = int(os.environ.get('EXAMPLE_AI_MAX_CONCURRENCY', 4))
+EXAMPLE_AI_TIMEOUT = float(os.environ.get('EXAMPLE_AI_TIMEOUT', 30.0))
+# Map-reduce summarization: content longer than EXAMPLE_AI_CHUNK_WORDS is split into chunks
+# overlapping by EXAMPLE_AI_CHUNK_OVERLAP_WORDS, summarized by up to EXAMPLE_AI_CHUNK_WORKERS threads
+EXAMPLE_AI_CHUNK_WORDS = int(os.environ.get('EXAMPLE_AI_CHUNK_WORDS', 1500))
+EXAMPLE_AI_CHUNK_OVERLAP_WORDS = int(os.environ.get('EXAMPLE_AI_CHUNK_OVERLAP_WORDS', 150))
+EXAMPLE_AI_CHUNK_WORKERS = int(os.environ.get('EXAMPLE_AI_CHUNK_WORKERS', 4))
+# Seconds after which a queued summary task is presumed lost and may be queued again
+EXAMPLE_AI_TASK_STALE_AFTER = int(os.environ.get('EXAMPLE_AI_TASK_STALE_AFTER', 3600))
+# Summary status event stream: seconds before the server closes it (clients reconnect) and between keep-alives
+EXAMPLE_STATUS_STREAM_TIMEOUT = int(os.environ.get('EXAMPLE_STATUS_STREAM_TIMEOUT', 300))
+EXAMPLE_STATUS_STREAM_HEARTBEAT = int(os.environ.get('EXAMPLE_STATUS_STREAM_HEARTBEAT', 15))
+# Content-addressed summary cache: entries live in Redis for EXAMPLE_SUMMARY_CACHE_TTL seconds
+# (evicted LRU under memory pressure) and, with EXAMPLE_SUMMARY_CACHE_DB, also in a durable table
+EXAMPLE_SUMMARY_CACHE_ENABLED = os.environ.get('EXAMPLE_SUMMARY_CACHE_ENABLED', '1').lower() in ('1', 'true', 'yes')
+EXAMPLE_SUMMARY_CACHE_TTL = int(os.environ.get('EXAMPLE_SUMMARY_CACHE_TTL', 7 * 24 * 3600))
+EXAMPLE_SUMMARY_CACHE_DB = os.environ.get('EXAMPLE_SUMMARY_CACHE_DB', '0').lower() in ('1', 'true', 'yes')
+# Per-item summary listings are invalidated on every status change; the TTL is a safety net
+EXAMPLE_ITEM_SUMMARIES_CACHE_TTL = int(os.environ.get('EXAMPLE_ITEM_SUMMARIES_CACHE_TTL', 3600))
+# Item list/detail responses: every write starts new cache versions, so the TTL only bounds memory use
+EXAMPLE_ITEM_CACHE_TTL = int(os.environ.get('EXAMPLE_ITEM_CACHE_TTL', 6 * 3600))
 # Use Django's reverse_lazy to resolve the example API URL dynamically
 try:
     EXAMPLE_API_URL = reverse_lazy('example:example-list')
@@ -28,6 +53,29 @@ except Exception:
     # Fallback for contexts where Django isn't fully loaded (e.g., scripts, celery)
     EXAMPLE_API_URL = os.environ.get('EXAMPLE_API_URL', 'http://localhost:8000/api/example/')
 
+# Number of items per bulk_create chunk when ingesting fetched items
+EXAMPLE_BULK_BATCH_SIZE = int(os.environ.get('EXAMPLE_BULK_BATCH_SIZE', 500))
+
+# Paginated fetcher used by ExampleOfExternalApiService
+# Set EXAMPLE_API_SIMULATE=0 to call the real upstream instead of the canned example data
+EXAMPLE_API_SIMULATE = os.environ.get('EXAMPLE_API_SIMULATE', '1').lower() in ('1', 'true', 'yes')
+EXAMPLE_FETCH_PAGE_SIZE = int(os.environ.get('EXAMPLE_FETCH_PAGE_SIZE', 100))
+EXAMPLE_FETCH_MAX_PAGES = int(os.environ.get('EXAMPLE_FETCH_MAX_PAGES', 50))
+EXAMPLE_FETCH_CONCURRENCY = int(os.environ.get('EXAMPLE_FETCH_CONCURRENCY', 5))
+EXAMPLE_FETCH_TIMEOUT = float(os.environ.get('EXAMPLE_FETCH_TIMEOUT', 10.0))
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+EXAMPLE_FETCH_HTTP2 = os.environ.get('EXAMPLE_FETCH_HTTP2', '0').lower() in ('1', 'true', 'yes')
+# Upstream quota shared by every worker (requests per second and burst size; 0 disables the limiter)
+# and how many times a single page request is retried after a 429, honoring Retry-After
+EXAMPLE_FETCH_RATE_LIMIT = float(os.environ.get('EXAMPLE_FETCH_RATE_LIMIT', 5.0))
+EXAMPLE_FETCH_RATE_BURST = int(os.environ.get('EXAMPLE_FETCH_RATE_BURST', 10))
+EXAMPLE_FETCH_RATE_LIMIT_RETRIES = int(os.environ.get('EXAMPLE_FETCH_RATE_LIMIT_RETRIES', 3))
+
+# Raw-data archive: compressed, append-only JSONL segments indexed by fetch log id
+EXAMPLE_RAW_DATA_CAPTURE = os.environ.get('EXAMPLE_RAW_DATA_CAPTURE', '0').lower() in ('1', 'true', 'yes')
+EXAMPLE_RAW_DATA_DIR = os.environ.get('EXAMPLE_RAW_DATA_DIR', os.path.join(BASE_DIR, 'media', 'raw_data'))
+EXAMPLE_RAW_DATA_SEGMENT_BYTES = int(os.environ.get('EXAMPLE_RAW_DATA_SEGMENT_BYTES', 64 * 1024 * 1024))
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
@@ -51,6 +99,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework.authtoken',
     'drf_spectacular',
@@ -186,6 +235,26 @@ CELERY_TASK_TIME_LIMIT = 600  # 10 minutes
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 CELERY_TASK_ACKS_LATE = True
 
+# Fetch log progress: 'db' flushes counters to the row at most every EXAMPLE_FETCH_LOG_FLUSH_INTERVAL
+# seconds, 'cache' keeps live progress in Redis and writes the row only on completion
+EXAMPLE_FETCH_LOG_PROGRESS_BACKEND = os.environ.get('EXAMPLE_FETCH_LOG_PROGRESS_BACKEND', 'db')
+EXAMPLE_FETCH_LOG_FLUSH_INTERVAL = float(os.environ.get('EXAMPLE_FETCH_LOG_FLUSH_INTERVAL', 5.0))
+
+# Bloom filter over article URLs, consulted by ingest before the database once built
+# (python manage.py example_of_url_bloom_command)
+EXAMPLE_URL_BLOOM_ENABLED = os.environ.get('EXAMPLE_URL_BLOOM_ENABLED', '1').lower() in ('1', 'true', 'yes')
+EXAMPLE_URL_BLOOM_CAPACITY = int(os.environ.get('EXAMPLE_URL_BLOOM_CAPACITY', 1_000_000))
+EXAMPLE_URL_BLOOM_ERROR_RATE = float(os.environ.get('EXAMPLE_URL_BLOOM_ERROR_RATE', 0.01))
+EXAMPLE_URL_BLOOM_KEY = 'example:url-bloom'
+
+# Sources fanned out by example_of_scheduled_fan_out_task, one fetch task per entry
+EXAMPLE_FETCH_SOURCES = [
+    {'source': 'ExampleService', 'query_params': {'language': 'en', 'category': 'example'}},
+]
+# Maximum concurrent fetches per source and the re-queue delay (seconds) when a source is saturated
+EXAMPLE_FETCH_SOURCE_CONCURRENCY = int(os.environ.get('EXAMPLE_FETCH_SOURCE_CONCURRENCY', 2))
+EXAMPLE_FETCH_SOURCE_RETRY_DELAY = int(os.environ.get('EXAMPLE_FETCH_SOURCE_RETRY_DELAY', 10))
+
 # Logging configuration
 LOGGING = {
     'version': 1,
@@ -225,7 +294,7 @@ LOGGING = {
 CACHES = {
     'default': {
         'BACKEND': 'django_redis.cache.RedisCache',
-        'LOCATION': os.environ.get('REDIS_CACHE_URL', 'redis://redis:6379/1'),
+        'LOCATION': os.environ.get('REDIS_CACHE_URL', 'redis://redis-cache:6379/0'),
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
         }
@@ -2,9 +2,11 @@
 from .example_of_basic_admin import ExampleOfBasicAdmin
 from .example_of_advanced_admin import ExampleOfAdvancedAdmin
 from .example_of_custom_actions import ExampleOfCustomActionsAdmin
+from .example_of_cost_rollup_admin import ExampleOfCostRollupAdmin
 
 __all__ = [
     'ExampleOfBasicAdmin',
     'ExampleOfAdvancedAdmin',
     'ExampleOfCustomActionsAdmin',
+    'ExampleOfCostRollupAdmin',
 ] 
\ No newline at end of file
@@ -3,11 +3,13 @@ from example.models import ExampleOfArticle
 
 class ExampleOfBasicAdmin(admin.ModelAdmin):
     """Example of basic admin customization."""
-    readonly_fields = ('id', 'created_at')
-    list_display = ('id', 'title', 'author', 'source', 'published_date', 'created_at')
+    readonly_fields = ('id', 'created_at', 'word_count', 'char_count', 'content_hash')
+    list_display = ('id', 'title', 'author', 'source', 'word_count', 'published_date', 'created_at')
     list_filter = ('source', 'published_date', 'created_at')
     search_fields = ('title', 'content', 'author')
     ordering = ('-published_date',)
     date_hierarchy = 'published_date'
+    # Skip the unfiltered COUNT(*) on every changelist page of a large table
+    show_full_result_count = False
 
 admin.site.register(ExampleOfArticle, ExampleOfBasicAdmin) 
\ No newline at end of file
@@ -0,0 +1,43 @@
+from django.contrib import admin
+from django.db.models import Sum
+from example.models import ExampleOfCostRollup
+
+
+@admin.register(ExampleOfCostRollup)
+class ExampleOfCostRollupAdmin(admin.ModelAdmin):
+    """Example of a read-only admin reporting spend from pre-aggregated hourly buckets."""
+    list_display = ('bucket_start', 'processing_model', 'user_display', 'summary_count', 'total_cost')
+    list_filter = ('processing_model', 'bucket_start')
+    list_select_related = ('requested_by',)
+    date_hierarchy = 'bucket_start'
+    ordering = ('-bucket_start', 'processing_model')
+
+    def user_display(self, obj):
+        """Display the requesting user, or the id of a deleted one."""
+        if obj.requested_by is not None:
+            return obj.requested_by
+        return f"Deleted user {obj.requested_by_id}" if obj.requested_by_id else "Anonymous"
+    user_display.short_description = "Requested By"
+
+    def changelist_view(self, request, extra_context=None):
+        """Show totals for the filtered buckets above the list."""
+        response = super().changelist_view(request, extra_context=extra_context)
+        changelist = getattr(response, 'context_data', {}).get('cl')
+        if changelist is not None:
+            totals = changelist.queryset.aggregate(
+                summary_count=Sum('summary_count'),
+                total_cost=Sum('total_cost'),
+            )
+            self.message_user(
+                request,
+                f"{totals['summary_count'] or 0} summaries, {totals['total_cost'] or 0} credits "
+                "in the selected buckets."
+            )
+        return response
+
+    # Buckets are written by the AI service and the rebuild command only
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
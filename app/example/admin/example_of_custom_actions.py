@@ -1,5 +1,8 @@
+from decimal import Decimal
+
 from django.contrib import admin
 from example.models import ExampleOfSummary
+from example.services import ExampleOfItemSummariesCache
 
 @admin.register(ExampleOfSummary)
 class ExampleOfCustomActionsAdmin(admin.ModelAdmin):
@@ -65,24 +68,31 @@ class ExampleOfCustomActionsAdmin(admin.ModelAdmin):
 
     def mark_as_pending(self, request, queryset):
         """Mark selected summaries as pending."""
+        item_ids = list(queryset.values_list('example_item_id', flat=True))
         updated = queryset.update(status='pending', error_message=None)
+        ExampleOfItemSummariesCache.invalidate(item_ids)
         self.message_user(request, f'{updated} summaries marked as pending.')
     mark_as_pending.short_description = "Mark selected summaries as pending"
 
     def mark_as_failed(self, request, queryset):
         """Mark selected summaries as failed."""
+        item_ids = list(queryset.values_list('example_item_id', flat=True))
         updated = queryset.update(status='failed')
+        ExampleOfItemSummariesCache.invalidate(item_ids)
         self.message_user(request, f'{updated} summaries marked as failed.')
     mark_as_failed.short_description = "Mark selected summaries as failed"
 
     def recalculate_cost(self, request, queryset):
         """Recalculate processing cost for selected summaries."""
-        updated = 0
-        for summary in queryset:
-            if summary.summary_text:
-                # Example cost calculation: 0.001 per word
-                summary.processing_cost = len(summary.summary_text.split()) * 0.001
-                summary.save()
-                updated += 1
-        self.message_user(request, f'Processing cost recalculated for {updated} summaries.')
+        summaries = list(
+            queryset.exclude(summary_text__isnull=True).exclude(summary_text='')
+            .only('id', 'example_item_id', 'summary_text')
+        )
+        for summary in summaries:
+            # Example cost calculation: 0.001 per word of the summary
+            summary.processing_cost = len(summary.summary_text.split()) * Decimal('0.001')
+        # One UPDATE per batch instead of a save() per summary
+        ExampleOfSummary.objects.bulk_update(summaries, ['processing_cost'], batch_size=500)
+        ExampleOfItemSummariesCache.invalidate(summary.example_item_id for summary in summaries)
+        self.message_user(request, f'Processing cost recalculated for {len(summaries)} summaries.')
     recalculate_cost.short_description = "Recalculate processing cost" 
\ No newline at end of file
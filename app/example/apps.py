@@ -3,4 +3,8 @@ from django.apps import AppConfig
 
 class ExampleConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'example' 
\ No newline at end of file
+    name = 'example'
+
+    def ready(self):
+        # Register signal handlers
+        from example import signals  # noqa: F401
@@ -71,4 +71,4 @@ class ExampleOfCeleryCommand(BaseCommand):
         except Exception as e:
             self.stdout.write(
                 self.style.WARNING(f'Could not check registered tasks: {e}')
-            ) 
\ No newline at end of file
+            ) 
@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from example.services import ExampleOfCostRollupRecorder
+
+
+class ExampleOfCostRollupCommand(BaseCommand):
+    help = 'Example of a command that recomputes hourly cost rollups for a time range from the summaries'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', type=str, help='Rebuild buckets from this ISO datetime (default: 24 hours ago)')
+        parser.add_argument('--end', type=str, help='Rebuild buckets up to this ISO datetime (default: now)')
+
+    def _parse(self, value, name):
+        moment = parse_datetime(value)
+        if moment is None:
+            raise CommandError(f'--{name} must be an ISO datetime, got {value!r}')
+        return timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+
+    def handle(self, *args, **options):
+        end = self._parse(options['end'], 'end') if options['end'] else timezone.now()
+        start = self._parse(options['start'], 'start') if options['start'] else end - timedelta(hours=24)
+        if start >= end:
+            raise CommandError('--start must be before --end')
+
+        count = ExampleOfCostRollupRecorder().rebuild(start, end)
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {count} cost rollup bucket(s) between {start.isoformat()} and {end.isoformat()}'
+        ))
@@ -39,4 +39,4 @@ class ExampleOfCustomCommand(BaseCommand):
             result = example_of_periodic_fetch_task(query_params)
             self.stdout.write(
                 self.style.SUCCESS(f'Task completed: {result}')
-            ) 
\ No newline at end of file
+            ) 
@@ -0,0 +1,72 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.pagination import Cursor, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.pagination import ExampleOfCursorPagination
+from example.views import ExampleOfCachedListView
+
+
+class ExampleOfPaginationBenchmarkCommand(BaseCommand):
+    help = 'Example of a command that compares page-number and cursor pagination latency at several page depths'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pages',
+            type=str,
+            default='1,100,10000',
+            help='Comma-separated page numbers to time (default: 1,100,10000)'
+        )
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per page, the median is reported')
+
+    def handle(self, *args, **options):
+        try:
+            pages = [int(page) for page in options['pages'].split(',')]
+        except ValueError:
+            raise CommandError('--pages must be a comma-separated list of integers')
+        queryset = ExampleOfCachedListView.queryset
+        page_size = PageNumberPagination().page_size
+        total = queryset.count()
+        factory = APIRequestFactory()
+
+        self.stdout.write(f'{total} articles, {page_size} per page')
+        self.stdout.write(f"{'page':>8} {'page-number ms':>15} {'cursor ms':>10}")
+        for page in pages:
+            offset = (page - 1) * page_size
+            if offset >= total:
+                self.stdout.write(self.style.WARNING(f'{page:>8} skipped: only {total} articles'))
+                continue
+
+            page_number = self._median(options['repeat'], lambda: self._paginate(
+                PageNumberPagination(), queryset, factory.get('/items/', {'page': page})
+            ))
+            # The cursor a client would hold after walking to this page: the position of the
+            # last row of the previous page, built directly instead of walking there
+            paginator = ExampleOfCursorPagination()
+            paginator.base_url = 'http://testserver/items/'
+            cursor_url = paginator.base_url
+            if offset:
+                last = queryset.order_by(*paginator.ordering)[offset - 1]
+                cursor_url = paginator.encode_cursor(Cursor(
+                    offset=0, reverse=False, position=paginator._get_position_from_instance(last, paginator.ordering)
+                ))
+            cursor = self._median(options['repeat'], lambda: self._paginate(
+                ExampleOfCursorPagination(), queryset, factory.get(cursor_url)
+            ))
+            self.stdout.write(f'{page:>8} {page_number:>15.2f} {cursor:>10.2f}')
+
+    @staticmethod
+    def _paginate(paginator, queryset, request):
+        return list(paginator.paginate_queryset(queryset, Request(request)))
+
+    @staticmethod
+    def _median(repeat, run):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
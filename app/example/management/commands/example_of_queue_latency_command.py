@@ -0,0 +1,58 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import F
+from django.utils import timezone
+from core.celery import summary_queue
+from example.models import ExampleOfSummary
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list."""
+    if not values:
+        return None
+    index = max(0, min(len(values) - 1, int(round(fraction * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+class ExampleOfQueueLatencyCommand(BaseCommand):
+    help = 'Example of a command that reports queue-to-completion latency percentiles per processing model'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--minutes',
+            type=int,
+            default=60,
+            help='Only include summaries completed in the last N minutes (default: 60)'
+        )
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='models',
+            help='Processing model to report on; repeat for several (default: all)'
+        )
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(minutes=options['minutes'])
+        queryset = ExampleOfSummary.objects.filter(
+            status='completed', queued_at__isnull=False, completed_at__gte=since
+        )
+        if options['models']:
+            queryset = queryset.filter(processing_model__in=options['models'])
+
+        latencies = {}
+        rows = queryset.annotate(latency=F('completed_at') - F('queued_at')).values_list('processing_model', 'latency')
+        for processing_model, latency in rows.iterator(chunk_size=10000):
+            latencies.setdefault(processing_model, []).append(latency.total_seconds())
+
+        if not latencies:
+            self.stdout.write(self.style.WARNING(f"No summaries completed in the last {options['minutes']} minutes"))
+            return
+
+        self.stdout.write(f"{'model':<24} {'queue':<16} {'count':>7} {'p50 s':>9} {'p95 s':>9} {'max s':>9}")
+        for processing_model, values in sorted(latencies.items()):
+            values.sort()
+            self.stdout.write(
+                f"{processing_model:<24} {summary_queue(processing_model):<16} {len(values):>7} "
+                f"{percentile(values, 0.5):>9.2f} {percentile(values, 0.95):>9.2f} {values[-1]:>9.2f}"
+            )
@@ -0,0 +1,136 @@
+import json
+import multiprocessing
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from example.models import ExampleOfFetchLog
+from example.services import ExampleOfExternalApiService, ExampleOfRawDataArchive
+
+
+def _load_items(locations):
+    """Read and normalize the archived payloads of one fetch log. Runs in a worker process."""
+    archive = ExampleOfRawDataArchive()
+    items = {}
+    for location in locations:
+        for item in archive.read_payload(location).get('items', []):
+            if item.get('url') and parse_datetime(item.get('publishedAt') or ''):
+                items[item['url']] = item
+    return list(items.values())
+
+
+class ExampleOfReplayCommand(BaseCommand):
+    help = 'Example of a command that rebuilds articles from archived raw payloads in parallel'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', type=str, help='Replay fetch logs started at or after this ISO datetime')
+        parser.add_argument('--end', type=str, help='Replay fetch logs started before this ISO datetime')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of worker processes used to decode payloads (default: CPU count)'
+        )
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            default=os.path.join(settings.EXAMPLE_RAW_DATA_DIR, 'replay.checkpoint'),
+            help='File recording the last replayed fetch log, used to resume a killed run'
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignore any existing checkpoint and replay the whole range'
+        )
+        parser.add_argument(
+            '--insert-only',
+            action='store_true',
+            help='Only insert missing articles instead of updating existing ones'
+        )
+
+    def _parse_datetime(self, value, name):
+        if value is None:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            raise CommandError(f'Invalid --{name} datetime: {value}')
+        return parsed
+
+    def _load_checkpoint(self, path, run_key):
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            checkpoint = json.load(f)
+        return checkpoint['last_fetch_log_id'] if checkpoint.get('run_key') == run_key else None
+
+    def _save_checkpoint(self, path, run_key, last_fetch_log_id):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'run_key': run_key, 'last_fetch_log_id': last_fetch_log_id}, f)
+        os.replace(tmp_path, path)
+
+    def handle(self, *args, **options):
+        start = self._parse_datetime(options['start'], 'start')
+        end = self._parse_datetime(options['end'], 'end')
+        run_key = f"{options['start']}|{options['end']}"
+        checkpoint_path = options['checkpoint']
+
+        fetch_logs = ExampleOfFetchLog.objects.exclude(raw_data_file='').order_by('id')
+        if start:
+            fetch_logs = fetch_logs.filter(started_at__gte=start)
+        if end:
+            fetch_logs = fetch_logs.filter(started_at__lt=end)
+
+        last_fetch_log_id = None if options['restart'] else self._load_checkpoint(checkpoint_path, run_key)
+        if last_fetch_log_id:
+            fetch_logs = fetch_logs.filter(id__gt=last_fetch_log_id)
+            self.stdout.write(f'Resuming after fetch log {last_fetch_log_id}')
+
+        raw_data_files = dict(fetch_logs.values_list('id', 'raw_data_file'))
+        # Streamed fetches archive one record per page, so every record of a log is looked up
+        # in the archive index; legacy files that predate the archive are only on the log
+        locations = defaultdict(list)
+        for fetch_log_id, location in ExampleOfRawDataArchive().iter_index():
+            if fetch_log_id in raw_data_files:
+                locations[fetch_log_id].append(location)
+        pending = [
+            (fetch_log_id, locations.get(fetch_log_id) or [raw_data_files[fetch_log_id]])
+            for fetch_log_id in sorted(raw_data_files)
+        ]
+        self.stdout.write(self.style.SUCCESS(f'Replaying {len(pending)} fetch log(s)...'))
+
+        service = ExampleOfExternalApiService()
+        workers = max(options['workers'], 1)
+        window = workers * 4
+        items_total = 0
+        items_saved = 0
+        started = time.perf_counter()
+
+        # Workers only decode payloads and never touch the database
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as pool:
+            for offset in range(0, len(pending), window):
+                batch = pending[offset:offset + window]
+                for items in pool.map(_load_items, [log_locations for _, log_locations in batch]):
+                    _, saved, _ = service._save_items(items, update_existing=not options['insert_only'])
+                    items_total += len(items)
+                    items_saved += saved
+
+                # Checkpoint only after the whole window has been merged
+                self._save_checkpoint(checkpoint_path, run_key, batch[-1][0])
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f'  {offset + len(batch)}/{len(pending)} logs, {items_total} items, '
+                    f'{items_total / elapsed if elapsed else 0:.0f} items/s'
+                )
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'Replay completed: {items_total} items ({items_saved} written) in {elapsed:.2f}s, '
+            f'{items_total / elapsed if elapsed else 0:.0f} items/s'
+        ))
@@ -0,0 +1,130 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+from example.models import ExampleOfArticle
+from example.services import ExampleOfItemResponseCache
+from example.views import ExampleOfCachedListView
+
+BENCHMARK_SOURCE = 'search-benchmark'
+VOCABULARY = (
+    'market', 'energy', 'climate', 'election', 'court', 'health', 'vaccine', 'budget', 'trade',
+    'bank', 'inflation', 'startup', 'robot', 'satellite', 'ocean', 'river', 'football', 'festival',
+    'museum', 'software', 'security', 'privacy', 'battery', 'solar', 'wind', 'housing', 'school',
+    'research', 'hospital', 'airline', 'railway', 'harvest', 'drought', 'storm', 'minister',
+    'parliament', 'strike', 'merger', 'earnings', 'launch', 'discovery', 'report', 'policy',
+)
+# Zipf-like word frequencies, so queries range from very common to rare terms
+WEIGHTS = [1 / rank for rank in range(1, len(VOCABULARY) + 1)]
+
+
+class ExampleOfSearchBenchmarkCommand(BaseCommand):
+    help = 'Example of a command that compares full-text search latency with the ILIKE baseline (PostgreSQL)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1_000_000,
+            help='Seed synthetic articles until the table has this many rows (default: 1000000)'
+        )
+        parser.add_argument(
+            '--queries',
+            type=str,
+            default='market,housing school,policy,satelite',
+            help='Comma-separated search texts to time, from common to rare terms and a typo'
+        )
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per query, the median is reported')
+        parser.add_argument('--batch-size', type=int, default=5000, help='Articles inserted per seeding batch')
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            help='Keep the seeded articles for the next run instead of deleting them afterwards'
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The search benchmark needs PostgreSQL')
+
+        try:
+            self._seed(options['rows'], options['batch_size'])
+            self._run(options['queries'], options['repeat'])
+        finally:
+            # Seeded rows show up in the API and search, so they go unless asked to stay,
+            # including after a failed or interrupted run
+            if not options['keep']:
+                self._cleanup(options['batch_size'])
+
+    def _run(self, queries, repeat):
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {ExampleOfArticle._meta.db_table}')
+
+        articles = ExampleOfArticle.objects.all()
+        self.stdout.write(f"{'query':<24} {'ILIKE ms':>10} {'full-text ms':>13} {'fuzzy ms':>10}")
+        for text in (text.strip() for text in queries.split(',')):
+            # The admin's search: any column containing the text, newest first
+            ilike = articles.filter(
+                Q(title__icontains=text) | Q(description__icontains=text) | Q(content__icontains=text)
+            ).order_by('-published_date', '-id')
+            full_text = ExampleOfCachedListView.search_queryset(articles, text).order_by('-rank', '-id')
+            fuzzy = ExampleOfCachedListView.search_queryset(articles, text, fuzzy=True).order_by('-rank', '-id')
+            timings = [
+                self._median(
+                    repeat,
+                    lambda queryset=queryset: list(queryset.values_list('id', flat=True)[:20]),
+                )
+                for queryset in (ilike, full_text, fuzzy)
+            ]
+            self.stdout.write(f'{text:<24} {timings[0]:>10.2f} {timings[1]:>13.2f} {timings[2]:>10.2f}')
+
+    def _cleanup(self, batch_size):
+        # In batches: the delete signals load every deleted article
+        seeded = ExampleOfArticle.objects.filter(example_source=BENCHMARK_SOURCE)
+        deleted = 0
+        while ids := list(seeded.values_list('id', flat=True)[:batch_size]):
+            ExampleOfArticle.objects.filter(id__in=ids).delete()
+            deleted += len(ids)
+        self.stdout.write(f'Deleted {deleted} seeded articles')
+
+    def _seed(self, rows, batch_size):
+        missing = rows - ExampleOfArticle.objects.count()
+        if missing <= 0:
+            return
+        self.stdout.write(f'Seeding {missing} articles...')
+        rng = random.Random(rows)
+        start = ExampleOfArticle.objects.filter(example_source=BENCHMARK_SOURCE).count()
+        now = timezone.now()
+        for offset in range(0, missing, batch_size):
+            batch = []
+            for number in range(start + offset, start + min(offset + batch_size, missing)):
+                article = ExampleOfArticle(
+                    title=' '.join(rng.choices(VOCABULARY, WEIGHTS, k=rng.randint(5, 9))).capitalize(),
+                    description=' '.join(rng.choices(VOCABULARY, WEIGHTS, k=25)),
+                    content=' '.join(rng.choices(VOCABULARY, WEIGHTS, k=rng.randint(100, 300))),
+                    url=f'https://benchmark.example.com/articles/{number}',
+                    published_date=now - timedelta(minutes=number),
+                    source='Benchmark',
+                    example_source=BENCHMARK_SOURCE,
+                )
+                article.update_text_stats()
+                batch.append(article)
+            # The search vectors are filled in by the database trigger
+            ExampleOfArticle.objects.bulk_create(batch)
+            self.stdout.write(f'Seeded {offset + len(batch)} articles')
+        # bulk_create sends no signals, so the cached item responses are retired here
+        ExampleOfItemResponseCache.invalidate()
+
+    @staticmethod
+    def _median(repeat, run):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from example.models import ExampleOfArticle
+from example.models.example_of_article import TEXT_STATS_FIELDS
+from example.services import ExampleOfItemResponseCache
+
+
+class ExampleOfTextStatsCommand(BaseCommand):
+    help = 'Example of a command that backfills word count, character count and content hash on existing articles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Articles loaded and updated per chunk (default: 1000)'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Recompute every article, not only those without a content hash'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        queryset = ExampleOfArticle.objects.only('id', 'title', 'content').order_by('id')
+        if not options['all']:
+            queryset = queryset.filter(content_hash='')
+
+        updated = 0
+        last_id = 0
+        while True:
+            # Keyset pagination by id, so each chunk is an index range scan however far in we are
+            chunk = list(queryset.filter(id__gt=last_id)[:batch_size])
+            if not chunk:
+                break
+            updated_at = timezone.now()
+            for article in chunk:
+                article.update_text_stats()
+                article.updated_at = updated_at
+            ExampleOfArticle.objects.bulk_update(chunk, [*TEXT_STATS_FIELDS, 'updated_at'])
+            # The counts are part of the item responses
+            ExampleOfItemResponseCache.invalidate([article.pk for article in chunk])
+            updated += len(chunk)
+            last_id = chunk[-1].id
+            self.stdout.write(f'Updated {updated} articles (last id {last_id})')
+
+        self.stdout.write(self.style.SUCCESS(f'Text statistics backfilled for {updated} articles'))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from example.models import ExampleOfArticle
+from example.services import ExampleOfUrlBloomFilter
+
+
+class ExampleOfUrlBloomCommand(BaseCommand):
+    help = 'Example of a command that rebuilds the article URL Bloom filter from the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--capacity',
+            type=int,
+            help='Expected number of URLs (default: EXAMPLE_URL_BLOOM_CAPACITY)'
+        )
+        parser.add_argument(
+            '--error-rate',
+            type=float,
+            help='Target false-positive rate (default: EXAMPLE_URL_BLOOM_ERROR_RATE)'
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Drop the filter instead of rebuilding it, so ingest falls back to the database'
+        )
+
+    def handle(self, *args, **options):
+        bloom_filter = ExampleOfUrlBloomFilter(capacity=options['capacity'], error_rate=options['error_rate'])
+
+        if options['clear']:
+            bloom_filter.clear()
+            self.stdout.write(self.style.SUCCESS('URL Bloom filter cleared'))
+            return
+
+        self.stdout.write(
+            f'Building URL Bloom filter: {bloom_filter.num_bits} bits, {bloom_filter.num_hashes} hashes, '
+            f'capacity {bloom_filter.capacity}, error rate {bloom_filter.error_rate}'
+        )
+        urls = ExampleOfArticle.objects.values_list('url', flat=True).iterator(chunk_size=10000)
+        count = bloom_filter.rebuild(urls)
+
+        if count > bloom_filter.capacity:
+            self.stdout.write(self.style.WARNING(
+                f'{count} URLs exceed the configured capacity; raise --capacity to keep the error rate'
+            ))
+        self.stdout.write(self.style.SUCCESS(f'URL Bloom filter rebuilt with {count} URLs'))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('example', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='exampleoffetchlog',
+            name='raw_data_file',
+            field=models.CharField(blank=True, help_text='Raw-data archive location of the payload (segment:offset:length)', max_length=255),
+        ),
+    ]
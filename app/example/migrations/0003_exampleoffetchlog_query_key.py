@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('example', '0002_exampleoffetchlog_raw_data_archive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exampleoffetchlog',
+            name='query_key',
+            field=models.CharField(blank=True, help_text='Hash of the source and query parameters, used to find the previous high-water mark', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='exampleoffetchlog',
+            index=models.Index(fields=['query_key', 'status', '-started_at'], name='example_exa_query_k_6a5dde_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('example', '0003_exampleoffetchlog_query_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExampleOfSummaryCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(help_text='SHA-256 of the normalized title and content', max_length=64)),
+                ('processing_model', models.CharField(help_text='The processing model that produced the summary', max_length=50)),
+                ('max_words', models.IntegerField(help_text='The max_words requested for the summary')),
+                ('summary_text', models.TextField(help_text='The cached summary text')),
+                ('processing_cost', models.DecimalField(decimal_places=4, default=0, help_text='Cost originally paid for the summary, in credits', max_digits=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='When the summary was first cached')),
+            ],
+            options={
+                'verbose_name': 'Example Summary Cache Entry',
+                'verbose_name_plural': 'Example Summary Cache Entries',
+                'constraints': [models.UniqueConstraint(fields=('content_hash', 'processing_model', 'max_words'), name='example_summary_cache_entry_unique_key')],
+            },
+        ),
+    ]
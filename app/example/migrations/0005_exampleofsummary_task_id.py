@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('example', '0004_examplesummarycacheentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exampleofsummary',
+            name='queued_at',
+            field=models.DateTimeField(blank=True, help_text='When the current task was queued', null=True),
+        ),
+        migrations.AddField(
+            model_name='exampleofsummary',
+            name='task_id',
+            field=models.CharField(blank=True, help_text='Celery task currently responsible for processing', max_length=255, null=True),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('example', '0005_exampleofsummary_task_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exampleofarticle',
+            name='char_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of characters in the content, computed on save.'),
+        ),
+        migrations.AddField(
+            model_name='exampleofarticle',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='SHA-256 of the normalized title and content, computed on save.', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='exampleofarticle',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of words in the content, computed on save.'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('example', '0006_exampleofarticle_text_stats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExampleOfCostRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket_start', models.DateTimeField(help_text='Start of the hour the summaries completed in (UTC)')),
+                ('processing_model', models.CharField(help_text='The processing model used', max_length=50)),
+                ('summary_count', models.PositiveIntegerField(default=0, help_text='Summaries completed in the bucket')),
+                ('total_cost', models.DecimalField(decimal_places=4, default=0, help_text='Credits spent in the bucket', max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='When the bucket was last updated')),
+                ('requested_by', models.ForeignKey(blank=True, db_constraint=False, help_text='User who requested the processing', null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Example Cost Rollup',
+                'verbose_name_plural': 'Example Cost Rollups',
+                'ordering': ['-bucket_start', 'processing_model'],
+                'constraints': [models.UniqueConstraint(fields=('bucket_start', 'processing_model', 'requested_by'), name='example_cost_rollup_unique_bucket', nulls_distinct=False)],
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:59
+
+from django.db import migrations, models
+
+PUBLISHED_INDEX = models.Index(fields=['-published_date', '-id'], name='example_article_published_idx')
+
+
+def _add_index(apps, schema_editor):
+    model = apps.get_model('example', 'ExampleOfArticle')
+    # CREATE INDEX CONCURRENTLY builds the index without blocking writes to the articles
+    # table; it is PostgreSQL only, other databases get a plain CREATE INDEX
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.add_index(model, PUBLISHED_INDEX, concurrently=True)
+    else:
+        schema_editor.add_index(model, PUBLISHED_INDEX)
+
+
+def _remove_index(apps, schema_editor):
+    model = apps.get_model('example', 'ExampleOfArticle')
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.remove_index(model, PUBLISHED_INDEX, concurrently=True)
+    else:
+        schema_editor.remove_index(model, PUBLISHED_INDEX)
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run in a transaction
+    atomic = False
+
+    dependencies = [
+        ('example', '0007_examplecostrollup'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='exampleofarticle', index=PUBLISHED_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(_add_index, _remove_index),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('example', '0008_examplearticle_published_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exampleofarticle',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, help_text='The date and time when the item was last written.'),
+        ),
+    ]
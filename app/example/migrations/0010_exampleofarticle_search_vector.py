@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:10
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# The content is capped so no article can exceed the 1MB tsvector limit. Existing rows are
+# filled in batches by example_of_search_vector_command and the GIN indexes are built
+# concurrently by 0011, so this migration never rewrites or locks the whole table.
+CREATE_SEARCH_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION example_article_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.description, '')), 'B') ||
+            setweight(to_tsvector('english', left(coalesce(NEW.content, ''), 200000)), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER example_article_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description, content ON example_exampleofarticle
+    FOR EACH ROW EXECUTE FUNCTION example_article_search_vector_update()
+    """,
+]
+
+# Serves the fuzzy title matches; created here rather than with TrigramExtension, whose
+# reverse queries pg_extension on every database
+CREATE_TRIGRAM_SQL = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]
+DROP_TRIGRAM_SQL = ["DROP EXTENSION IF EXISTS pg_trgm"]
+
+DROP_SEARCH_SQL = [
+    "DROP TRIGGER IF EXISTS example_article_search_vector_trigger ON example_exampleofarticle",
+    "DROP FUNCTION IF EXISTS example_article_search_vector_update()",
+]
+
+
+def _run_on_postgresql(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('example', '0009_exampleofarticle_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(_run_on_postgresql(CREATE_TRIGRAM_SQL), _run_on_postgresql(DROP_TRIGRAM_SQL)),
+        migrations.AddField(
+            model_name='exampleofarticle',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Weighted full-text vector of the title (A), description (B) and content (C).', null=True),
+        ),
+        migrations.RunPython(_run_on_postgresql(CREATE_SEARCH_SQL), _run_on_postgresql(DROP_SEARCH_SQL)),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-16 23:29
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import migrations
+
+SEARCH_INDEXES = [
+    GinIndex(fields=['search_vector'], name='example_article_search_idx'),
+    GinIndex(OpClass('title', name='gin_trgm_ops'), name='example_article_title_trgm_idx'),
+]
+
+
+def _on_postgresql(method):
+    # GIN indexes exist on PostgreSQL only, like the trigger of 0010; CREATE INDEX
+    # CONCURRENTLY builds them without blocking writes to the articles table
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        model = apps.get_model('example', 'ExampleOfArticle')
+        for index in SEARCH_INDEXES:
+            getattr(schema_editor, method)(model, index, concurrently=True)
+    return run
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run in a transaction
+    atomic = False
+
+    dependencies = [
+        ('example', '0010_exampleofarticle_search_vector'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='exampleofarticle', index=index) for index in SEARCH_INDEXES
+            ],
+            database_operations=[
+                migrations.RunPython(_on_postgresql('add_index'), _on_postgresql('remove_index')),
+            ],
+        ),
+    ]
@@ -2,9 +2,13 @@
 from .example_of_article import ExampleOfArticle
 from .example_of_fetch_log import ExampleOfFetchLog
 from .example_of_summary import ExampleOfSummary
+from .example_of_summary_cache_entry import ExampleOfSummaryCacheEntry
+from .example_of_cost_rollup import ExampleOfCostRollup
 
 __all__ = [
     'ExampleOfArticle',
     'ExampleOfFetchLog', 
     'ExampleOfSummary',
+    'ExampleOfSummaryCacheEntry',
+    'ExampleOfCostRollup',
 ] 
\ No newline at end of file
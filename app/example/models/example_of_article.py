@@ -1,6 +1,25 @@
+import hashlib
+import json
+import unicodedata
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.utils import timezone
 from django.db import models
 
+# Columns derived from title/content, kept in sync by update_text_stats()
+TEXT_STATS_FIELDS = ('word_count', 'char_count', 'content_hash')
+# Text search configuration of search_vector; must match the trigger in migration 0010
+SEARCH_CONFIG = 'english'
+
+
+class ExampleOfArticleManager(models.Manager):
+    """Leaves the search vector out of ordinary reads; filters on it still work."""
+
+    def get_queryset(self):
+        return super().get_queryset().defer('search_vector')
+
+
 class ExampleOfArticle(models.Model):
     """ Example of a basic model with relationships and common fields. """
     title = models.CharField(max_length=255, help_text="The title of the example item.")
@@ -10,14 +29,76 @@ class ExampleOfArticle(models.Model):
     author = models.CharField(max_length=100, blank=True, null=True, help_text="The author of the example item.")
     source = models.CharField(max_length=100, help_text="The source of the example item.")
     image_url = models.URLField(blank=True, null=True, help_text="An optional image URL for the example item.")
-    description = models.TextField(blank=True, null=True, help_text="A brief description or summary of the example item.")
+    description = models.TextField(
+        blank=True,
+        null=True,
+        help_text="A brief description or summary of the example item."
+    )
     example_source = models.CharField(max_length=100, help_text="The example source of the item.")
     created_at = models.DateTimeField(auto_now_add=True, help_text="The date and time when the item was created.")
+    updated_at = models.DateTimeField(auto_now=True, help_text="The date and time when the item was last written.")
+    word_count = models.PositiveIntegerField(default=0, help_text="Number of words in the content, computed on save.")
+    char_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of characters in the content, computed on save."
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        db_index=True,
+        help_text="SHA-256 of the normalized title and content, computed on save."
+    )
+    # Written by a database trigger on every insert and on updates of the text columns, so
+    # bulk_create, bulk_update and queryset updates keep it current too (PostgreSQL only)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Weighted full-text vector of the title (A), description (B) and content (C)."
+    )
+
+    objects = ExampleOfArticleManager()
 
     def __str__(self):
         return self.title
 
+    @staticmethod
+    def compute_content_hash(title: str, content: str) -> str:
+        """Hash of the title and content with Unicode and whitespace differences normalized away."""
+        normalized = [
+            ' '.join(unicodedata.normalize('NFKC', text or '').split())
+            for text in (title, content)
+        ]
+        return hashlib.sha256(json.dumps(normalized, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def update_text_stats(self) -> None:
+        """Derive word count, character count and content hash from the current title and content."""
+        content = self.content or ''
+        self.word_count = len(content.split())
+        self.char_count = len(content)
+        self.content_hash = self.compute_content_hash(self.title, content)
+
+    def save(self, *args, **kwargs):
+        # bulk_create/bulk_update skip save(); those paths call update_text_stats() themselves
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.update_text_stats()
+        else:
+            # updated_at is the row version used by conditional GETs, so every write moves it
+            update_fields = {*update_fields, 'updated_at'}
+            if {'title', 'content'} & update_fields:
+                self.update_text_stats()
+                update_fields.update(TEXT_STATS_FIELDS)
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+
     class Meta:
         ordering = ['-published_date']
         verbose_name = "Example Article"
-        verbose_name_plural = "Example Articles" 
\ No newline at end of file
+        verbose_name_plural = "Example Articles"
+        indexes = [
+            # Serves the newest-first list and its keyset pagination (see core.pagination)
+            models.Index(fields=['-published_date', '-id'], name='example_article_published_idx'),
+            # Serve the search endpoint: full-text matches, and fuzzy title matches (title % 'query')
+            GinIndex(fields=['search_vector'], name='example_article_search_idx'),
+            GinIndex(OpClass('title', name='gin_trgm_ops'), name='example_article_title_trgm_idx'),
+        ]
@@ -0,0 +1,55 @@
+"""Example of a pre-aggregated table of processing costs."""
+from django.conf import settings
+from django.db import models
+
+
+class ExampleOfCostRollup(models.Model):
+    """Example of hourly processing cost totals per model and requesting user."""
+
+    bucket_start = models.DateTimeField(
+        help_text="Start of the hour the summaries completed in (UTC)"
+    )
+    processing_model = models.CharField(
+        max_length=50,
+        help_text="The processing model used"
+    )
+    # No database constraint, so deleting a user keeps their spend history
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        blank=True,
+        null=True,
+        related_name='+',
+        help_text="User who requested the processing"
+    )
+    summary_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Summaries completed in the bucket"
+    )
+    total_cost = models.DecimalField(
+        max_digits=14,
+        decimal_places=4,
+        default=0,
+        help_text="Credits spent in the bucket"
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="When the bucket was last updated"
+    )
+
+    def __str__(self):
+        return f"{self.bucket_start:%Y-%m-%d %H:00} {self.processing_model}: {self.total_cost}"
+
+    class Meta:
+        ordering = ['-bucket_start', 'processing_model']
+        verbose_name = "Example Cost Rollup"
+        verbose_name_plural = "Example Cost Rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['bucket_start', 'processing_model', 'requested_by'],
+                name='example_cost_rollup_unique_bucket',
+                # Anonymous requests share one bucket
+                nulls_distinct=False,
+            ),
+        ]
@@ -49,6 +49,11 @@ class ExampleOfFetchLog(models.Model):
         default=dict,
         help_text="Parameters used for the operation"
     )
+    query_key = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="Hash of the source and query parameters, used to find the previous high-water mark"
+    )
     metadata = models.JSONField(
         default=dict,
         help_text="Additional metadata about the operation"
@@ -56,13 +61,14 @@ class ExampleOfFetchLog(models.Model):
     raw_data_file = models.CharField(
         max_length=255,
         blank=True,
-        help_text="Path to the raw JSON data file"
+        help_text="Raw-data archive location of the payload (segment:offset:length)"
     )
 
     class Meta:
         ordering = ['-started_at']
         indexes = [
             models.Index(fields=['status', '-started_at']),
+            models.Index(fields=['query_key', 'status', '-started_at']),
         ]
         verbose_name = "Example Fetch Log"
         verbose_name_plural = "Example Fetch Logs"
@@ -75,8 +81,11 @@ class ExampleOfFetchLog(models.Model):
         self.status = status
         self.completed_at = timezone.now()
 
+        update_fields = ['status', 'completed_at']
         for key, value in kwargs.items():
             if hasattr(self, key):
                 setattr(self, key, value)
+                update_fields.append(key)
 
-        self.save() 
\ No newline at end of file
+        # Only rewrite the columns that changed, not both JSON fields every time
+        self.save(update_fields=update_fields) 
\ No newline at end of file
@@ -69,6 +69,19 @@ class ExampleOfSummary(models.Model):
         help_text="When the processing was completed"
     )
 
+    task_id = models.CharField(
+        max_length=255,
+        blank=True,
+        null=True,
+        help_text="Celery task currently responsible for processing"
+    )
+
+    queued_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="When the current task was queued"
+    )
+
     # Optional: Track who requested the processing
     requested_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
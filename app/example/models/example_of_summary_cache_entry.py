@@ -0,0 +1,44 @@
+"""Example of a durable content-addressed cache entry for generated summaries."""
+from django.db import models
+
+
+class ExampleOfSummaryCacheEntry(models.Model):
+    """Example of a summary stored by content hash, so identical articles share one model call."""
+
+    content_hash = models.CharField(
+        max_length=64,
+        help_text="SHA-256 of the normalized title and content"
+    )
+    processing_model = models.CharField(
+        max_length=50,
+        help_text="The processing model that produced the summary"
+    )
+    max_words = models.IntegerField(
+        help_text="The max_words requested for the summary"
+    )
+    summary_text = models.TextField(
+        help_text="The cached summary text"
+    )
+    processing_cost = models.DecimalField(
+        max_digits=10,
+        decimal_places=4,
+        default=0,
+        help_text="Cost originally paid for the summary, in credits"
+    )
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="When the summary was first cached"
+    )
+
+    def __str__(self):
+        return f"{self.processing_model}/{self.max_words}: {self.content_hash[:12]}"
+
+    class Meta:
+        verbose_name = "Example Summary Cache Entry"
+        verbose_name_plural = "Example Summary Cache Entries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content_hash', 'processing_model', 'max_words'],
+                name='example_summary_cache_entry_unique_key',
+            ),
+        ]
@@ -1,9 +1,11 @@
 # Example serializers package
+from .example_of_sparse_fields import ExampleOfSparseFieldsMixin
 from .example_of_custom_validation import ExampleOfCustomValidationSerializer
 from .example_of_readonly_serializer import ExampleOfReadonlySerializer
 from .example_of_model_serializer import ExampleOfModelSerializer
 
 __all__ = [
+    'ExampleOfSparseFieldsMixin',
     'ExampleOfCustomValidationSerializer',
     'ExampleOfReadonlySerializer',
     'ExampleOfModelSerializer',
@@ -1,9 +1,10 @@
 from rest_framework import serializers
 from django.utils import timezone
 from example.models import ExampleOfArticle
+from example.serializers.example_of_sparse_fields import ExampleOfSparseFieldsMixin
 
-class ExampleOfCustomValidationSerializer(serializers.ModelSerializer):
-    """Example of a serializer with custom validation logic."""
+class ExampleOfCustomValidationSerializer(ExampleOfSparseFieldsMixin, serializers.ModelSerializer):
+    """Example of a serializer with custom validation logic and optional sparse fieldsets."""
     
     def validate_published_date(self, value):
         """
@@ -23,5 +24,9 @@ class ExampleOfCustomValidationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ExampleOfArticle
-        fields = ['id', 'title', 'content', 'url', 'published_date', 'author', 'source', 'image_url', 'description', 'example_source', 'created_at']
-        read_only_fields = ['id', 'created_at'] 
\ No newline at end of file
+        fields = [
+            'id', 'title', 'content', 'url', 'published_date', 'author', 'source', 'image_url', 'description',
+            'example_source', 'word_count', 'char_count', 'created_at',
+        ]
+        # Computed from the content on save
+        read_only_fields = ['id', 'word_count', 'char_count', 'created_at'] 
\ No newline at end of file
@@ -10,6 +10,6 @@ class ExampleOfModelSerializer(serializers.ModelSerializer):
         model = ExampleOfSummary
         fields = [
             'id', 'processing_model', 'status', 'summary_text', 'word_count', 'processing_cost',
-            'created_at', 'completed_at', 'error_message'
+            'created_at', 'completed_at', 'error_message', 'task_id'
         ]
         read_only_fields = fields 
\ No newline at end of file
@@ -0,0 +1,15 @@
+"""Example of a serializer mixin for sparse fieldsets."""
+
+
+class ExampleOfSparseFieldsMixin:
+    """
+    Example of a serializer mixin that takes a `fields` argument and serializes only
+    those fields. The view that passes it is responsible for loading only the matching
+    columns, so the trimmed fields are neither read nor rendered.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
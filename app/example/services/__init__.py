@@ -1,10 +1,33 @@
 # Example services package
 from .example_of_external_api_service import ExampleOfExternalApiService, ExampleServiceError, ConfigurationError
+from .example_of_cost_rollup_recorder import ExampleOfCostRollupRecorder
 from .example_of_ai_service import ExampleOfAiService
+from .example_of_paginated_fetcher import ExampleOfPaginatedFetcher
+from .example_of_raw_data_archive import ExampleOfRawDataArchive
+from .example_of_fetch_log_recorder import ExampleOfFetchLogRecorder
+from .example_of_url_bloom_filter import ExampleOfUrlBloomFilter
+from .example_of_rate_limiter import ExampleOfTokenBucketLimiter
+from .example_of_summary_cache import ExampleOfSummaryCache
+from .example_of_item_summaries_cache import ExampleOfItemSummariesCache
+from .example_of_item_response_cache import ExampleOfItemResponseCache
+from .example_of_status_channel import ExampleOfStatusChannel
+from .example_of_ai_client_registry import ExampleOfAiClient, ExampleOfAiClientRegistry
 
 __all__ = [
     'ExampleOfExternalApiService',
     'ExampleServiceError',
     'ConfigurationError',
     'ExampleOfAiService',
+    'ExampleOfPaginatedFetcher',
+    'ExampleOfRawDataArchive',
+    'ExampleOfFetchLogRecorder',
+    'ExampleOfUrlBloomFilter',
+    'ExampleOfTokenBucketLimiter',
+    'ExampleOfSummaryCache',
+    'ExampleOfItemSummariesCache',
+    'ExampleOfItemResponseCache',
+    'ExampleOfStatusChannel',
+    'ExampleOfAiClient',
+    'ExampleOfAiClientRegistry',
+    'ExampleOfCostRollupRecorder',
 ] 
\ No newline at end of file
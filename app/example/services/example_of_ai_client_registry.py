@@ -0,0 +1,149 @@
+"""Example of a per-process registry of pooled AI clients with concurrency limits and latency histograms."""
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+import httpx
+from django.conf import settings
+from django.core.cache import cache
+
+from .example_of_redis_client import get_redis_client
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_clients: Dict[str, 'ExampleOfAiClient'] = {}
+_clients_pid: Optional[int] = None
+_clients_lock = threading.Lock()
+
+
+class ExampleOfAiClient:
+    """
+    Example of a long-lived AI client for one model.
+
+    Holds a pooled httpx.Client, so keep-alive connections are reused across summaries,
+    and a semaphore capping the calls in flight from this process. The semaphore is per
+    process: under the prefork worker it bounds the map-reduce threads of one worker
+    process, and the model as a whole sees up to `max_concurrency` calls per process.
+    Every call made through `call()` is timed into a per-model latency histogram kept in
+    the cache, so the numbers from all workers add up.
+    """
+
+    def __init__(self, model: str, api_key: str, batch_size: int = 1, max_concurrency: int = None,
+                 temperature: float = 0.3):
+        self.model = model
+        self.api_key = api_key
+        self.batch_size = batch_size
+        self.temperature = temperature
+        self.max_concurrency = max_concurrency or settings.EXAMPLE_AI_MAX_CONCURRENCY
+        self.semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self.http = httpx.Client(
+            base_url=settings.EXAMPLE_AI_BASE_URL,
+            headers={'Authorization': f'Bearer {api_key}'},
+            timeout=settings.EXAMPLE_AI_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+
+    @staticmethod
+    def _stats_key(model: str, name: str) -> str:
+        return f'example:ai-latency:{model}:{name}'
+
+    @contextmanager
+    def call(self) -> Iterator['ExampleOfAiClient']:
+        """Wrap one model call: wait for a slot, then time the call into the histogram."""
+        with self.semaphore:
+            started = time.perf_counter()
+            try:
+                yield self
+            finally:
+                self.record_latency(time.perf_counter() - started)
+
+    def record_latency(self, seconds: float) -> None:
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        bucket_name = f'le_{LATENCY_BUCKETS[bucket]}' if bucket < len(LATENCY_BUCKETS) else 'le_inf'
+        increments = {'count': 1, bucket_name: 1, 'sum_ms': int(seconds * 1000)}
+
+        redis = get_redis_client()
+        if redis is not None:
+            # One round trip on the hot path; INCRBY starts a missing counter at 0 and
+            # the counters never expire
+            pipeline = redis.pipeline(transaction=False)
+            for name, amount in increments.items():
+                pipeline.incrby(cache.make_key(self._stats_key(self.model, name)), amount)
+            pipeline.execute()
+            return
+
+        for name, amount in increments.items():
+            key = self._stats_key(self.model, name)
+            try:
+                cache.incr(key, amount)
+            except ValueError:
+                # First observation: create the counter, unless another worker just did
+                if not cache.add(key, amount, timeout=None):
+                    cache.incr(key, amount)
+
+    @classmethod
+    def latency_histogram(cls, model: str) -> Dict[str, object]:
+        """Cumulative histogram for a model across all workers, in the Prometheus style."""
+        names = ['count', 'sum_ms'] + [f'le_{bound}' for bound in LATENCY_BUCKETS] + ['le_inf']
+        values = cache.get_many([cls._stats_key(model, name) for name in names])
+        counts = {name: values.get(cls._stats_key(model, name), 0) for name in names}
+
+        buckets = {}
+        running = 0
+        for bound in LATENCY_BUCKETS:
+            running += counts[f'le_{bound}']
+            buckets[str(bound)] = running
+        buckets['+Inf'] = running + counts['le_inf']
+        return {
+            'count': counts['count'],
+            'mean_seconds': counts['sum_ms'] / 1000 / counts['count'] if counts['count'] else 0.0,
+            'buckets': buckets,
+        }
+
+    @classmethod
+    def reset_latency(cls, model: str) -> None:
+        names = ['count', 'sum_ms'] + [f'le_{bound}' for bound in LATENCY_BUCKETS] + ['le_inf']
+        cache.delete_many([cls._stats_key(model, name) for name in names])
+
+    def close(self) -> None:
+        self.http.close()
+
+
+class ExampleOfAiClientRegistry:
+    """Example of a per-process registry holding one ExampleOfAiClient per model."""
+
+    @staticmethod
+    def get(model: str, api_key: str, batch_size: int = 1) -> ExampleOfAiClient:
+        """Return this process's client for a model, creating it on first use and after a fork."""
+        global _clients_pid
+
+        with _clients_lock:
+            if _clients_pid != os.getpid():
+                # Pooled connections must not be shared with the parent process
+                _clients.clear()
+                _clients_pid = os.getpid()
+            client = _clients.get(model)
+            if client is None:
+                client = ExampleOfAiClient(model, api_key, batch_size=batch_size)
+                _clients[model] = client
+            return client
+
+    @classmethod
+    def warm(cls, models: Dict[str, int], api_key: str) -> List[ExampleOfAiClient]:
+        """Create the clients for {model: batch_size} ahead of the first task."""
+        return [cls.get(model, api_key, batch_size) for model, batch_size in models.items()]
+
+    @staticmethod
+    def clear() -> None:
+        """Close and forget every client in this process."""
+        with _clients_lock:
+            for client in _clients.values():
+                client.close()
+            _clients.clear()
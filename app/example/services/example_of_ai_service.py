@@ -1,10 +1,20 @@
 import logging
 import os
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from celery.utils import uuid
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 
+from core.celery import SUMMARY_DEFAULT_PRIORITY, SUMMARY_PRIORITIES
 from example.models import ExampleOfSummary, ExampleOfArticle
+from .example_of_summary_cache import ExampleOfSummaryCache
+from .example_of_item_summaries_cache import ExampleOfItemSummariesCache
+from .example_of_cost_rollup_recorder import ExampleOfCostRollupRecorder
+from .example_of_ai_client_registry import ExampleOfAiClient, ExampleOfAiClientRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -20,21 +30,35 @@ class ExampleOfAiService:
             "example-model-lite": "example-model-lite",
         }
         self.default_model = "example-model-v1"
+        # Items per model request for backends with a batch endpoint; 1 means one call per item
+        self.model_batch_sizes = {
+            "example-model-v1": 20,
+            "example-model-v2": 20,
+            "example-model-pro": 1,
+            "example-model-lite": 50,
+        }
         self.ai_api_key = os.environ.get("EXAMPLE_AI_API_KEY", "example-ai-key")
+        self.summary_cache = ExampleOfSummaryCache() if settings.EXAMPLE_SUMMARY_CACHE_ENABLED else None
+        # Partial summaries of long articles, keyed by chunk hash so edits only redo the chunks they touch
+        self.chunk_cache = ExampleOfSummaryCache(
+            use_db=False, key_prefix='example:summary-chunk-cache', record_stats=False
+        ) if settings.EXAMPLE_SUMMARY_CACHE_ENABLED else None
+        self.cost_rollup = ExampleOfCostRollupRecorder()
 
         if not self.ai_api_key:
             raise ValueError("EXAMPLE_AI_API_KEY must be set in Django settings")
 
-    def _get_ai_client(self, model_name: str = None):
-        """Example of getting an AI client for processing."""
+    def _get_ai_client(self, model_name: str = None) -> ExampleOfAiClient:
+        """Example of getting the pooled, per-process AI client for a model."""
         model = self.model_map.get(model_name, self.default_model)
-        # In real implementation, this would return an actual AI client
-        # For example purposes, we'll return a mock client
-        return {
-            'model': model,
-            'api_key': self.ai_api_key,
-            'temperature': 0.3,
-        }
+        return ExampleOfAiClientRegistry.get(model, self.ai_api_key, self.model_batch_sizes.get(model, 1))
+
+    def warm_clients(self) -> None:
+        """Create the pooled client for every model, e.g. when a worker process starts."""
+        ExampleOfAiClientRegistry.warm(
+            {model: self.model_batch_sizes.get(model, 1) for model in set(self.model_map.values())},
+            self.ai_api_key,
+        )
 
     def process_item(
         self,
@@ -66,14 +90,25 @@ class ExampleOfAiService:
                 defaults={"status": "pending", "requested_by": user},
             )
 
-            # Generate summary using AI service
-            summary_text, processing_cost = self._generate_summary(
-                title=item.title,
-                content=item.content,
-                processing_model=model_key,
-                max_words=max_words,
-            )
-            logger.info(f"Processing item {item_id} with model {model_key}")
+            # Reuse a summary generated for identical content, if any
+            cached = None
+            if self.summary_cache is not None:
+                cached = self.summary_cache.get(self._content_hash(item), model_key, max_words)
+
+            if cached:
+                summary_text, processing_cost = cached[0], 0
+                logger.info(f"Summary cache hit for item {item_id} with model {model_key}")
+            else:
+                # Generate summary using AI service
+                summary_text, processing_cost = self._generate_summary(
+                    title=item.title,
+                    content=item.content,
+                    processing_model=model_key,
+                    max_words=max_words,
+                    word_count=self._word_count(item),
+                )
+                logger.info(f"Processing item {item_id} with model {model_key}")
+                self._cache_summaries([(self._content_hash(item), summary_text, processing_cost)], model_key, max_words)
 
             # Save result
             summary.summary_text = summary_text
@@ -82,6 +117,7 @@ class ExampleOfAiService:
             summary.status = "completed"
             summary.completed_at = timezone.now()
             summary.save()
+            self._record_costs([summary])
             return summary
 
         except ExampleOfArticle.DoesNotExist:
@@ -101,25 +137,387 @@ class ExampleOfAiService:
         content: str,
         processing_model: str,
         max_words: int,
+        word_count: int = None,
     ) -> tuple[str, float]:
-        """Example of AI/ML processing for summarization."""
+        """
+        Example of AI/ML processing for summarization.
+        Content longer than EXAMPLE_AI_CHUNK_WORDS goes through `_generate_map_reduce_summary`;
+        everything else is a single model call.
+        """
+        # Simulate processing cost (in credits), from the stored word count when the caller has it
+        if word_count is None:
+            word_count = len(content.split())
+        if self._needs_chunking(word_count):
+            return self._generate_map_reduce_summary(title, content, processing_model, max_words)
+        return self._summarize_text(title, word_count, processing_model, max_words)
+
+    def _summarize_text(self, title: str, word_count: int, processing_model: str, max_words: int) -> Tuple[str, float]:
+        """Single model call summarizing text that fits in the model context."""
         ai_client = self._get_ai_client(processing_model)
-        
-        # Simulate AI processing for example purposes
-        # In real implementation, this would call an actual AI service
-        summary_text = f"This is an example summary of '{title}' with approximately {max_words} words. The content has been processed using {processing_model}."
-        
-        # Simulate processing cost (in credits)
-        processing_cost = 0.001 * len(content.split())  # 0.001 credits per word
+
+        with ai_client.call():
+            # Simulate AI processing for example purposes
+            # In real implementation, this would call the AI service through ai_client.http
+            summary_text = (
+                f"This is an example summary of '{title}' with approximately {max_words} words. "
+                f"The content has been processed using {processing_model}."
+            )
+
+        processing_cost = 0.001 * word_count  # 0.001 credits per word
 
         return summary_text.strip(), processing_cost
 
-    def process_item_async(self, item_id: int, processing_model: str = None, user=None, max_words: int = 150) -> ExampleOfSummary:
+    @staticmethod
+    def _needs_chunking(word_count: int) -> bool:
+        return word_count > settings.EXAMPLE_AI_CHUNK_WORDS
+
+    @staticmethod
+    def _split_into_chunks(content: str) -> List[str]:
+        """Split content into chunks of EXAMPLE_AI_CHUNK_WORDS words, overlapping by EXAMPLE_AI_CHUNK_OVERLAP_WORDS."""
+        words = content.split()
+        size = settings.EXAMPLE_AI_CHUNK_WORDS
+        step = max(1, size - settings.EXAMPLE_AI_CHUNK_OVERLAP_WORDS)
+        chunks = []
+        for start in range(0, len(words), step):
+            chunks.append(' '.join(words[start:start + size]))
+            if start + size >= len(words):
+                break
+        return chunks
+
+    def _summarize_chunk(self, title: str, chunk: str, index: int, count: int, processing_model: str,
+                         max_words: int) -> Tuple[str, float]:
+        """Map step: summarize one chunk of a long article."""
+        ai_client = self._get_ai_client(processing_model)
+
+        with ai_client.call():
+            # Simulate AI processing for example purposes
+            # In real implementation, this would call the AI service through ai_client.http
+            summary_text = (
+                f"Part {index + 1} of {count} of '{title}' summarized in about {max_words} words "
+                f"using {processing_model}."
+            )
+        return summary_text, 0.001 * len(chunk.split())
+
+    def _generate_map_reduce_summary(self, title: str, content: str, processing_model: str,
+                                     max_words: int) -> Tuple[str, float]:
+        """
+        Summarize a long article in two steps: summarize overlapping chunks concurrently (map),
+        then summarize the partial summaries into one of max_words words (reduce).
+        Partial summaries are cached per chunk, so cached chunks cost nothing.
+        """
+        chunks = self._split_into_chunks(content)
+        hashes = [ExampleOfSummaryCache.content_hash(title, chunk) for chunk in chunks]
+        partials = (
+            self.chunk_cache.get_many(hashes, processing_model, max_words)
+            if self.chunk_cache is not None else [None] * len(chunks)
+        )
+
+        missing = [index for index, partial in enumerate(partials) if partial is None]
+        if missing:
+            # Calls beyond the client's concurrency cap wait on its semaphore
+            with ThreadPoolExecutor(max_workers=min(settings.EXAMPLE_AI_CHUNK_WORKERS, len(missing))) as executor:
+                results = list(executor.map(
+                    lambda index: self._summarize_chunk(
+                        title, chunks[index], index, len(chunks), processing_model, max_words
+                    ),
+                    missing,
+                ))
+            for index, result in zip(missing, results):
+                partials[index] = result
+            if self.chunk_cache is not None:
+                self.chunk_cache.set_many(
+                    [(hashes[index], text, cost) for index, (text, cost) in zip(missing, results)],
+                    processing_model, max_words,
+                )
+        logger.info(f"Summarized {len(chunks)} chunks of '{title}' ({len(missing)} not cached) with {processing_model}")
+
+        map_cost = sum(float(partials[index][1]) for index in missing)
+        reduce_input = '\n\n'.join(text for text, _ in partials)
+        summary_text, reduce_cost = self._summarize_text(
+            title, len(reduce_input.split()), processing_model, max_words
+        )
+        return summary_text, map_cost + reduce_cost
+
+    def _generate_summaries(
+        self,
+        items: List[ExampleOfArticle],
+        processing_model: str,
+        max_words: int,
+    ) -> List[Tuple[str, float]]:
+        """
+        Example of batched AI/ML summarization: one model request for the whole list.
+        Only called with batches no larger than the client's `batch_size`.
+        """
+        if len(items) == 1:
+            item = items[0]
+            return [
+                self._generate_summary(item.title, item.content, processing_model, max_words, self._word_count(item))
+            ]
+
+        # Long articles do not fit in a batched request; summarize them one by one with map-reduce
+        chunked = [index for index, item in enumerate(items) if self._needs_chunking(self._word_count(item))]
+        if chunked:
+            results: List[Optional[Tuple[str, float]]] = [None] * len(items)
+            for index in chunked:
+                item = items[index]
+                results[index] = self._generate_summary(
+                    item.title, item.content, processing_model, max_words, self._word_count(item)
+                )
+            rest = [index for index in range(len(items)) if results[index] is None]
+            if rest:
+                summaries = self._generate_summaries([items[i] for i in rest], processing_model, max_words)
+                for index, result in zip(rest, summaries):
+                    results[index] = result
+            return results
+
+        ai_client = self._get_ai_client(processing_model)
+
+        with ai_client.call():
+            # Simulate a batch request for example purposes
+            # In real implementation, this would send all prompts in a single API call through ai_client.http
+            return [
+                (
+                    f"This is an example summary of '{item.title}' with approximately {max_words} words. "
+                    f"The content has been processed using {processing_model}.",
+                    0.001 * self._word_count(item),
+                )
+                for item in items
+            ]
+
+    def process_items(
+        self,
+        item_ids: Iterable[int],
+        processing_model: str = None,
+        user=None,
+        max_words: int = 150,
+    ) -> Dict[int, ExampleOfSummary]:
+        """
+        Process many items at once.
+
+        Articles and existing summaries are loaded with one query each, completed summaries
+        are skipped, identical content is looked up in the summary cache and summarized
+        once, the model is called in batches of the client's `batch_size`, and each batch
+        of results is written with a single bulk_update. Returns summaries keyed by item id;
+        ids without an article are left out.
+        """
+        model_key = processing_model or self.default_model
+        item_ids = list(dict.fromkeys(item_ids))
+
+        items = ExampleOfArticle.objects.only('id', 'title', 'content', 'word_count', 'content_hash').in_bulk(item_ids)
+        summaries = {
+            summary.example_item_id: summary
+            for summary in ExampleOfSummary.objects.filter(example_item_id__in=list(items), processing_model=model_key)
+        }
+        self._create_missing_summaries(items, summaries, model_key, user)
+
+        pending = [
+            items[item_id] for item_id in item_ids
+            if item_id in items and summaries[item_id].status != "completed"
+        ]
+        update_fields = ['summary_text', 'processing_cost', 'word_count', 'status', 'completed_at', 'error_message']
+
+        # Syndicated copies share one lookup and one model call: group pending items by content hash
+        groups: Dict[str, List[ExampleOfArticle]] = {}
+        for item in pending:
+            groups.setdefault(self._content_hash(item), []).append(item)
+        group_list = list(groups.values())
+        if self.summary_cache is not None and group_list:
+            cached = self.summary_cache.get_many(
+                [self._content_hash(group[0]) for group in group_list], model_key, max_words
+            )
+        else:
+            cached = [None] * len(group_list)
+
+        completed_at = timezone.now()
+        cached_summaries = []
+        for group, result in zip(group_list, cached):
+            if result is not None:
+                for item in group:
+                    # Nothing was paid for a cached summary
+                    self._complete_summary(summaries[item.id], result[0], 0, completed_at)
+                    cached_summaries.append(summaries[item.id])
+        if cached_summaries:
+            ExampleOfSummary.objects.bulk_update(cached_summaries, update_fields)
+
+        uncached = [group for group, result in zip(group_list, cached) if result is None]
+        batch_size = self._get_ai_client(model_key).batch_size
+        for start in range(0, len(uncached), batch_size):
+            batch_groups = uncached[start:start + batch_size]
+            batch = [group[0] for group in batch_groups]
+            batch_summaries = [summaries[item.id] for group in batch_groups for item in group]
+            try:
+                results = self._generate_summaries(batch, model_key, max_words)
+                completed_at = timezone.now()
+                for group, (summary_text, processing_cost) in zip(batch_groups, results):
+                    # The first copy carries the cost, the others reused its summary
+                    for index, item in enumerate(group):
+                        self._complete_summary(
+                            summaries[item.id], summary_text, processing_cost if index == 0 else 0, completed_at
+                        )
+                self._cache_summaries(
+                    [(self._content_hash(item), summary_text, processing_cost)
+                     for item, (summary_text, processing_cost) in zip(batch, results)],
+                    model_key,
+                    max_words,
+                )
+            except Exception as e:
+                logger.error(f"Error processing batch of {len(batch)} item(s) with model {model_key}: {e}")
+                for summary in batch_summaries:
+                    summary.status = "failed"
+                    summary.error_message = str(e)
+            ExampleOfSummary.objects.bulk_update(batch_summaries, update_fields)
+
+        ExampleOfItemSummariesCache.invalidate(item.id for item in pending)
+        # One rollup update per hourly bucket touched, for the whole call
+        self._record_costs([summaries[item.id] for item in pending])
+        logger.info(f"Processed {len(pending)} of {len(items)} item(s) with model {model_key}")
+        return {item_id: summaries[item_id] for item_id in item_ids if item_id in items}
+
+    def _cache_summaries(self, entries: List[tuple], model_key: str, max_words: int) -> None:
+        """Store generated summaries for reuse; a failure here must not fail the paid-for summaries."""
+        if self.summary_cache is None:
+            return
+        try:
+            self.summary_cache.set_many(entries, model_key, max_words)
+        except Exception as e:
+            logger.error(f"Error caching {len(entries)} summaries for model {model_key}: {e}")
+
+    def _record_costs(self, summaries: List[ExampleOfSummary]) -> None:
+        """Add completed summaries to the cost rollups; a failure here must not fail the summaries."""
+        try:
+            self.cost_rollup.record(summaries)
+        except Exception as e:
+            logger.error(f"Error recording costs for {len(summaries)} summaries, rebuild the rollups to repair: {e}")
+
+    @staticmethod
+    def _content_hash(item: ExampleOfArticle) -> str:
+        """Stored content hash, computed on the fly for rows the backfill has not reached yet."""
+        return item.content_hash or ExampleOfArticle.compute_content_hash(item.title, item.content)
+
+    @staticmethod
+    def _word_count(item: ExampleOfArticle) -> int:
+        """Stored word count, counted on the fly for rows the backfill has not reached yet."""
+        # The text statistics are written together, so a missing hash means an unset count
+        return item.word_count if item.content_hash else len((item.content or '').split())
+
+    @staticmethod
+    def _complete_summary(summary: ExampleOfSummary, summary_text: str, processing_cost, completed_at) -> None:
+        """Fill in a completed result on an unsaved summary."""
+        summary.summary_text = summary_text
+        summary.processing_cost = processing_cost
+        summary.word_count = len(summary_text.split())
+        summary.status = "completed"
+        summary.completed_at = completed_at
+        summary.error_message = None
+
+    def _create_missing_summaries(self, items: Dict[int, ExampleOfArticle], summaries: Dict[int, ExampleOfSummary],
+                                  model_key: str, user=None, task_id: str = None) -> List[int]:
+        """Insert pending summaries for items that have none, filling `summaries` in place. Returns the new item ids."""
+        missing = [item_id for item_id in items if item_id not in summaries]
+        if not missing:
+            return []
+        with transaction.atomic():
+            # Rows created concurrently by another caller are ignored, then read back with ours
+            ExampleOfSummary.objects.bulk_create(
+                [
+                    ExampleOfSummary(
+                        example_item_id=item_id, processing_model=model_key, status="pending", requested_by=user,
+                        task_id=task_id, queued_at=timezone.now() if task_id else None,
+                    )
+                    for item_id in missing
+                ],
+                ignore_conflicts=True,
+            )
+            for summary in ExampleOfSummary.objects.filter(example_item_id__in=missing, processing_model=model_key):
+                summaries[summary.example_item_id] = summary
+        # bulk_create sends no post_save signals
+        ExampleOfItemSummariesCache.invalidate(missing)
+        return missing
+
+    def process_items_async(self, item_ids: Iterable[int], processing_model: str = None, user=None,
+                            max_words: int = 150, priority: str = None) -> Dict[int, ExampleOfSummary]:
+        """
+        Queue many items for processing with a single Celery task.
+        New summaries and those this call manages to claim (see `_claim_summaries`) are
+        queued; the rest are returned with the task already handling them. Returns
+        summaries keyed by item id.
+        """
+        model_key = processing_model or self.default_model
+        task_priority = self._task_priority(priority)
+        item_ids = list(dict.fromkeys(item_ids))
+        task_id = uuid()
+
+        item_pks = set(ExampleOfArticle.objects.filter(id__in=item_ids).values_list('id', flat=True))
+        summaries = {
+            summary.example_item_id: summary
+            for summary in ExampleOfSummary.objects.filter(example_item_id__in=item_pks, processing_model=model_key)
+        }
+        claimable = [summary for summary in summaries.values() if self._is_claimable(summary)]
+        if self._claim_summaries(claimable, task_id):
+            # Read back which rows this call won
+            for summary in ExampleOfSummary.objects.filter(pk__in=[summary.pk for summary in claimable]):
+                summaries[summary.example_item_id] = summary
+        self._create_missing_summaries(dict.fromkeys(item_pks), summaries, model_key, user, task_id=task_id)
+
+        to_queue = [item_id for item_id, summary in summaries.items() if summary.task_id == task_id]
+        if to_queue:
+            from example.tasks import example_of_batch_processing_task
+            example_of_batch_processing_task.apply_async(
+                (to_queue, model_key, user.id if user else None, max_words), task_id=task_id, priority=task_priority
+            )
+        return {item_id: summaries[item_id] for item_id in item_ids if item_id in item_pks}
+
+    @staticmethod
+    def _task_priority(priority: str = None) -> int:
+        """Celery priority for a priority name, raising ValueError for unknown names."""
+        try:
+            return SUMMARY_PRIORITIES[priority or SUMMARY_DEFAULT_PRIORITY]
+        except KeyError:
+            raise ValueError(f"Unknown priority '{priority}', expected one of {', '.join(SUMMARY_PRIORITIES)}")
+
+    @staticmethod
+    def _is_claimable(summary: ExampleOfSummary) -> bool:
+        """Whether a summary needs a new task: it failed, or its queued task is presumed lost."""
+        if summary.status == "failed":
+            return True
+        stale_before = timezone.now() - timedelta(seconds=settings.EXAMPLE_AI_TASK_STALE_AFTER)
+        return (
+            summary.status in ("pending", "in_progress")
+            and summary.queued_at is not None
+            and summary.queued_at < stale_before
+        )
+
+    @staticmethod
+    def _claim_summaries(summaries: List[ExampleOfSummary], task_id: str) -> int:
+        """
+        Hand summaries over to `task_id` with one conditional UPDATE.
+        The condition is re-checked by the database, so when callers race for the same
+        (item, model) pair exactly one of them wins; the others attach to its task.
+        Returns the number of rows claimed.
+        """
+        if not summaries:
+            return 0
+        stale_before = timezone.now() - timedelta(seconds=settings.EXAMPLE_AI_TASK_STALE_AFTER)
+        claimed = ExampleOfSummary.objects.filter(
+            Q(status="failed") | Q(status__in=["pending", "in_progress"], queued_at__lt=stale_before),
+            pk__in=[summary.pk for summary in summaries],
+        ).update(status="pending", task_id=task_id, queued_at=timezone.now(), error_message=None)
+        if claimed:
+            ExampleOfItemSummariesCache.invalidate(summary.example_item_id for summary in summaries)
+        return claimed
+
+    def process_item_async(self, item_id: int, processing_model: str = None, user=None, max_words: int = 150,
+                           priority: str = None) -> ExampleOfSummary:
         """
         Asynchronously process an item by enqueuing a Celery task.
+        At most one task is in flight per (item, model): concurrent callers get the
+        summary with the `task_id` of the task already handling it.
+        The task goes to the queue of its processing model (see core.celery) with the
+        given priority ('high', 'normal' or 'low').
         Returns the ExampleOfSummary object (status will be 'pending' or 'in_progress').
         """
         model_key = processing_model or self.default_model
+        task_priority = self._task_priority(priority)
         # Ensure the item exists, or raise ExampleOfArticle.DoesNotExist
         try:
             item = ExampleOfArticle.objects.get(id=item_id)
@@ -130,19 +528,30 @@ class ExampleOfAiService:
         summary = ExampleOfSummary.objects.filter(example_item=item, processing_model=model_key, status="completed").first()
         if summary:
             return summary
+        task_id = uuid()
         summary, created = ExampleOfSummary.objects.get_or_create(
             example_item=item,
             processing_model=model_key,
             defaults={
                 'status': 'pending',
-                'requested_by': user
+                'requested_by': user,
+                'task_id': task_id,
+                'queued_at': timezone.now(),
             }
         )
-        # If already being processed or completed, return existing summary
-        if not created and summary.status in ['pending', 'in_progress', 'completed']:
-            return summary
+        if not created:
+            if not self._is_claimable(summary):
+                # Already queued, being processed or completed: attach to it
+                return summary
+            if not self._claim_summaries([summary], task_id):
+                # Another caller claimed it first; return its task
+                summary.refresh_from_db()
+                return summary
+            summary.refresh_from_db()
         from example.tasks import example_of_async_processing_task
-        example_of_async_processing_task.delay(item_id, model_key, user.id if user else None, max_words)
+        example_of_async_processing_task.apply_async(
+            (item_id, model_key, user.id if user else None, max_words), task_id=task_id, priority=task_priority
+        )
         return summary
 
     def get_item_summary(self, item_id: int, processing_model: str = None) -> Optional[ExampleOfSummary]:
@@ -153,22 +562,31 @@ class ExampleOfAiService:
             status="completed"
         ).first()
 
+    # Columns returned by get_item_summaries, read with .values() instead of model instances
+    ITEM_SUMMARY_FIELDS = (
+        'id', 'processing_model', 'status', 'summary_text', 'word_count', 'processing_cost',
+        'created_at', 'completed_at', 'error_message',
+    )
+
     def get_item_summaries(self, item_id: int) -> Dict:
-        summaries = ExampleOfSummary.objects.filter(example_item_id=item_id)
-        return {
-            "item_id": item_id,
-            "summaries": [
-                {
-                    "id": s.id,
-                    "processing_model": s.processing_model,
-                    "status": s.status,
-                    "summary_text": s.summary_text,
-                    "word_count": s.word_count,
-                    "processing_cost": s.processing_cost,
-                    "created_at": s.created_at,
-                    "completed_at": s.completed_at,
-                    "error_message": s.error_message,
-                }
-                for s in summaries
-            ],
-        } 
\ No newline at end of file
+        return self.get_items_summaries([item_id])[item_id]
+
+    def get_items_summaries(self, item_ids: Iterable[int]) -> Dict[int, Dict]:
+        """
+        Summaries of many items, keyed by item id, in the format of `get_item_summaries`.
+        Reads one cache get_many and, for items not cached, one query.
+        """
+        item_ids = list(dict.fromkeys(item_ids))
+        rows_by_item = ExampleOfItemSummariesCache.get_many(item_ids)
+
+        missing = [item_id for item_id in item_ids if item_id not in rows_by_item]
+        if missing:
+            loaded: Dict[int, List[Dict]] = {item_id: [] for item_id in missing}
+            for row in ExampleOfSummary.objects.filter(example_item_id__in=missing).values(
+                'example_item_id', *self.ITEM_SUMMARY_FIELDS
+            ):
+                loaded[row.pop('example_item_id')].append(row)
+            ExampleOfItemSummariesCache.set_many(loaded)
+            rows_by_item.update(loaded)
+
+        return {item_id: {"item_id": item_id, "summaries": rows_by_item[item_id]} for item_id in item_ids}
@@ -0,0 +1,110 @@
+"""Example of maintaining hourly processing cost rollups."""
+import logging
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncHour
+
+from example.models import ExampleOfCostRollup, ExampleOfSummary
+
+logger = logging.getLogger(__name__)
+
+# (bucket_start, processing_model, requested_by_id)
+BucketKey = Tuple[datetime, str, int]
+
+
+class ExampleOfCostRollupRecorder:
+    """
+    Example of incremental cost aggregation.
+
+    `record()` adds newly completed summaries to their hourly (model, user) buckets with
+    one conditional UPDATE per bucket, so reports read a few rows per hour instead of
+    every summary. `rebuild()` recomputes a time range from ExampleOfSummary, e.g. after
+    summaries were edited in the admin or recording failed.
+    """
+
+    GROUP_FIELDS = ('bucket_start', 'processing_model', 'requested_by')
+
+    @staticmethod
+    def bucket_for(moment: datetime) -> datetime:
+        """Start of the UTC hour containing an aware datetime."""
+        return moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+    def record(self, summaries: Iterable[ExampleOfSummary]) -> None:
+        """Add summaries that have just completed to their buckets."""
+        buckets: Dict[BucketKey, List] = {}
+        for summary in summaries:
+            if summary.status != 'completed' or summary.completed_at is None:
+                continue
+            key = (self.bucket_for(summary.completed_at), summary.processing_model, summary.requested_by_id)
+            totals = buckets.setdefault(key, [0, Decimal('0')])
+            totals[0] += 1
+            totals[1] += Decimal(str(summary.processing_cost or 0))
+
+        for (bucket_start, processing_model, requested_by_id), (count, cost) in buckets.items():
+            self._add(bucket_start, processing_model, requested_by_id, count, cost)
+
+    @staticmethod
+    def _add(bucket_start, processing_model, requested_by_id, count, cost) -> None:
+        bucket = ExampleOfCostRollup.objects.filter(
+            bucket_start=bucket_start, processing_model=processing_model, requested_by_id=requested_by_id
+        )
+        increment = {'summary_count': F('summary_count') + count, 'total_cost': F('total_cost') + cost}
+        if bucket.update(**increment):
+            return
+        try:
+            with transaction.atomic():
+                ExampleOfCostRollup.objects.create(
+                    bucket_start=bucket_start,
+                    processing_model=processing_model,
+                    requested_by_id=requested_by_id,
+                    summary_count=count,
+                    total_cost=cost,
+                )
+        except IntegrityError:
+            # Another worker created the bucket first
+            bucket.update(**increment)
+
+    def rebuild(self, start: datetime, end: datetime) -> int:
+        """Recompute every bucket in the hours covering [start, end). Returns the number of buckets written."""
+        start = self.bucket_for(start)
+        if self.bucket_for(end) != end:
+            end = self.bucket_for(end) + timedelta(hours=1)
+
+        rows = (
+            ExampleOfSummary.objects
+            .filter(status='completed', completed_at__gte=start, completed_at__lt=end)
+            .annotate(bucket_start=TruncHour('completed_at', tzinfo=timezone.utc))
+            .values(*self.GROUP_FIELDS)
+            .annotate(summary_count=Count('id'), total_cost=Sum('processing_cost'))
+            .order_by()
+        )
+        rollups = [
+            ExampleOfCostRollup(
+                bucket_start=row['bucket_start'],
+                processing_model=row['processing_model'],
+                requested_by_id=row['requested_by'],
+                summary_count=row['summary_count'],
+                total_cost=row['total_cost'] or 0,
+            )
+            for row in rows
+        ]
+        with transaction.atomic():
+            ExampleOfCostRollup.objects.filter(bucket_start__gte=start, bucket_start__lt=end).delete()
+            ExampleOfCostRollup.objects.bulk_create(rollups, batch_size=1000)
+        logger.info(f"Rebuilt {len(rollups)} cost rollup bucket(s) from {start.isoformat()} to {end.isoformat()}")
+        return len(rollups)
+
+    @staticmethod
+    def totals(start: datetime, end: datetime, group_by: Sequence[str]) -> List[Dict[str, object]]:
+        """Summary counts and credits for buckets in [start, end), grouped by the given rollup fields."""
+        return list(
+            ExampleOfCostRollup.objects
+            .filter(bucket_start__gte=start, bucket_start__lt=end)
+            .values(*group_by)
+            .annotate(summary_count=Sum('summary_count'), total_cost=Sum('total_cost'))
+            .order_by(*group_by)
+        )
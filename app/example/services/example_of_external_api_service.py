@@ -1,11 +1,34 @@
 """Example of external API service implementation with logging integration."""
 import os
+import hashlib
 import json
-from typing import Dict, Any, Tuple
+import logging
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
 import httpx
+from django.conf import settings
+from django.db import transaction
 from django.utils.dateparse import parse_datetime
 from django.utils import timezone
 from example.models import ExampleOfFetchLog, ExampleOfArticle
+from .example_of_paginated_fetcher import ExampleOfPaginatedFetcher
+from .example_of_raw_data_archive import ExampleOfRawDataArchive
+from .example_of_fetch_log_recorder import ExampleOfFetchLogRecorder
+from .example_of_url_bloom_filter import ExampleOfUrlBloomFilter
+from .example_of_rate_limiter import ExampleOfTokenBucketLimiter
+from .example_of_item_response_cache import ExampleOfItemResponseCache
+
+logger = logging.getLogger(__name__)
+
+# Article fields populated from upstream items by _build_item
+ARTICLE_MAPPED_FIELDS = [
+    'title', 'content', 'published_date', 'author', 'source',
+    'image_url', 'description', 'example_source',
+    # Derived text statistics, computed by _build_item
+    'word_count', 'char_count', 'content_hash',
+    # Row version; bulk_create fills auto_now fields
+    'updated_at',
+]
 
 
 class ExampleServiceError(Exception):
@@ -18,12 +41,47 @@ class ConfigurationError(Exception):
     pass
 
 
+def _simulated_response(request: httpx.Request) -> httpx.Response:
+    """Example upstream response used when EXAMPLE_API_SIMULATE is enabled."""
+    page = int(request.url.params.get('page', 1))
+    items = [
+        {
+            'title': 'Example Item 1',
+            'content': 'This is example content for item 1.',
+            'url': 'https://example.com/item1',
+            'publishedAt': timezone.now().isoformat(),
+            'author': 'Example Author',
+            'source': {'name': 'Example Source'},
+            'urlToImage': 'https://example.com/image1.jpg',
+            'description': 'Example description for item 1.'
+        },
+        {
+            'title': 'Example Item 2',
+            'content': 'This is example content for item 2.',
+            'url': 'https://example.com/item2',
+            'publishedAt': timezone.now().isoformat(),
+            'author': 'Example Author',
+            'source': {'name': 'Example Source'},
+            'urlToImage': 'https://example.com/image2.jpg',
+            'description': 'Example description for item 2.'
+        }
+    ]
+    return httpx.Response(200, json={
+        'status': 'ok',
+        'totalResults': len(items),
+        'items': items if page == 1 else [],
+    })
+
+
+_SIMULATED_TRANSPORT = httpx.MockTransport(_simulated_response)
+
+
 class ExampleOfExternalApiService():
     """
     Example of a flexible fetcher for external APIs, driven by JSON config.
     Implements external API integration with logging support.
     """
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None, transport: httpx.AsyncBaseTransport = None):
         # Support both environment variable and config parameter
         api_key = None
         if config and 'api_key' in config:
@@ -38,6 +96,17 @@ class ExampleOfExternalApiService():
         self.base_url = 'https://api.example.com/v1/data'
         self.config = config or {}
 
+        # Serve canned data unless a real upstream is configured
+        if transport is None and settings.EXAMPLE_API_SIMULATE:
+            transport = _SIMULATED_TRANSPORT
+        # One bucket per upstream host, shared by every worker calling it
+        rate_limiter = None
+        if settings.EXAMPLE_FETCH_RATE_LIMIT > 0:
+            rate_limiter = ExampleOfTokenBucketLimiter(urlparse(self.base_url).netloc)
+        self.fetcher = ExampleOfPaginatedFetcher(self.base_url, transport=transport, rate_limiter=rate_limiter)
+        self.raw_data_archive = ExampleOfRawDataArchive()
+        self.url_bloom_filter = ExampleOfUrlBloomFilter() if settings.EXAMPLE_URL_BLOOM_ENABLED else None
+
     def _get_query_params(self) -> Dict[str, Any]:
         """
         Returns the default query parameters for the external API endpoint.
@@ -57,83 +126,104 @@ class ExampleOfExternalApiService():
 
         return default_params
 
-    def _create_fetch_log(self, source: str = 'ExampleService',
-                         query_params: Dict[str, Any] = None) -> ExampleOfFetchLog:
-        """Create a new ExampleOfFetchLog entry for this fetch operation."""
-        return ExampleOfFetchLog.objects.create(
+    def _start_fetch_log(self, source: str = 'ExampleService',
+                         query_params: Dict[str, Any] = None) -> ExampleOfFetchLogRecorder:
+        """Create the ExampleOfFetchLog entry for this fetch operation and return its recorder."""
+        return ExampleOfFetchLogRecorder.start(
             source=source,
-            status=ExampleOfFetchLog.Status.PENDING,
             query_params=query_params or {},
+            query_key=self._get_query_key(source, query_params or {}),
             metadata={'service_class': 'ExampleOfExternalApiService'}
         )
 
-    def _save_raw_data(self, fetch_log: 'ExampleOfFetchLog', raw_data: Dict[str, Any]) -> None:
-        """Save raw response data to file and update fetch log."""
+    def _get_query_key(self, source: str, query_params: Dict[str, Any]) -> str:
+        """Stable hash identifying a source/query combination across runs."""
+        raw_key = json.dumps({'source': source, 'query_params': query_params}, sort_keys=True, default=str)
+        return hashlib.sha256(raw_key.encode('utf-8')).hexdigest()
+
+    def _get_high_water_mark(self, fetch_log: ExampleOfFetchLog) -> Dict[str, Any]:
+        """Return the high-water mark recorded by the last successful fetch of the same query."""
+        previous_metadata = (
+            ExampleOfFetchLog.objects
+            .filter(query_key=fetch_log.query_key, status=ExampleOfFetchLog.Status.SUCCESS)
+            .order_by('-started_at')
+            .values_list('metadata', flat=True)
+            .first()
+        )
+        return (previous_metadata or {}).get('high_water_mark') or {}
+
+    def _apply_high_water_mark(self, query_params: Dict[str, Any],
+                               high_water_mark: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Narrow a request to data newer than the high-water mark.
+
+        Returns:
+            Tuple[Dict, Dict]: (query params with from/cursor, conditional request headers)
+        """
+        params = dict(query_params)
+        if high_water_mark.get('published_at'):
+            params['from'] = high_water_mark['published_at']
+        if high_water_mark.get('cursor'):
+            params['cursor'] = high_water_mark['cursor']
+
+        headers = {}
+        if high_water_mark.get('etag'):
+            headers['If-None-Match'] = high_water_mark['etag']
+        if high_water_mark.get('last_modified'):
+            headers['If-Modified-Since'] = high_water_mark['last_modified']
+        return params, headers
+
+    def _advance_high_water_mark(self, high_water_mark: Dict[str, Any], items: list,
+                                 response_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Return a new high-water mark covering the given items and response validators."""
+        new_mark = dict(high_water_mark)
+        latest = parse_datetime(new_mark['published_at']) if new_mark.get('published_at') else None
+        for item_data in items:
+            published_at = parse_datetime(item_data.get('publishedAt') or '')
+            if published_at and (latest is None or published_at > latest):
+                latest = published_at
+        if latest:
+            new_mark['published_at'] = latest.isoformat()
+
+        response_data = response_data or {}
+        for key, response_key in (('etag', 'etag'), ('last_modified', 'last_modified'), ('cursor', 'nextCursor')):
+            if response_data.get(response_key):
+                new_mark[key] = response_data[response_key]
+        return new_mark
+
+    def _save_raw_data(self, recorder: ExampleOfFetchLogRecorder, raw_data: Dict[str, Any],
+                       record_location: bool = True) -> None:
+        """
+        Append raw response data to the raw-data archive and record its location on the fetch log.
+        Streamed fetches archive one record per page and record only the first location;
+        replay finds the other records through the archive index.
+        """
         if not raw_data:
             return
 
         try:
-            # Create a filename based on fetch log ID and timestamp
-            timestamp = timezone.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"example_raw_{fetch_log.id}_{timestamp}.json"
-
-            # You might want to configure this path in settings
-            raw_data_dir = os.path.join('media', 'raw_data')
-            os.makedirs(raw_data_dir, exist_ok=True)
-
-            file_path = os.path.join(raw_data_dir, filename)
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(raw_data, f, indent=2, ensure_ascii=False)
-
-            fetch_log.raw_data_file = file_path
-            fetch_log.save(update_fields=['raw_data_file'])
+            location = self.raw_data_archive.append(recorder.id, raw_data)
+            if record_location:
+                recorder.set(raw_data_file=location)
 
         except Exception as e:
-            print(f"Warning: Could not save raw data file: {e}")
+            logger.warning(f"Could not archive raw data for fetch log {recorder.id}: {e}")
 
-    def _fetch_data(self, query_params: Dict[str, Any] = None) -> Dict[str, Any]:
+    def _fetch_data(self, query_params: Dict[str, Any] = None, headers: Dict[str, str] = None) -> Dict[str, Any]:
         """
         Perform the API call and return the raw response data from external API.
         Ensures the api_key is included in the request parameters.
+        Optional conditional `headers` may turn the response into a 304 (`not_modified`).
         """
         if not query_params:
             query_params = self._get_query_params()
 
-        url = self.base_url
-        query_params['apiKey'] = self.api_key
+        # Copy so the api key never ends up in the fetch log's query_params
+        params = {**query_params, 'apiKey': self.api_key}
 
         try:
-            # Simulate API call for example purposes
-            # In real implementation, this would be an actual HTTP request
-            response_data = {
-                'status': 'ok',
-                'totalResults': 5,
-                'items': [
-                    {
-                        'title': 'Example Item 1',
-                        'content': 'This is example content for item 1.',
-                        'url': 'https://example.com/item1',
-                        'publishedAt': timezone.now().isoformat(),
-                        'author': 'Example Author',
-                        'source': {'name': 'Example Source'},
-                        'urlToImage': 'https://example.com/image1.jpg',
-                        'description': 'Example description for item 1.'
-                    },
-                    {
-                        'title': 'Example Item 2',
-                        'content': 'This is example content for item 2.',
-                        'url': 'https://example.com/item2',
-                        'publishedAt': timezone.now().isoformat(),
-                        'author': 'Example Author',
-                        'source': {'name': 'Example Source'},
-                        'urlToImage': 'https://example.com/image2.jpg',
-                        'description': 'Example description for item 2.'
-                    }
-                ]
-            }
-            return response_data
-        except Exception as e:
+            return self.fetcher.fetch_all(params, headers)
+        except (httpx.HTTPError, ValueError) as e:
             raise ExampleServiceError(f"Failed to fetch from external API: {e}")
 
     def _process_response(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -150,109 +240,267 @@ class ExampleOfExternalApiService():
             'items': items
         }
 
-    def _save_items(self, items_data: list) -> Tuple[int, int]:
+    def _build_item(self, item_data: Dict[str, Any]) -> ExampleOfArticle:
+        """Map a single API item onto an unsaved ExampleOfArticle instance."""
+        published_date = parse_datetime(item_data.get('publishedAt') or '')
+        if published_date is None:
+            raise ExampleServiceError(f"Invalid publishedAt for item {item_data.get('url')}")
+
+        article = ExampleOfArticle(
+            title=item_data.get('title', ''),
+            content=item_data.get('content', ''),
+            url=item_data.get('url', ''),
+            published_date=published_date,
+            author=item_data.get('author'),
+            source=(item_data.get('source') or {}).get('name', 'Unknown'),
+            image_url=item_data.get('urlToImage'),
+            description=item_data.get('description'),
+            example_source='ExampleAPI'
+        )
+        # bulk_create skips save(), so derive the text statistics here
+        article.update_text_stats()
+        return article
+
+    def _save_items(self, items_data: list, batch_size: Optional[int] = None,
+                    update_existing: bool = False) -> Tuple[int, int, int]:
         """
-        Save the fetched items to the database.
-        Skip items that already exist (based on URL).
+        Save the fetched items to the database in bulk.
+        Existing URLs are looked up once per chunk, new rows are inserted with
+        bulk_create inside a single transaction, and conflicts with concurrent
+        writers are ignored rather than raised.
+        With update_existing=True rows are upserted on url instead, so existing
+        articles pick up the current mapping (used when replaying archived data).
 
         Returns:
-            Tuple[int, int]: (items_processed, items_saved)
+            Tuple[int, int, int]: (items_processed, items_saved, duplicates_skipped)
         """
-        items_processed = 0
+        batch_size = batch_size or settings.EXAMPLE_BULK_BATCH_SIZE
+        items_processed = len(items_data)
         items_saved = 0
+        duplicates_skipped = 0
 
+        # Map items to unsaved instances, dropping invalid rows and in-batch repeats
+        candidates = {}
         for item_data in items_data:
-            items_processed += 1
+            url = item_data.get('url')
+            if url in candidates:
+                duplicates_skipped += 1
+                continue
             try:
-                # Skip if item with this URL already exists
-                if ExampleOfArticle.objects.filter(url=item_data.get('url')).exists():
+                candidates[url] = self._build_item(item_data)
+            except Exception as e:
+                logger.warning(f"Skipping invalid item {url}: {e}")
+
+        articles = list(candidates.values())
+
+        with transaction.atomic():
+            for start in range(0, len(articles), batch_size):
+                chunk = articles[start:start + batch_size]
+                chunk_urls = [article.url for article in chunk]
+
+                if update_existing:
+                    ExampleOfArticle.objects.bulk_create(
+                        chunk,
+                        update_conflicts=True,
+                        unique_fields=['url'],
+                        update_fields=ARTICLE_MAPPED_FIELDS,
+                    )
+                    items_saved += len(chunk)
+                    # Existing rows changed too, so their cached detail responses are stale
+                    updated_pks = [article.pk for article in chunk if article.pk is not None]
+                    if len(updated_pks) < len(chunk):
+                        # The database did not return ids for upserted rows
+                        updated_pks = ExampleOfArticle.objects.filter(url__in=chunk_urls).values_list('pk', flat=True)
+                    ExampleOfItemResponseCache.invalidate(updated_pks)
+                    if self.url_bloom_filter:
+                        self.url_bloom_filter.add_many(chunk_urls)
+                    continue
+
+                # Only URLs the Bloom filter cannot rule out need a database lookup
+                probe_urls = chunk_urls
+                if self.url_bloom_filter:
+                    maybe_present = self.url_bloom_filter.contains_many(chunk_urls)
+                    probe_urls = [url for url, maybe in zip(chunk_urls, maybe_present) if maybe]
+
+                existing_urls = set(
+                    ExampleOfArticle.objects.filter(url__in=probe_urls).order_by().values_list('url', flat=True)
+                ) if probe_urls else set()
+                new_articles = [article for article in chunk if article.url not in existing_urls]
+                duplicates_skipped += len(chunk) - len(new_articles)
+                if not new_articles:
                     continue
 
-                ExampleOfArticle.objects.create(
-                    title=item_data.get('title', ''),
-                    content=item_data.get('content', ''),
-                    url=item_data.get('url', ''),
-                    published_date=parse_datetime(item_data.get('publishedAt')),
-                    author=item_data.get('author'),
-                    source=item_data.get('source', {}).get('name', 'Unknown'),
-                    image_url=item_data.get('urlToImage'),
-                    description=item_data.get('description'),
-                    example_source='ExampleAPI'
+                ExampleOfArticle.objects.bulk_create(new_articles, ignore_conflicts=True)
+
+                # bulk_create does not report which rows were skipped on conflict, so compare
+                # creation stamps: a row inserted by a concurrent writer keeps that writer's stamp.
+                stamps = dict(
+                    ExampleOfArticle.objects.filter(
+                        url__in=[article.url for article in new_articles]
+                    ).order_by().values_list('url', 'created_at')
                 )
-                items_saved += 1
+                saved_urls = [article.url for article in new_articles if stamps.get(article.url) == article.created_at]
+                saved = len(saved_urls)
+                items_saved += saved
+                if saved:
+                    # bulk_create sends no signals; new rows only change the list responses
+                    ExampleOfItemResponseCache.invalidate()
+                if self.url_bloom_filter:
+                    self.url_bloom_filter.add_many(saved_urls)
+                duplicates_skipped += len(new_articles) - saved
+
+        return items_processed, items_saved, duplicates_skipped
+
+    def _stream_and_save(self, recorder: ExampleOfFetchLogRecorder, query_params: Dict[str, Any],
+                         high_water_mark: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch pages as a stream and save each one as soon as it arrives.
+        Network I/O continues in the background while a page is being inserted,
+        and the fetch log's counters are updated after every committed page.
+        """
+        request_params, headers = self._apply_high_water_mark(query_params, high_water_mark)
+        params = {**request_params, 'apiKey': self.api_key}
+        processed_data = {
+            'status': 'unknown',
+            'totalResults': 0,
+            'items_processed': 0,
+            'items_saved': 0,
+            'duplicates_skipped': 0,
+            'not_modified': False,
+            'high_water_mark': high_water_mark,
+        }
 
-            except Exception as e:
-                print(f"Error saving item: {e}")
+        try:
+            for page_number, page in enumerate(self.fetcher.stream_pages(params, headers=headers)):
+                # Nothing changed upstream: the 304 is the only page, nothing to archive or save
+                if page.get('not_modified'):
+                    processed_data['status'] = 'not_modified'
+                    processed_data['not_modified'] = True
+                    processed_data['high_water_mark'] = self._advance_high_water_mark(high_water_mark, [], page)
+                    break
+
+                if settings.EXAMPLE_RAW_DATA_CAPTURE:
+                    self._save_raw_data(recorder, page, record_location=page_number == 0)
+                page_data = self._process_response(page)
+                processed_data['status'] = page_data['status']
+                processed_data['totalResults'] = page_data['totalResults']
+
+                items_processed, items_saved, duplicates_skipped = self._save_items(page_data['items'])
+                processed_data['items_processed'] += items_processed
+                processed_data['items_saved'] += items_saved
+                processed_data['duplicates_skipped'] += duplicates_skipped
+                processed_data['high_water_mark'] = self._advance_high_water_mark(
+                    processed_data['high_water_mark'], page_data['items'], page
+                )
+
+                # Report progress as each page commits
+                recorder.progress(
+                    items_fetched=processed_data['items_processed'],
+                    items_saved=processed_data['items_saved'],
+                )
+        except httpx.HTTPError as e:
+            raise ExampleServiceError(f"Failed to fetch from external API: {e}")
 
-        return items_processed, items_saved
+        return processed_data
 
     def fetch_and_save(self, query_params: Dict[str, Any] = None,
-                      source: str = 'ExampleService'):
+                      source: str = 'ExampleService', stream: bool = False, incremental: bool = True):
         """
         Fetch items from external API, save them to the database, and return the processed data.
         Optionally accepts custom query parameters to override defaults.
+        With stream=True pages are saved as they arrive and the returned data omits 'items',
+        keeping memory flat for large result sets.
+        With incremental=True only data newer than the previous successful run of the same
+        query is requested, and a 304 from the upstream skips processing entirely.
         Includes comprehensive logging integration.
         """
         # Use provided query params or get defaults
         if not query_params:
             query_params = self._get_query_params()
 
-        # Create fetch log entry
-        fetch_log = self._create_fetch_log(source, query_params)
+        # Create the fetch log entry, already in progress
+        recorder = self._start_fetch_log(source, query_params)
 
         try:
-            # Update status to in progress
-            fetch_log.status = ExampleOfFetchLog.Status.IN_PROGRESS
-            fetch_log.save(update_fields=['status'])
-
-            # Fetch data from API
-            response_data = self._fetch_data(query_params)
-            if not response_data:
-                raise ExampleServiceError("No data returned from external API")
-
-            # Save raw data to file
-            # self._save_raw_data(fetch_log, response_data)
-
-            # Process the response
-            processed_data = self._process_response(response_data)
-
-            # Update fetch log with fetched count
-            fetch_log.items_fetched = len(processed_data['items'])
-            fetch_log.save(update_fields=['items_fetched'])
-
-            # Save items to the database and get counts
-            items_processed, items_saved = self._save_items(processed_data['items'])
-
-            # Add save statistics to the result
-            processed_data['items_processed'] = items_processed
-            processed_data['items_saved'] = items_saved
-            processed_data['duplicates_skipped'] = items_processed - items_saved
+            high_water_mark = self._get_high_water_mark(recorder.fetch_log) if incremental else {}
+            if stream:
+                processed_data = self._stream_and_save(recorder, query_params, high_water_mark)
+            else:
+                processed_data = self._fetch_and_save_batch(recorder, query_params, high_water_mark)
 
             # Update fetch log metadata with additional info
             metadata = {
                 'service_class': 'ExampleOfExternalApiService',
                 'api_status': processed_data.get('status'),
                 'total_results': processed_data.get('totalResults'),
-                'duplicates_skipped': processed_data['duplicates_skipped']
+                'duplicates_skipped': processed_data['duplicates_skipped'],
+                'not_modified': processed_data['not_modified'],
+                'high_water_mark': processed_data['high_water_mark'],
             }
 
             # Complete the fetch log with success status
-            fetch_log.complete(
+            recorder.complete(
                 status=ExampleOfFetchLog.Status.SUCCESS,
-                items_saved=items_saved,
+                items_saved=processed_data['items_saved'],
                 metadata=metadata
             )
 
+            processed_data['fetch_log_id'] = recorder.id
             return processed_data
 
         except Exception as e:
             # Log the error and mark fetch as failed
             error_message = str(e)
-            fetch_log.complete(
+            recorder.complete(
                 status=ExampleOfFetchLog.Status.ERROR,
                 error_message=error_message,
                 metadata={'service_class': 'ExampleOfExternalApiService', 'error_type': type(e).__name__}
             )
 
             # Re-raise the exception to maintain existing behavior
-            raise e 
\ No newline at end of file
+            raise e
+
+    def _fetch_and_save_batch(self, recorder: ExampleOfFetchLogRecorder, query_params: Dict[str, Any],
+                              high_water_mark: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch the whole response, then process and save it in one pass."""
+        # Fetch data from API, asking only for data past the high-water mark
+        request_params, headers = self._apply_high_water_mark(query_params, high_water_mark)
+        response_data = self._fetch_data(request_params, headers)
+        if not response_data:
+            raise ExampleServiceError("No data returned from external API")
+
+        # Nothing changed upstream: skip archiving, processing and saving
+        if response_data.get('not_modified'):
+            return {
+                'status': 'not_modified',
+                'totalResults': 0,
+                'items_processed': 0,
+                'items_saved': 0,
+                'duplicates_skipped': 0,
+                'not_modified': True,
+                'high_water_mark': self._advance_high_water_mark(high_water_mark, [], response_data),
+            }
+
+        # Archive the raw response
+        if settings.EXAMPLE_RAW_DATA_CAPTURE:
+            self._save_raw_data(recorder, response_data)
+
+        # Process the response
+        processed_data = self._process_response(response_data)
+
+        # Record the fetched count
+        recorder.progress(items_fetched=len(processed_data['items']))
+
+        # Save items to the database and get counts
+        items_processed, items_saved, duplicates_skipped = self._save_items(processed_data['items'])
+
+        # Add save statistics to the result
+        processed_data['items_processed'] = items_processed
+        processed_data['items_saved'] = items_saved
+        processed_data['duplicates_skipped'] = duplicates_skipped
+        processed_data['not_modified'] = False
+        processed_data['high_water_mark'] = self._advance_high_water_mark(
+            high_water_mark, processed_data['items'], response_data
+        )
+
+        return processed_data
@@ -0,0 +1,84 @@
+"""Example of a low-write recorder for ExampleOfFetchLog status transitions."""
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from example.models import ExampleOfFetchLog
+
+
+class ExampleOfFetchLogRecorder:
+    """
+    Example of a recorder that buffers fetch-log changes in memory.
+
+    Field changes are collected with `set()` and written with a single UPDATE of only
+    the changed columns on `flush()`/`complete()`. Progress counters are either flushed
+    to the row at most every `flush_interval` seconds ('db' backend), or written to the
+    cache only ('cache' backend), in which case the row is persisted once, on completion.
+    """
+
+    BACKEND_DB = 'db'
+    BACKEND_CACHE = 'cache'
+
+    def __init__(self, fetch_log: ExampleOfFetchLog, progress_backend: str = None, flush_interval: float = None):
+        self.fetch_log = fetch_log
+        self.progress_backend = progress_backend or settings.EXAMPLE_FETCH_LOG_PROGRESS_BACKEND
+        self.flush_interval = settings.EXAMPLE_FETCH_LOG_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self._dirty_fields = set()
+        self._last_flush = time.monotonic()
+
+    @classmethod
+    def start(cls, progress_backend: str = None, flush_interval: float = None, **fields) -> 'ExampleOfFetchLogRecorder':
+        """Create the fetch log directly in IN_PROGRESS state with one INSERT."""
+        fetch_log = ExampleOfFetchLog.objects.create(status=ExampleOfFetchLog.Status.IN_PROGRESS, **fields)
+        return cls(fetch_log, progress_backend=progress_backend, flush_interval=flush_interval)
+
+    @property
+    def id(self) -> int:
+        return self.fetch_log.id
+
+    @staticmethod
+    def progress_key(fetch_log_id: int) -> str:
+        return f'example:fetch-log-progress:{fetch_log_id}'
+
+    @classmethod
+    def get_progress(cls, fetch_log_id: int) -> Optional[Dict[str, Any]]:
+        """Return live progress published by the cache backend, if any."""
+        return cache.get(cls.progress_key(fetch_log_id))
+
+    def set(self, **fields) -> None:
+        """Buffer field changes without writing them."""
+        for field, value in fields.items():
+            setattr(self.fetch_log, field, value)
+            self._dirty_fields.add(field)
+
+    def progress(self, **counters) -> None:
+        """Record progress counters, writing them according to the progress backend."""
+        self.set(**counters)
+        if self.progress_backend == self.BACKEND_CACHE:
+            cache.set(
+                self.progress_key(self.id),
+                {field: getattr(self.fetch_log, field) for field in ('items_fetched', 'items_saved')},
+                timeout=settings.CELERY_TASK_TIME_LIMIT,
+            )
+        elif time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered changes with one UPDATE of only the changed columns."""
+        if self._dirty_fields:
+            ExampleOfFetchLog.objects.filter(pk=self.id).update(
+                **{field: getattr(self.fetch_log, field) for field in self._dirty_fields}
+            )
+            self._dirty_fields.clear()
+        self._last_flush = time.monotonic()
+
+    def complete(self, status: ExampleOfFetchLog.Status, **fields) -> ExampleOfFetchLog:
+        """Apply the final status and every buffered change in a single UPDATE."""
+        self.set(status=status, completed_at=timezone.now(), **fields)
+        self.flush()
+        if self.progress_backend == self.BACKEND_CACHE:
+            cache.delete(self.progress_key(self.id))
+        return self.fetch_log
@@ -0,0 +1,81 @@
+"""Example of a write-aware, version-stamped cache for item API responses."""
+import hashlib
+import time
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+class ExampleOfItemResponseCache:
+    """
+    Example of a response cache that never serves data older than the last write.
+
+    List responses are keyed by a collection version and detail responses by a version
+    per item. Writes replace the versions (`invalidate()`), so every earlier entry becomes
+    unreachable at once and simply ages out; nothing has to be found and deleted.
+    Versions are write timestamps in nanoseconds. Item versions share the TTL of the
+    entries and are refreshed by each write, so an expired version cannot bring an old
+    entry back. The collection version never expires: it doubles as the list's validator
+    for conditional GETs (see `collection_version()`).
+    """
+
+    KEY_PREFIX = 'example:item-responses'
+    COLLECTION_VERSION_KEY = f'{KEY_PREFIX}:version:collection'
+    # Item version used while no write has been recorded within the TTL
+    INITIAL_VERSION = '0'
+
+    @classmethod
+    def _item_version_key(cls, pk) -> str:
+        return f'{cls.KEY_PREFIX}:version:item:{pk}'
+
+    @staticmethod
+    def _url_hash(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+
+    @classmethod
+    def collection_version(cls) -> int:
+        """
+        Timestamp (ns) of the last write to the items, or of the first read after the
+        version was lost, which is later than any write and so still a safe validator.
+        """
+        version = cache.get(cls.COLLECTION_VERSION_KEY)
+        if version is None:
+            cache.add(cls.COLLECTION_VERSION_KEY, time.time_ns(), timeout=None)
+            version = cache.get(cls.COLLECTION_VERSION_KEY)
+        return int(version)
+
+    @classmethod
+    def list_key(cls, url: str, version: int = None) -> str:
+        version = cls.collection_version() if version is None else version
+        return f'{cls.KEY_PREFIX}:list:{version}:{cls._url_hash(url)}'
+
+    @classmethod
+    def detail_key(cls, pk, url: str) -> str:
+        version = cache.get(cls._item_version_key(pk), cls.INITIAL_VERSION)
+        return f'{cls.KEY_PREFIX}:detail:{pk}:{version}:{cls._url_hash(url)}'
+
+    @staticmethod
+    def get(key: str) -> Optional[Any]:
+        return cache.get(key)
+
+    @staticmethod
+    def set(key: str, data: Any) -> None:
+        cache.set(key, data, timeout=settings.EXAMPLE_ITEM_CACHE_TTL)
+
+    @classmethod
+    def invalidate(cls, pks: Iterable = ()) -> None:
+        """
+        Start new versions for the collection and the given items once the current
+        transaction commits, so no reader can cache pre-commit data under them.
+        """
+        keys = [cls._item_version_key(pk) for pk in set(pks) if pk is not None]
+
+        def bump():
+            version = time.time_ns()
+            cache.set(cls.COLLECTION_VERSION_KEY, version, timeout=None)
+            if keys:
+                cache.set_many({key: version for key in keys}, timeout=settings.EXAMPLE_ITEM_CACHE_TTL)
+
+        transaction.on_commit(bump)
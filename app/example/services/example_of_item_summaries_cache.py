@@ -0,0 +1,42 @@
+"""Example of a per-item cache of summary listings."""
+from typing import Dict, Iterable, List
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+class ExampleOfItemSummariesCache:
+    """
+    Example of a cache holding the summary rows of each item, one entry per item.
+
+    Entries are invalidated whenever a summary of the item is created, deleted or changes
+    status: save() and delete() through signals (see example.signals), bulk writes and
+    queryset updates by calling `invalidate()` next to them. The TTL bounds how long a
+    write that bypasses both could be served stale.
+    """
+
+    KEY_PREFIX = 'example:item-summaries'
+
+    @classmethod
+    def _key(cls, item_id: int) -> str:
+        return f'{cls.KEY_PREFIX}:{item_id}'
+
+    @classmethod
+    def get_many(cls, item_ids: Iterable[int]) -> Dict[int, List[Dict]]:
+        """Cached summary rows for the items that have an entry."""
+        keys = {cls._key(item_id): item_id for item_id in item_ids}
+        return {keys[key]: rows for key, rows in cache.get_many(list(keys)).items()}
+
+    @classmethod
+    def set_many(cls, rows_by_item: Dict[int, List[Dict]]) -> None:
+        if rows_by_item:
+            cache.set_many(
+                {cls._key(item_id): rows for item_id, rows in rows_by_item.items()},
+                timeout=settings.EXAMPLE_ITEM_SUMMARIES_CACHE_TTL,
+            )
+
+    @classmethod
+    def invalidate(cls, item_ids: Iterable[int]) -> None:
+        keys = [cls._key(item_id) for item_id in set(item_ids)]
+        if keys:
+            cache.delete_many(keys)
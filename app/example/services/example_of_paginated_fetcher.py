@@ -0,0 +1,241 @@
+"""Example of a concurrent paginated HTTP fetcher built on a pooled httpx.AsyncClient."""
+import asyncio
+import logging
+import math
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+from django.conf import settings
+
+from .example_of_rate_limiter import ExampleOfTokenBucketLimiter
+
+logger = logging.getLogger(__name__)
+
+# One background event loop per process owns the pooled clients, so keep-alive
+# connections survive between sync calls (asyncio.run would close them every time).
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_pid: Optional[int] = None
+_loop_lock = threading.Lock()
+_clients: Dict[tuple, httpx.AsyncClient] = {}
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide fetch loop, starting it on first use and after a fork."""
+    global _loop, _loop_pid
+
+    with _loop_lock:
+        if _loop is None or _loop_pid != os.getpid():
+            _loop = asyncio.new_event_loop()
+            _loop_pid = os.getpid()
+            _clients.clear()
+            threading.Thread(target=_loop.run_forever, name='example-fetch-loop', daemon=True).start()
+        return _loop
+
+
+def run_sync(coro, timeout: Optional[float] = None):
+    """Run a coroutine on the fetch loop and block until it returns."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result(timeout)
+
+
+class ExampleOfPaginatedFetcher:
+    """
+    Example of a paginated fetcher that fans out page requests concurrently.
+    The first page is requested alone to learn `totalResults`; the remaining pages
+    are requested in parallel, bounded by `max_concurrency`.
+    Every request first takes a token from the optional shared `rate_limiter`; a 429
+    blocks the limiter for the upstream's Retry-After and the request is retried.
+    """
+
+    def __init__(self, base_url: str, page_size: int = None, max_pages: int = None,
+                 max_concurrency: int = None, timeout: float = None, http2: bool = None,
+                 transport: httpx.AsyncBaseTransport = None,
+                 rate_limiter: Optional[ExampleOfTokenBucketLimiter] = None, rate_limit_retries: int = None):
+        self.base_url = base_url
+        self.page_size = page_size or settings.EXAMPLE_FETCH_PAGE_SIZE
+        self.max_pages = max_pages or settings.EXAMPLE_FETCH_MAX_PAGES
+        self.max_concurrency = max_concurrency or settings.EXAMPLE_FETCH_CONCURRENCY
+        self.timeout = timeout or settings.EXAMPLE_FETCH_TIMEOUT
+        self.http2 = settings.EXAMPLE_FETCH_HTTP2 if http2 is None else http2
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+        self.rate_limit_retries = (
+            settings.EXAMPLE_FETCH_RATE_LIMIT_RETRIES if rate_limit_retries is None else rate_limit_retries
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client for this configuration. Must be called on the fetch loop."""
+        key = (self.http2, self.max_concurrency, self.transport)
+        client = _clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                transport=self.transport,
+            )
+            _clients[key] = client
+        return client
+
+    async def _wait_for_token(self) -> None:
+        """Reserve a token from the shared limiter and sleep until it is due."""
+        if self.rate_limiter is None:
+            return
+        # The limiter may call Redis, so keep the blocking round trip off the event loop
+        wait = await asyncio.to_thread(self.rate_limiter.acquire)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _request_page(self, client: httpx.AsyncClient, params: Dict[str, Any], page: int,
+                            headers: Dict[str, str] = None) -> httpx.Response:
+        """Request a single page, raising for error statuses other than 304 Not Modified."""
+        for attempt in range(self.rate_limit_retries + 1):
+            await self._wait_for_token()
+            response = await client.get(
+                self.base_url,
+                params={**params, 'page': page, 'pageSize': self.page_size},
+                headers=headers,
+                timeout=self.timeout,
+            )
+            if response.status_code != httpx.codes.TOO_MANY_REQUESTS or attempt == self.rate_limit_retries:
+                break
+
+            retry_after = ExampleOfTokenBucketLimiter.parse_retry_after(response.headers.get('retry-after'))
+            logger.warning(f"Rate limited on page {page} of {self.base_url}, retry after {retry_after}s")
+            if self.rate_limiter is not None:
+                # Pause every worker, not just this request; the next token is due after the block
+                await asyncio.to_thread(self.rate_limiter.block_for, retry_after or 1 / self.rate_limiter.rate)
+            else:
+                await asyncio.sleep(retry_after or 1)
+
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            response.raise_for_status()
+        return response
+
+    async def _get_page(self, client: httpx.AsyncClient, params: Dict[str, Any], page: int) -> Dict[str, Any]:
+        """Request a single page and return its decoded JSON body."""
+        response = await self._request_page(client, params, page)
+        return response.json()
+
+    def _total_pages(self, first_page: Dict[str, Any]) -> int:
+        """Number of pages to request, derived from the first page and capped by max_pages."""
+        total_results = first_page.get('totalResults') or 0
+        return min(math.ceil(total_results / self.page_size), self.max_pages)
+
+    async def fetch_pages(self, params: Dict[str, Any],
+                          headers: Dict[str, str] = None) -> Tuple[List[Dict[str, Any]], httpx.Headers]:
+        """
+        Fetch every page for the given parameters.
+        Conditional `headers` are sent with the first page only; a 304 returns no pages.
+
+        Returns:
+            Tuple[List[Dict], httpx.Headers]: (page bodies in order, first page response headers)
+        """
+        client = self._get_client()
+        first_response = await self._request_page(client, params, 1, headers)
+        if first_response.status_code == httpx.codes.NOT_MODIFIED:
+            return [], first_response.headers
+        first_page = first_response.json()
+
+        total_pages = self._total_pages(first_page)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded_get(page):
+            async with semaphore:
+                return await self._get_page(client, params, page)
+
+        remaining_pages = await asyncio.gather(*(bounded_get(page) for page in range(2, total_pages + 1)))
+        logger.info(f"Fetched {1 + len(remaining_pages)} page(s) from {self.base_url}")
+        return [first_page, *remaining_pages], first_response.headers
+
+    def fetch_all(self, params: Dict[str, Any], headers: Dict[str, str] = None) -> Dict[str, Any]:
+        """
+        Sync wrapper: fetch every page and merge them into a single response dict.
+        The result carries the upstream validators (etag, last_modified) and the last
+        page's nextCursor; `not_modified` is True when the upstream answered 304.
+        """
+        pages, response_headers = run_sync(self.fetch_pages(params, headers))
+        validators = self._validators(response_headers)
+        if not pages:
+            return {'status': 'not_modified', 'totalResults': 0, 'items': [], 'not_modified': True, **validators}
+
+        items = [item for page in pages for item in page.get('items', [])]
+        return {
+            'status': pages[0].get('status', 'unknown'),
+            'totalResults': pages[0].get('totalResults', len(items)),
+            'items': items,
+            'nextCursor': pages[-1].get('nextCursor'),
+            'not_modified': False,
+            **validators,
+        }
+
+    @staticmethod
+    def _validators(response_headers: httpx.Headers) -> Dict[str, Any]:
+        return {
+            'etag': response_headers.get('etag'),
+            'last_modified': response_headers.get('last-modified'),
+        }
+
+    async def _produce_pages(self, params: Dict[str, Any], page_queue: asyncio.Queue,
+                             headers: Dict[str, str] = None) -> None:
+        """
+        Push page bodies onto a bounded queue as they arrive.
+        Workers block on a full queue, so at most `max_concurrency` pages are in flight
+        plus whatever the queue holds, however many pages the upstream has.
+        """
+        cancelled = False
+        try:
+            client = self._get_client()
+            first_response = await self._request_page(client, params, 1, headers)
+            validators = self._validators(first_response.headers)
+            if first_response.status_code == httpx.codes.NOT_MODIFIED:
+                await page_queue.put({'not_modified': True, **validators})
+                return
+            first_page = first_response.json()
+            await page_queue.put({**first_page, 'not_modified': False, **validators})
+            next_pages = iter(range(2, self._total_pages(first_page) + 1))
+
+            async def worker():
+                for page in next_pages:
+                    await page_queue.put(await self._get_page(client, params, page))
+
+            workers = [asyncio.ensure_future(worker()) for _ in range(self.max_concurrency)]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                for task in workers:
+                    task.cancel()
+                raise
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        finally:
+            # A cancelling consumer has stopped reading, so a put on a full queue would
+            # never return and the task would leak on the fetch loop
+            if not cancelled:
+                await page_queue.put(None)
+
+    def stream_pages(self, params: Dict[str, Any], max_buffered_pages: int = None,
+                     headers: Dict[str, str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Sync generator yielding page bodies in arrival order.
+        Fetching continues on the fetch loop while the caller processes each page.
+        Conditional `headers` are sent with the first page only. The first page carries the
+        upstream validators (etag, last_modified) and `not_modified`; after a 304 it is the
+        only page and has no body.
+        """
+        page_queue = asyncio.Queue(maxsize=max_buffered_pages or self.max_concurrency)
+        producer = asyncio.run_coroutine_threadsafe(self._produce_pages(params, page_queue, headers), _get_loop())
+        try:
+            while True:
+                page = run_sync(page_queue.get())
+                if page is None:
+                    break
+                yield page
+            # Re-raise any error from the producer once the queue is drained
+            producer.result()
+        finally:
+            producer.cancel()
@@ -0,0 +1,116 @@
+"""Example of a cluster-wide token-bucket rate limiter for outbound API calls."""
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from django.conf import settings
+
+from .example_of_redis_client import get_redis_client
+
+# Refill, reserve and report the wait in one atomic step, using the Redis clock so
+# workers on different hosts agree on time. Reserving lets the bucket go negative:
+# each caller sleeps exactly until its own token is due, which spaces requests evenly
+# at the quota instead of having every waiter wake up and race for the next token.
+# `updated_at` may lie in the future while the bucket is blocked; refill starts from there.
+# Returns the wait as a string because Lua numbers are truncated to integers in replies.
+_ACQUIRE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local updated_at = tonumber(state[2]) or now
+local tokens = tonumber(state[1]) or capacity
+local start = math.max(now, updated_at)
+tokens = math.min(capacity, tokens + (start - updated_at) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', start)
+redis.call('EXPIRE', KEYS[1], math.ceil(start - now + capacity / rate) + 60)
+return tostring(start - now + math.max(-tokens, 0) / rate)
+"""
+
+# Push the refill start to now + ARGV[1] seconds and drain the bucket, never shortening an existing block
+_BLOCK_SCRIPT = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local blocked_until = math.max(now + tonumber(ARGV[1]), tonumber(state[2]) or now)
+local tokens = math.min(tonumber(state[1]) or 0, 0)
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', blocked_until)
+redis.call('EXPIRE', KEYS[1], math.ceil(blocked_until - now) + 60)
+return tostring(blocked_until - now)
+"""
+
+# Buckets used when the cache is not Redis (e.g. local development and tests)
+_local_buckets: Dict[str, Dict[str, float]] = {}
+_local_lock = threading.Lock()
+
+
+class ExampleOfTokenBucketLimiter:
+    """
+    Example of a token bucket shared by every worker that calls the same upstream.
+
+    `acquire()` reserves one token and returns how long the caller must sleep before
+    sending its request (0 when a token was available). `block_for()` pauses the
+    whole bucket, e.g. for the duration of an upstream `Retry-After`.
+    """
+
+    def __init__(self, name: str, rate: float = None, burst: int = None):
+        self.key = f'example:rate-limit:{name}'
+        self.rate = rate or settings.EXAMPLE_FETCH_RATE_LIMIT
+        self.burst = burst or settings.EXAMPLE_FETCH_RATE_BURST
+        self.redis = get_redis_client()
+        if self.redis is not None:
+            self._acquire_script = self.redis.register_script(_ACQUIRE_SCRIPT)
+            self._block_script = self.redis.register_script(_BLOCK_SCRIPT)
+
+    def _local_bucket(self, now: float) -> Dict[str, float]:
+        return _local_buckets.setdefault(self.key, {'tokens': self.burst, 'updated_at': now})
+
+    def acquire(self) -> float:
+        """Reserve one token and return the number of seconds to wait before using it."""
+        if self.redis is not None:
+            return float(self._acquire_script(keys=[self.key], args=[self.rate, self.burst]))
+
+        with _local_lock:
+            now = time.monotonic()
+            bucket = self._local_bucket(now)
+            start = max(now, bucket['updated_at'])
+            tokens = min(self.burst, bucket['tokens'] + (start - bucket['updated_at']) * self.rate) - 1
+            bucket.update(tokens=tokens, updated_at=start)
+            return start - now + max(-tokens, 0) / self.rate
+
+    def block_for(self, seconds: float) -> float:
+        """Pause the bucket for every worker for at least `seconds`. Returns the remaining block."""
+        if self.redis is not None:
+            return float(self._block_script(keys=[self.key], args=[seconds]))
+
+        with _local_lock:
+            now = time.monotonic()
+            bucket = self._local_bucket(now)
+            blocked_until = max(now + seconds, bucket['updated_at'])
+            bucket.update(tokens=min(bucket['tokens'], 0), updated_at=blocked_until)
+            return blocked_until - now
+
+    def reset(self) -> None:
+        """Forget the bucket state, returning it to a full burst."""
+        if self.redis is None:
+            with _local_lock:
+                _local_buckets.pop(self.key, None)
+        else:
+            self.redis.delete(self.key)
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None."""
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(retry_at.timestamp() - time.time(), 0.0)
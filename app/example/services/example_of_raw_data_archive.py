@@ -0,0 +1,111 @@
+"""Example of an append-only, compressed and indexed archive for raw API payloads."""
+import fcntl
+import gzip
+import json
+import mmap
+import os
+import re
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+
+# Archive locations look like "segment-000001.jsonl.gz:<offset>:<length>"
+LOCATION_PATTERN = re.compile(r'^(?P<segment>segment-\d+\.jsonl\.gz):(?P<offset>\d+):(?P<length>\d+)$')
+
+
+class ExampleOfRawDataArchive:
+    """
+    Example of a raw-data archive made of append-only JSONL segment files.
+
+    Every record is written as its own gzip member, so a segment is still a valid
+    .jsonl.gz file (zcat works), yet a single record can be read back by slicing its
+    bytes out of a memory-mapped segment and decompressing only that slice.
+    Each segment has a sidecar .idx file with one "<fetch_log_id> <offset> <length>" line per record.
+    """
+
+    def __init__(self, archive_dir: str = None, segment_max_bytes: int = None):
+        self.archive_dir = str(archive_dir or settings.EXAMPLE_RAW_DATA_DIR)
+        self.segment_max_bytes = segment_max_bytes or settings.EXAMPLE_RAW_DATA_SEGMENT_BYTES
+
+    def _segment_names(self) -> list:
+        if not os.path.isdir(self.archive_dir):
+            return []
+        return sorted(name for name in os.listdir(self.archive_dir) if name.endswith('.jsonl.gz'))
+
+    def _current_segment(self) -> str:
+        """Return the segment to append to, rolling over once it reaches segment_max_bytes."""
+        segments = self._segment_names()
+        if segments:
+            latest = segments[-1]
+            if os.path.getsize(os.path.join(self.archive_dir, latest)) < self.segment_max_bytes:
+                return latest
+            number = int(latest.split('-')[1].split('.')[0]) + 1
+        else:
+            number = 1
+        return f"segment-{number:06d}.jsonl.gz"
+
+    def append(self, fetch_log_id: int, payload: Dict[str, Any]) -> str:
+        """Append a payload for a fetch log and return its archive location."""
+        record = json.dumps({
+            'fetch_log_id': fetch_log_id,
+            'captured_at': timezone.now().isoformat(),
+            'payload': payload,
+        }, ensure_ascii=False, separators=(',', ':')) + '\n'
+        blob = gzip.compress(record.encode('utf-8'))
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        # Serialize appenders across processes so offsets never interleave
+        with open(os.path.join(self.archive_dir, '.lock'), 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                segment = self._current_segment()
+                segment_path = os.path.join(self.archive_dir, segment)
+                with open(segment_path, 'ab') as f:
+                    offset = f.tell()
+                    f.write(blob)
+                with open(segment_path[:-len('.jsonl.gz')] + '.idx', 'a') as index_file:
+                    index_file.write(f"{fetch_log_id} {offset} {len(blob)}\n")
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+        return f"{segment}:{offset}:{len(blob)}"
+
+    def parse_location(self, location: str) -> Optional[Tuple[str, int, int]]:
+        """Split an archive location into (segment path, offset, length), or None if it is not one."""
+        match = LOCATION_PATTERN.match(location or '')
+        if not match:
+            return None
+        return (
+            os.path.join(self.archive_dir, match['segment']),
+            int(match['offset']),
+            int(match['length']),
+        )
+
+    def read(self, location: str) -> Dict[str, Any]:
+        """Return the archived record at a location, decompressing only that record."""
+        parsed = self.parse_location(location)
+        if parsed is None:
+            # Legacy per-fetch JSON files written before the archive existed
+            with open(location, encoding='utf-8') as f:
+                return {'fetch_log_id': None, 'captured_at': None, 'payload': json.load(f)}
+
+        segment_path, offset, length = parsed
+        with open(segment_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            blob = mapped[offset:offset + length]
+        return json.loads(gzip.decompress(blob))
+
+    def read_payload(self, location: str) -> Dict[str, Any]:
+        """Return only the archived API payload at a location."""
+        return self.read(location)['payload']
+
+    def iter_index(self) -> Iterator[Tuple[int, str]]:
+        """Yield (fetch_log_id, location) for every archived record, oldest first."""
+        for segment in self._segment_names():
+            index_path = os.path.join(self.archive_dir, segment[:-len('.jsonl.gz')] + '.idx')
+            if not os.path.exists(index_path):
+                continue
+            with open(index_path) as index_file:
+                for line in index_file:
+                    fetch_log_id, offset, length = line.split()
+                    yield int(fetch_log_id), f"{segment}:{offset}:{length}"
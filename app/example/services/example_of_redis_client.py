@@ -0,0 +1,10 @@
+"""Example of access to the raw Redis client behind the default cache."""
+from django.conf import settings
+
+
+def get_redis_client():
+    """Return the raw Redis client behind the default cache, or None if the cache is not Redis."""
+    if 'django_redis' not in settings.CACHES['default']['BACKEND']:
+        return None
+    from django_redis import get_redis_connection
+    return get_redis_connection('default')
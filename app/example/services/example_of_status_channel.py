@@ -0,0 +1,118 @@
+"""Example of a pub/sub channel carrying summary status transitions to waiting clients."""
+import asyncio
+import json
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .example_of_redis_client import get_redis_client
+
+# Subscribers used when the cache is not Redis (e.g. local development and tests)
+_local_subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+_local_lock = threading.Lock()
+
+
+class ExampleOfStatusChannel:
+    """
+    Example of a status channel per (item, processing model) backed by Redis pub/sub.
+
+    Workers call `publish()` after each status transition; the SSE endpoint holds one
+    `subscribe()` per waiting client, so clients wait on Redis instead of polling the database.
+    Without Redis, messages are delivered in-process only.
+    """
+
+    TERMINAL_STATUSES = ('completed', 'failed')
+    PAYLOAD_FIELDS = (
+        'id', 'status', 'task_id', 'summary_text', 'word_count', 'processing_cost', 'completed_at', 'error_message',
+    )
+
+    @staticmethod
+    def channel_name(item_id: int, processing_model: str) -> str:
+        return f'example:summary-status:{item_id}:{processing_model}'
+
+    @classmethod
+    def payload(cls, summary) -> Dict[str, Any]:
+        """Status message for a summary instance or a `.values()` row of it."""
+        if isinstance(summary, dict):
+            data = {field: summary.get(field) for field in cls.PAYLOAD_FIELDS}
+            data['item_id'] = summary.get('example_item_id')
+            data['processing_model'] = summary.get('processing_model')
+        else:
+            data = {field: getattr(summary, field) for field in cls.PAYLOAD_FIELDS}
+            data['item_id'] = summary.example_item_id
+            data['processing_model'] = summary.processing_model
+        return data
+
+    @classmethod
+    def publish(cls, summary) -> None:
+        """Publish the current status of a summary to everyone waiting on it."""
+        data = cls.payload(summary)
+        message = json.dumps(data, cls=DjangoJSONEncoder)
+        channel = cls.channel_name(data['item_id'], data['processing_model'])
+
+        redis = get_redis_client()
+        if redis is not None:
+            redis.publish(channel, message)
+            return
+
+        with _local_lock:
+            subscribers = list(_local_subscribers.get(channel, []))
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, message)
+
+    @classmethod
+    @asynccontextmanager
+    async def subscribe(cls, item_id: int, processing_model: str) -> AsyncIterator[asyncio.Queue]:
+        """
+        Subscribe to a status channel, yielding a queue of decoded messages.
+        The subscription is active once the context is entered, so a status read after
+        entering it cannot miss a transition published in between.
+        """
+        channel = cls.channel_name(item_id, processing_model)
+        queue: asyncio.Queue = asyncio.Queue()
+
+        if get_redis_client() is None:
+            entry = (asyncio.get_running_loop(), queue)
+            with _local_lock:
+                _local_subscribers.setdefault(channel, []).append(entry)
+            try:
+                yield _DecodingQueue(queue)
+            finally:
+                with _local_lock:
+                    _local_subscribers[channel].remove(entry)
+                    if not _local_subscribers[channel]:
+                        del _local_subscribers[channel]
+            return
+
+        import redis.asyncio as redis_asyncio
+
+        location = settings.CACHES['default']['LOCATION']
+        client = redis_asyncio.from_url(location[0] if isinstance(location, (list, tuple)) else location)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(channel)
+
+        async def reader():
+            async for message in pubsub.listen():
+                await queue.put(message['data'])
+
+        reader_task = asyncio.ensure_future(reader())
+        try:
+            yield _DecodingQueue(queue)
+        finally:
+            reader_task.cancel()
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
+            await client.aclose()
+
+
+class _DecodingQueue:
+    """Queue wrapper returning messages as dicts."""
+
+    def __init__(self, queue: asyncio.Queue):
+        self._queue = queue
+
+    async def get(self) -> Dict[str, Any]:
+        return json.loads(await self._queue.get())
@@ -0,0 +1,145 @@
+"""Example of a content-addressed cache for generated summaries."""
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from example.models import ExampleOfArticle, ExampleOfSummaryCacheEntry
+
+# Cached (summary_text, processing_cost) pair
+CachedSummary = Tuple[str, Decimal]
+
+
+class ExampleOfSummaryCache:
+    """
+    Example of a summary cache keyed by what the model actually sees.
+
+    The key is the article's content hash (ExampleOfArticle.content_hash, over the normalized
+    title and content) plus the processing model and max_words, so syndicated copies of an
+    article under different URLs share one entry.
+    Entries live in the default (Redis) cache with a TTL and, when `use_db` is enabled, in
+    ExampleOfSummaryCacheEntry so they survive cache eviction. Hits, misses and the credits
+    that hits saved are counted in the cache; see `stats()`.
+    A separate `key_prefix` with `record_stats=False` keeps other entries, such as partial
+    summaries of chunks, apart from the article entries and their stats.
+    """
+
+    STATS_KEY_PREFIX = 'example:summary-cache:stats'
+    STATS_FIELDS = ('hits', 'misses', 'credits_saved')
+    # Credits are counted in ten-thousandths, the precision of ExampleOfSummary.processing_cost
+    CREDIT_UNITS = 10000
+
+    def __init__(self, ttl: int = None, use_db: bool = None, key_prefix: str = 'example:summary-cache',
+                 record_stats: bool = True):
+        self.ttl = ttl or settings.EXAMPLE_SUMMARY_CACHE_TTL
+        self.use_db = settings.EXAMPLE_SUMMARY_CACHE_DB if use_db is None else use_db
+        self.key_prefix = key_prefix
+        self.record_stats = record_stats
+
+    @staticmethod
+    def content_hash(title: str, content: str) -> str:
+        """Cache key hash for text that is not stored on an article."""
+        return ExampleOfArticle.compute_content_hash(title, content)
+
+    def _key(self, content_hash: str, processing_model: str, max_words: int) -> str:
+        return f'{self.key_prefix}:{processing_model}:{max_words}:{content_hash}'
+
+    def get_many(self, hashes: Sequence[str], processing_model: str,
+                 max_words: int) -> List[Optional[CachedSummary]]:
+        """Look up content hashes, returning the cached summary or None for each, in order."""
+        keys = {content_hash: self._key(content_hash, processing_model, max_words) for content_hash in hashes}
+        cached = cache.get_many(list(keys.values()))
+        found: Dict[str, CachedSummary] = {
+            content_hash: (cached[key]['summary_text'], Decimal(cached[key]['processing_cost']))
+            for content_hash, key in keys.items() if key in cached
+        }
+
+        missing = [content_hash for content_hash in keys if content_hash not in found]
+        if missing and self.use_db:
+            durable = {
+                content_hash: (summary_text, processing_cost)
+                for content_hash, summary_text, processing_cost in ExampleOfSummaryCacheEntry.objects.filter(
+                    content_hash__in=missing, processing_model=processing_model, max_words=max_words
+                ).values_list('content_hash', 'summary_text', 'processing_cost')
+            }
+            # Warm Redis again for entries it had evicted
+            self._cache_set_many(durable, processing_model, max_words)
+            found.update(durable)
+
+        results = [found.get(content_hash) for content_hash in hashes]
+        hits = [result for result in results if result is not None]
+        self._record(hits=len(hits), misses=len(results) - len(hits), credits_saved=sum(cost for _, cost in hits))
+        return results
+
+    def get(self, content_hash: str, processing_model: str, max_words: int) -> Optional[CachedSummary]:
+        return self.get_many([content_hash], processing_model, max_words)[0]
+
+    def _cache_set_many(self, entries: Dict[str, CachedSummary], processing_model: str, max_words: int) -> None:
+        if entries:
+            cache.set_many({
+                self._key(content_hash, processing_model, max_words): {
+                    'summary_text': summary_text,
+                    'processing_cost': str(processing_cost),
+                }
+                for content_hash, (summary_text, processing_cost) in entries.items()
+            }, timeout=self.ttl)
+
+    def set_many(self, entries: Sequence[Tuple[str, str, Decimal]], processing_model: str,
+                 max_words: int) -> None:
+        """Store (content_hash, summary_text, processing_cost) tuples."""
+        by_hash = {
+            content_hash: (summary_text, Decimal(str(processing_cost)))
+            for content_hash, summary_text, processing_cost in entries
+        }
+        self._cache_set_many(by_hash, processing_model, max_words)
+        if self.use_db and by_hash:
+            ExampleOfSummaryCacheEntry.objects.bulk_create(
+                [
+                    ExampleOfSummaryCacheEntry(
+                        content_hash=content_hash,
+                        processing_model=processing_model,
+                        max_words=max_words,
+                        summary_text=summary_text,
+                        processing_cost=processing_cost,
+                    )
+                    for content_hash, (summary_text, processing_cost) in by_hash.items()
+                ],
+                ignore_conflicts=True,
+            )
+
+    def set(self, content_hash: str, processing_model: str, max_words: int,
+            summary_text: str, processing_cost: Decimal) -> None:
+        self.set_many([(content_hash, summary_text, processing_cost)], processing_model, max_words)
+
+    def _record(self, hits: int, misses: int, credits_saved: Decimal) -> None:
+        if not self.record_stats:
+            return
+        increments = {
+            'hits': hits,
+            'misses': misses,
+            'credits_saved': int(round(credits_saved * self.CREDIT_UNITS)),
+        }
+        for field, amount in increments.items():
+            if amount:
+                key = f'{self.STATS_KEY_PREFIX}:{field}'
+                # Counters never expire; add() is a no-op once the key exists
+                cache.add(key, 0, timeout=None)
+                cache.incr(key, amount)
+
+    @classmethod
+    def stats(cls) -> Dict[str, object]:
+        """Hit/miss counters, hit rate and credits saved since the last reset."""
+        values = cache.get_many([f'{cls.STATS_KEY_PREFIX}:{field}' for field in cls.STATS_FIELDS])
+        hits, misses, credits_saved = (values.get(f'{cls.STATS_KEY_PREFIX}:{field}', 0) for field in cls.STATS_FIELDS)
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'credits_saved': Decimal(credits_saved) / cls.CREDIT_UNITS,
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        cache.delete_many([f'{cls.STATS_KEY_PREFIX}:{field}' for field in cls.STATS_FIELDS])
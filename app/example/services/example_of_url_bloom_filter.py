@@ -0,0 +1,115 @@
+"""Example of a Redis-backed Bloom filter used as a pre-check for article URL deduplication."""
+import hashlib
+import math
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+
+from .example_of_redis_client import get_redis_client
+
+# Bitmaps used when the cache is not Redis (e.g. local development and tests)
+_local_bitmaps: Dict[str, bytearray] = {}
+
+
+class ExampleOfUrlBloomFilter:
+    """
+    Example of a Bloom filter over ExampleOfArticle.url, stored as a Redis bitmap.
+
+    `contains_many()` answers "definitely absent" or "maybe present" per URL, so ingest
+    only needs to query the database for the maybe-present ones. The filter is consulted
+    only once it has been built (see example_of_url_bloom_command); until then every URL is
+    reported as maybe present and ingest falls back to the database.
+    """
+
+    def __init__(self, capacity: int = None, error_rate: float = None, key: str = None):
+        self.capacity = capacity or settings.EXAMPLE_URL_BLOOM_CAPACITY
+        self.error_rate = error_rate or settings.EXAMPLE_URL_BLOOM_ERROR_RATE
+        self.key = key or settings.EXAMPLE_URL_BLOOM_KEY
+        # Optimal bit count and hash count for the requested capacity and false-positive rate
+        self.num_bits = math.ceil(-self.capacity * math.log(self.error_rate) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.redis = get_redis_client()
+
+    def _positions(self, url: str) -> List[int]:
+        """Bit positions for a URL, using double hashing over one 128-bit digest."""
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def is_ready(self) -> bool:
+        """Whether the filter has been built and can be trusted for negatives."""
+        if self.redis is None:
+            return self.key in _local_bitmaps
+        return bool(self.redis.exists(self.key))
+
+    def _set_bits(self, key: str, urls: Iterable[str]) -> None:
+        if self.redis is None:
+            bitmap = _local_bitmaps.setdefault(key, bytearray(math.ceil(self.num_bits / 8)))
+            for url in urls:
+                for position in self._positions(url):
+                    bitmap[position >> 3] |= 0x80 >> (position & 7)
+            return
+
+        pipeline = self.redis.pipeline(transaction=False)
+        for url in urls:
+            for position in self._positions(url):
+                pipeline.setbit(key, position, 1)
+        pipeline.execute()
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        """Add URLs to a built filter. No-op before the first build, so a partial filter is never trusted."""
+        if self.is_ready():
+            self._set_bits(self.key, urls)
+
+    def contains_many(self, urls: List[str]) -> List[bool]:
+        """Return False for URLs that are definitely absent and True for those that may be present."""
+        if not urls or not self.is_ready():
+            return [True] * len(urls)
+
+        positions = [self._positions(url) for url in urls]
+        if self.redis is None:
+            bitmap = _local_bitmaps[self.key]
+            bits = [bitmap[p >> 3] & (0x80 >> (p & 7)) for url_positions in positions for p in url_positions]
+        else:
+            pipeline = self.redis.pipeline(transaction=False)
+            for url_positions in positions:
+                for position in url_positions:
+                    pipeline.getbit(self.key, position)
+            bits = pipeline.execute()
+
+        return [
+            all(bits[index * self.num_hashes:(index + 1) * self.num_hashes])
+            for index in range(len(urls))
+        ]
+
+    def rebuild(self, urls: Iterable[str], batch_size: int = 10000) -> int:
+        """Build a fresh filter from all URLs and swap it in atomically. Returns the URL count."""
+        building_key = f'{self.key}:building'
+        self.clear(building_key)
+        count = 0
+        batch = []
+        for url in urls:
+            batch.append(url)
+            if len(batch) >= batch_size:
+                self._set_bits(building_key, batch)
+                count += len(batch)
+                batch = []
+        self._set_bits(building_key, batch)
+        count += len(batch)
+
+        if self.redis is None:
+            _local_bitmaps[self.key] = _local_bitmaps.pop(building_key)
+        else:
+            # An empty table leaves no bits set; still create the key so the filter counts as built
+            self.redis.setbit(building_key, self.num_bits - 1, 0)
+            self.redis.rename(building_key, self.key)
+        return count
+
+    def clear(self, key: Optional[str] = None) -> None:
+        """Drop a bitmap, returning the filter to its unbuilt state."""
+        key = key or self.key
+        if self.redis is None:
+            _local_bitmaps.pop(key, None)
+        else:
+            self.redis.delete(key)
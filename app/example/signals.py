@@ -0,0 +1,30 @@
+"""Example of model signal handlers for the example app."""
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from example.models import ExampleOfArticle, ExampleOfSummary
+
+
+@receiver(post_save, sender=ExampleOfArticle)
+def example_of_article_saved(sender, instance, created, **kwargs):
+    """Keep the URL Bloom filter current for articles created outside the bulk ingest path."""
+    if created and settings.EXAMPLE_URL_BLOOM_ENABLED:
+        from example.services import ExampleOfUrlBloomFilter
+        ExampleOfUrlBloomFilter().add_many([instance.url])
+
+
+@receiver(post_save, sender=ExampleOfArticle)
+@receiver(post_delete, sender=ExampleOfArticle)
+def example_of_article_changed(sender, instance, **kwargs):
+    """Start new response cache versions for the item and the list after any write."""
+    from example.services import ExampleOfItemResponseCache
+    ExampleOfItemResponseCache.invalidate([instance.pk])
+
+
+@receiver(post_save, sender=ExampleOfSummary)
+@receiver(post_delete, sender=ExampleOfSummary)
+def example_of_summary_changed(sender, instance, **kwargs):
+    """Drop the cached summary listing of the item whenever one of its summaries is written."""
+    from example.services import ExampleOfItemSummariesCache
+    ExampleOfItemSummariesCache.invalidate([instance.example_item_id])
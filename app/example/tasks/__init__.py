@@ -1,9 +1,20 @@
 # Example tasks package
 from .example_of_periodic_task import example_of_periodic_fetch_task, example_test_task
-from .example_of_async_task import example_of_async_processing_task
+from .example_of_async_task import example_of_async_processing_task, example_of_batch_processing_task
+from .example_of_fan_out_task import (
+    example_of_scheduled_fan_out_task,
+    example_of_source_fetch_task,
+    example_of_fan_out_callback_task,
+    example_of_fan_out_error_task,
+)
 
 __all__ = [
     'example_of_periodic_fetch_task',
     'example_test_task',
     'example_of_async_processing_task',
+    'example_of_batch_processing_task',
+    'example_of_scheduled_fan_out_task',
+    'example_of_source_fetch_task',
+    'example_of_fan_out_callback_task',
+    'example_of_fan_out_error_task',
 ] 
\ No newline at end of file
@@ -2,12 +2,42 @@ from celery import shared_task
 from django.utils import timezone
 from example.models import ExampleOfSummary
 from example.models import ExampleOfArticle
-from example.services import ExampleOfAiService
+from example.services import ExampleOfAiService, ExampleOfItemSummariesCache, ExampleOfStatusChannel
 import logging
 from django.contrib.auth import get_user_model
 
 logger = logging.getLogger(__name__)
 
+
+def _start_processing(item_ids, processing_model, task_id):
+    """Move pending summaries to in_progress and tell waiting clients."""
+    ExampleOfSummary.objects.filter(
+        example_item_id__in=item_ids, processing_model=processing_model, status='pending'
+    ).update(status='in_progress')
+    ExampleOfItemSummariesCache.invalidate(item_ids)
+    for item_id in item_ids:
+        ExampleOfStatusChannel.publish({
+            'example_item_id': item_id,
+            'processing_model': processing_model,
+            'status': 'in_progress',
+            'task_id': task_id,
+        })
+
+
+def _hold_for_retry(task, item_ids, processing_model):
+    """
+    Put summaries the service marked failed back to pending under this task while it
+    still has retries left, so no caller claims them and queues a second, paid-for task
+    during the countdown. Only the last attempt leaves them failed.
+    """
+    if task.request.retries >= task.max_retries:
+        return
+    ExampleOfSummary.objects.filter(
+        example_item_id__in=item_ids, processing_model=processing_model, status='failed'
+    ).update(status='pending', task_id=task.request.id, queued_at=timezone.now())
+    ExampleOfItemSummariesCache.invalidate(item_ids)
+
+
 @shared_task(bind=True, max_retries=3)
 def example_of_async_processing_task(self, item_id, processing_model=None, user_id=None, max_words=150):
     """
@@ -22,18 +52,57 @@ def example_of_async_processing_task(self, item_id, processing_model=None, user_
             user = User.objects.get(id=user_id)
         except User.DoesNotExist:
             user = None
+    service = ExampleOfAiService()
+    processing_model = processing_model or service.default_model
     try:
-        service = ExampleOfAiService()
-        service.process_item(
+        _start_processing([item_id], processing_model, self.request.id)
+        summary = service.process_item(
             item_id=item_id,
             processing_model=processing_model,
             user=user,
             max_words=max_words
         )
+        ExampleOfStatusChannel.publish(summary)
         logger.info(f"Processing completed for item {item_id}")
     except ExampleOfArticle.DoesNotExist:
         logger.error(f"Example item {item_id} not found for processing task.")
         # The service should handle status update if needed
     except Exception as e:
         logger.error(f"Error in example_of_async_processing_task for item {item_id}: {e}")
-        raise self.retry(exc=e, countdown=60) 
\ No newline at end of file
+        # The service has marked the summary failed; it stays pending while a retry is due
+        _hold_for_retry(self, [item_id], processing_model)
+        summary = ExampleOfSummary.objects.filter(example_item_id=item_id, processing_model=processing_model).first()
+        if summary:
+            ExampleOfStatusChannel.publish(summary)
+        raise self.retry(exc=e, countdown=60)
+
+
+@shared_task(bind=True, max_retries=3)
+def example_of_batch_processing_task(self, item_ids, processing_model=None, user_id=None, max_words=150):
+    """
+    Example of a Celery task that processes a list of items with one batched service call.
+    Items completed by an earlier attempt are skipped by the service, so retries only redo the rest.
+    """
+    user = None
+    if user_id:
+        User = get_user_model()
+        user = User.objects.filter(id=user_id).first()
+    service = ExampleOfAiService()
+    processing_model = processing_model or service.default_model
+    try:
+        _start_processing(item_ids, processing_model, self.request.id)
+        summaries = service.process_items(
+            item_ids=item_ids,
+            processing_model=processing_model,
+            user=user,
+            max_words=max_words
+        )
+        for summary in summaries.values():
+            ExampleOfStatusChannel.publish(summary)
+        failed = [item_id for item_id, summary in summaries.items() if summary.status == 'failed']
+        logger.info(f"Batch processing completed for {len(summaries)} item(s), {len(failed)} failed")
+        return {'processed': len(summaries), 'failed': failed}
+    except Exception as e:
+        logger.error(f"Error in example_of_batch_processing_task for {len(item_ids)} item(s): {e}")
+        _hold_for_retry(self, item_ids, processing_model)
+        raise self.retry(exc=e, countdown=60)
@@ -0,0 +1,158 @@
+from celery import shared_task, chord
+from django.conf import settings
+from django.core.cache import cache
+from example.models import ExampleOfFetchLog
+from example.services import ExampleOfExternalApiService
+from example.services.example_of_redis_client import get_redis_client
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Decrement only a counter that still exists; DECR on an expired key would create it at -1
+_RELEASE_SLOT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('DECR', KEYS[1])
+end
+return 0
+"""
+
+
+def _source_slots_key(source):
+    return f'example:fetch-slots:{source}'
+
+
+def _acquire_slot(slots_key):
+    """
+    Take a fetch slot and return the number of slots now in use.
+    Every acquire refreshes the TTL, so the counter of a busy source cannot expire under
+    running fetches; slots leaked by killed workers are recovered once the source goes
+    quiet for CELERY_TASK_TIME_LIMIT.
+    """
+    redis = get_redis_client()
+    if redis is not None:
+        pipeline = redis.pipeline()
+        pipeline.incr(slots_key)
+        pipeline.expire(slots_key, settings.CELERY_TASK_TIME_LIMIT)
+        return pipeline.execute()[0]
+
+    # Caches without Redis (local development and tests)
+    cache.add(slots_key, 0, timeout=settings.CELERY_TASK_TIME_LIMIT)
+    try:
+        in_use = cache.incr(slots_key)
+    except ValueError:
+        cache.set(slots_key, 1, timeout=settings.CELERY_TASK_TIME_LIMIT)
+        return 1
+    cache.touch(slots_key, timeout=settings.CELERY_TASK_TIME_LIMIT)
+    return in_use
+
+
+def _release_slot(slots_key):
+    """Give a slot back; a counter that already expired is left alone."""
+    redis = get_redis_client()
+    if redis is not None:
+        redis.eval(_RELEASE_SLOT_SCRIPT, 1, slots_key)
+        return
+    try:
+        cache.decr(slots_key)
+    except ValueError:
+        pass
+
+
+@shared_task(bind=True)
+def example_of_scheduled_fan_out_task(self, source_configs=None):
+    """
+    Example of a scheduler task that fans a list of source/query configs out as a Celery group.
+    Each config becomes its own fetch task, so sources spread across workers instead of
+    running back to back inside one task; a chord callback aggregates the results.
+    """
+    source_configs = source_configs if source_configs is not None else settings.EXAMPLE_FETCH_SOURCES
+
+    parent_log = ExampleOfFetchLog.objects.create(
+        source='ExampleFanOut',
+        status=ExampleOfFetchLog.Status.IN_PROGRESS,
+        query_params={'sources': source_configs},
+        metadata={'service_class': 'ExampleOfScheduledFanOut', 'children': len(source_configs)},
+    )
+
+    if not source_configs:
+        parent_log.complete(status=ExampleOfFetchLog.Status.SUCCESS)
+        return {'parent_log_id': parent_log.id, 'children': 0}
+
+    header = [example_of_source_fetch_task.s(config) for config in source_configs]
+    callback = example_of_fan_out_callback_task.s(parent_log.id)
+    # A failed chord never runs the callback, so the errback closes the parent log instead
+    callback.link_error(example_of_fan_out_error_task.s(parent_log.id))
+    chord(header)(callback)
+
+    logger.info(f"Fanned out {len(source_configs)} fetch task(s) under fetch log {parent_log.id}")
+    return {'parent_log_id': parent_log.id, 'children': len(source_configs)}
+
+
+@shared_task(bind=True, max_retries=30)
+def example_of_source_fetch_task(self, config):
+    """
+    Example of a per-source fetch task used as a chord header.
+    A cache counter caps concurrent fetches per source: when the source is saturated the
+    task re-queues itself instead of holding a worker, so a slow upstream cannot block the others.
+    Failures are returned as results rather than raised, so one bad source never cancels the chord.
+    """
+    source = config.get('source', 'ExampleService')
+    slots_key = _source_slots_key(source)
+    cap = config.get('max_concurrency', settings.EXAMPLE_FETCH_SOURCE_CONCURRENCY)
+
+    if _acquire_slot(slots_key) > cap:
+        _release_slot(slots_key)
+        try:
+            raise self.retry(countdown=settings.EXAMPLE_FETCH_SOURCE_RETRY_DELAY)
+        except self.MaxRetriesExceededError:
+            logger.error(f"Source {source} stayed saturated, giving up")
+            return {'source': source, 'status': 'failed', 'error': 'source concurrency limit reached'}
+
+    try:
+        service = ExampleOfExternalApiService()
+        result = service.fetch_and_save(config.get('query_params'), source=source)
+        return {
+            'source': source,
+            'status': 'success',
+            'fetch_log_id': result['fetch_log_id'],
+            'items_fetched': result['items_processed'],
+            'items_saved': result['items_saved'],
+            'duplicates_skipped': result['duplicates_skipped'],
+        }
+    except Exception as e:
+        logger.error(f"Fetch failed for source {source}: {e}")
+        return {'source': source, 'status': 'failed', 'error': str(e)}
+    finally:
+        _release_slot(slots_key)
+
+
+@shared_task
+def example_of_fan_out_callback_task(results, parent_log_id):
+    """Example of a chord callback that aggregates child results into the parent fetch log."""
+    parent_log = ExampleOfFetchLog.objects.get(id=parent_log_id)
+    failed = [result for result in results if result['status'] != 'success']
+
+    parent_log.complete(
+        status=ExampleOfFetchLog.Status.ERROR if results and len(failed) == len(results)
+        else ExampleOfFetchLog.Status.SUCCESS,
+        items_fetched=sum(result.get('items_fetched', 0) for result in results),
+        items_saved=sum(result.get('items_saved', 0) for result in results),
+        error_message='\n'.join(f"{result['source']}: {result['error']}" for result in failed),
+        metadata={
+            **parent_log.metadata,
+            'failed_sources': [result['source'] for result in failed],
+            'children_stats': results,
+        },
+    )
+    logger.info(f"Fan-out {parent_log_id} completed: {len(results) - len(failed)}/{len(results)} sources succeeded")
+    return {'parent_log_id': parent_log_id, 'failed': len(failed)}
+
+
+@shared_task
+def example_of_fan_out_error_task(request, exc, traceback, parent_log_id):
+    """Example of a chord errback that closes the parent fetch log when the chord fails."""
+    parent_log = ExampleOfFetchLog.objects.get(id=parent_log_id)
+    if parent_log.status != ExampleOfFetchLog.Status.IN_PROGRESS:
+        return
+    parent_log.complete(status=ExampleOfFetchLog.Status.ERROR, error_message=f"Fan-out failed: {exc}")
+    logger.error(f"Fan-out {parent_log_id} failed: {exc}")
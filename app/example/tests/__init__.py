@@ -11,9 +11,34 @@ from .example_of_serializer_tests import (
 )
 from .example_of_service_tests import (
     ExampleOfExternalApiServiceTest,
+    ExampleOfPaginatedFetcherTest,
+    ExampleOfRawDataArchiveTest,
+    ExampleOfFetchLogRecorderTest,
+    ExampleOfUrlBloomFilterTest,
+    ExampleOfTokenBucketLimiterTest,
+    ExampleOfAiBatchProcessingTest,
+    ExampleOfSummaryCacheTest,
+    ExampleOfMapReduceSummaryTest,
+    ExampleOfCostRollupTest,
+    ExampleOfItemSummariesCacheTest,
+    ExampleOfSingleFlightProcessingTest,
+    ExampleOfAiClientRegistryTest,
     ExampleOfAiServiceTest
 )
-from .example_of_integration_tests import ExampleOfIntegrationTest
+from .example_of_task_tests import ExampleOfFanOutTaskTest, ExampleOfSummaryRoutingTest
+from .example_of_integration_tests import (
+    ExampleOfIntegrationTest,
+    ExampleOfReplayCommandTest,
+    ExampleOfTextStatsCommandTest,
+    ExampleOfCursorPaginationTest,
+    ExampleOfItemResponseCacheTest,
+    ExampleOfConditionalGetTest,
+    ExampleOfSparseFieldsTest,
+    ExampleOfSearchTest,
+    ExampleOfBatchProcessingViewTest,
+    ExampleOfCostRollupViewTest,
+    ExampleOfStatusStreamTest
+)
 
 __all__ = [
     'ExampleOfArticleModelTest',
@@ -23,6 +48,30 @@ __all__ = [
     'ExampleOfReadonlySerializerTest',
     'ExampleOfModelSerializerTest',
     'ExampleOfExternalApiServiceTest',
+    'ExampleOfPaginatedFetcherTest',
+    'ExampleOfRawDataArchiveTest',
+    'ExampleOfFetchLogRecorderTest',
+    'ExampleOfUrlBloomFilterTest',
+    'ExampleOfTokenBucketLimiterTest',
+    'ExampleOfAiBatchProcessingTest',
+    'ExampleOfSummaryCacheTest',
+    'ExampleOfMapReduceSummaryTest',
+    'ExampleOfCostRollupTest',
+    'ExampleOfItemSummariesCacheTest',
+    'ExampleOfSingleFlightProcessingTest',
+    'ExampleOfAiClientRegistryTest',
     'ExampleOfAiServiceTest',
+    'ExampleOfFanOutTaskTest',
+    'ExampleOfSummaryRoutingTest',
     'ExampleOfIntegrationTest',
+    'ExampleOfReplayCommandTest',
+    'ExampleOfTextStatsCommandTest',
+    'ExampleOfCursorPaginationTest',
+    'ExampleOfItemResponseCacheTest',
+    'ExampleOfConditionalGetTest',
+    'ExampleOfSparseFieldsTest',
+    'ExampleOfSearchTest',
+    'ExampleOfBatchProcessingViewTest',
+    'ExampleOfCostRollupViewTest',
+    'ExampleOfStatusStreamTest',
 ] 
\ No newline at end of file
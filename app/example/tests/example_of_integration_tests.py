@@ -1,10 +1,36 @@
-from django.test import TestCase
+import json
+import os
+import tempfile
+from asgiref.sync import sync_to_async
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from django.core.cache import cache
+from unittest import skipIf, skipUnless
+from django.core.management import call_command
+from example.management.commands.example_of_pagination_benchmark_command import ExampleOfPaginationBenchmarkCommand
+from example.management.commands.example_of_replay_command import ExampleOfReplayCommand
+from example.management.commands.example_of_search_benchmark_command import ExampleOfSearchBenchmarkCommand
+from example.management.commands.example_of_search_vector_command import ExampleOfSearchVectorCommand
+from example.management.commands.example_of_text_stats_command import ExampleOfTextStatsCommand
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import TestCase, override_settings
 from django.urls import reverse
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
-from example.models import ExampleOfArticle, ExampleOfFetchLog, ExampleOfSummary
-from example.services import ExampleOfExternalApiService, ExampleOfAiService
+from example.models import ExampleOfArticle, ExampleOfCostRollup, ExampleOfFetchLog, ExampleOfSummary
+from example.services import (
+    ExampleOfExternalApiService,
+    ExampleOfAiService,
+    ExampleOfRawDataArchive,
+    ExampleOfStatusChannel
+)
+from example.tasks import example_of_async_processing_task
+from example.views import ExampleOfCachedListView
 from unittest.mock import patch
 from django.utils import timezone
 
@@ -169,4 +195,610 @@ class ExampleOfIntegrationTest(TestCase):
         
         self.assertEqual(fetch_log.status, ExampleOfFetchLog.Status.SUCCESS)
         self.assertEqual(fetch_log.items_saved, 4)
-        self.assertIsNotNone(fetch_log.completed_at) 
\ No newline at end of file
+        self.assertIsNotNone(fetch_log.completed_at) 
+
+
+class ExampleOfReplayCommandTest(TestCase):
+    def setUp(self):
+        self.archive_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.archive_dir.cleanup)
+        self.settings_override = override_settings(EXAMPLE_RAW_DATA_DIR=self.archive_dir.name)
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+
+        archive = ExampleOfRawDataArchive()
+        for index in range(3):
+            fetch_log = ExampleOfFetchLog.objects.create(source="Test Source", status=ExampleOfFetchLog.Status.SUCCESS)
+            fetch_log.raw_data_file = archive.append(fetch_log.id, {'items': [{
+                'title': f'Replayed Item {index}',
+                'content': 'Replayed content',
+                'url': f'http://example.com/replay{index}',
+                'publishedAt': timezone.now().isoformat(),
+                'source': {'name': 'Test Source'},
+            }]})
+            fetch_log.save(update_fields=['raw_data_file'])
+
+        ExampleOfArticle.objects.create(
+            title="Stale Title",
+            content="Replayed content",
+            url="http://example.com/replay0",
+            published_date=timezone.now(),
+            source="Test Source",
+            example_source="Test Client"
+        )
+
+    def test_replay_rebuilds_articles_and_resumes(self):
+        out = StringIO()
+        call_command(ExampleOfReplayCommand(), '--workers', '2', stdout=out)
+
+        self.assertEqual(ExampleOfArticle.objects.count(), 3)
+        self.assertEqual(ExampleOfArticle.objects.get(url="http://example.com/replay0").title, 'Replayed Item 0')
+        self.assertIn('items/s', out.getvalue())
+        self.assertTrue(os.path.exists(os.path.join(self.archive_dir.name, 'replay.checkpoint')))
+
+        # A second run resumes after the checkpoint and has nothing left to do
+        out = StringIO()
+        call_command(ExampleOfReplayCommand(), '--workers', '2', stdout=out)
+        self.assertIn('Replaying 0 fetch log(s)', out.getvalue())
+
+
+class ExampleOfTextStatsCommandTest(TestCase):
+    def setUp(self):
+        for index in range(5):
+            ExampleOfArticle.objects.create(
+                title=f"Backfill Item {index}",
+                content="word " * (index + 1),
+                url=f"http://example.com/backfill{index}",
+                published_date=timezone.now(),
+                source="Test Source",
+                example_source="Test Client"
+            )
+        # Rows ingested before the columns existed
+        ExampleOfArticle.objects.update(word_count=0, char_count=0, content_hash='')
+
+    def test_backfill_fills_stats_in_chunks(self):
+        out = StringIO()
+        call_command(ExampleOfTextStatsCommand(), '--batch-size', '2', stdout=out)
+
+        self.assertIn('Text statistics backfilled for 5 articles', out.getvalue())
+        for article in ExampleOfArticle.objects.all():
+            expected = ExampleOfArticle(title=article.title, content=article.content)
+            expected.update_text_stats()
+            self.assertEqual(
+                (article.word_count, article.char_count, article.content_hash),
+                (expected.word_count, expected.char_count, expected.content_hash),
+            )
+
+        # Filled rows are skipped on the next run
+        out = StringIO()
+        call_command(ExampleOfTextStatsCommand(), stdout=out)
+        self.assertIn('backfilled for 0 articles', out.getvalue())
+
+    def test_rows_not_backfilled_are_billed_by_their_content(self):
+        service = ExampleOfAiService()
+        single, batch = ExampleOfArticle.objects.order_by('id')[3:5]
+
+        summary = service.process_item(single.id, "example-model-v1")
+        summaries = service.process_items([batch.id], "example-model-lite")
+
+        summary.refresh_from_db()
+        summaries[batch.id].refresh_from_db()
+        self.assertEqual(summary.processing_cost, Decimal('0.004'))
+        self.assertEqual(summaries[batch.id].processing_cost, Decimal('0.005'))
+
+
+class ExampleOfCursorPaginationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(email='reader@example.com', password='readerpass123')
+        self.client.force_authenticate(user=self.user)
+        published_date = timezone.now() - timedelta(days=1)
+        for index in range(15):
+            ExampleOfArticle.objects.create(
+                title=f"Paged Article {index}",
+                content="Paged content",
+                url=f"http://example.com/paged{index}",
+                # Pairs of equal dates exercise the id tie-breaker
+                published_date=published_date + timedelta(hours=index // 2),
+                source="Test Source",
+                example_source="Test Client"
+            )
+
+    def test_cursor_mode_walks_every_item_once(self):
+        response = self.client.get(reverse('example-item-list'), {'pagination': 'cursor'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+        ids = [item['id'] for item in response.data['results']]
+
+        while response.data['next']:
+            response = self.client.get(response.data['next'])
+            ids += [item['id'] for item in response.data['results']]
+
+        expected = list(ExampleOfArticle.objects.order_by('-published_date', '-id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_page_number_mode_is_the_default(self):
+        response = self.client.get(reverse('example-item-list'), {'page': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 15)
+        self.assertEqual(len(response.data['results']), 5)
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command(ExampleOfPaginationBenchmarkCommand(), '--pages', '1,2,99', '--repeat', '1', stdout=out)
+        self.assertIn('15 articles, 10 per page', out.getvalue())
+        self.assertIn('skipped', out.getvalue())
+
+
+class ExampleOfItemResponseCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(
+            email='items-admin@example.com',
+            password='adminpass123',
+            is_staff=True,
+            is_superuser=True
+        )
+        self.client.force_authenticate(user=self.admin_user)
+        self.article = ExampleOfArticle.objects.create(
+            title="Cached Article",
+            content="Cached content",
+            url="http://example.com/cached",
+            published_date=timezone.now() - timedelta(days=1),
+            source="Test Source",
+            example_source="Test Client"
+        )
+        self.detail_url = reverse('example-item-detail', args=[self.article.id])
+
+    def test_responses_are_served_from_cache(self):
+        list_data = self.client.get(reverse('example-item-list')).data
+        detail_data = self.client.get(self.detail_url).data
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(reverse('example-item-list')).data, list_data)
+        # Only the row version is read, for the validators
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(self.detail_url).data, detail_data)
+
+    def test_writes_invalidate_list_and_detail(self):
+        self.client.get(reverse('example-item-list'))
+        self.client.get(self.detail_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(self.detail_url, {'title': "Edited Article"}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.client.get(self.detail_url).data['title'], "Edited Article")
+        self.assertEqual(self.client.get(reverse('example-item-list')).data['results'][0]['title'], "Edited Article")
+
+    def test_bulk_ingest_invalidates_list(self):
+        self.assertEqual(self.client.get(reverse('example-item-list')).data['count'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ExampleOfExternalApiService()._save_items([{
+                'title': 'Ingested Article',
+                'content': 'Ingested content',
+                'url': 'http://example.com/ingested',
+                'publishedAt': timezone.now().isoformat(),
+                'source': {'name': 'Test Source'},
+            }])
+
+        self.assertEqual(self.client.get(reverse('example-item-list')).data['count'], 2)
+
+
+class ExampleOfConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(
+            email='etag-admin@example.com',
+            password='adminpass123',
+            is_staff=True,
+            is_superuser=True
+        )
+        self.client.force_authenticate(user=self.admin_user)
+        self.article = ExampleOfArticle.objects.create(
+            title="Validated Article",
+            content="Validated content",
+            url="http://example.com/validated",
+            published_date=timezone.now() - timedelta(days=1),
+            source="Test Source",
+            example_source="Test Client"
+        )
+        self.list_url = reverse('example-item-list')
+        self.detail_url = reverse('example-item-detail', args=[self.article.id])
+
+    def test_matching_etag_returns_304_without_serializing(self):
+        list_response = self.client.get(self.list_url)
+        detail_response = self.client.get(self.detail_url)
+        self.assertTrue(list_response['ETag'].startswith('"'))
+        self.assertIn('Last-Modified', detail_response)
+
+        with patch.object(ExampleOfCachedListView, 'get_serializer') as get_serializer:
+            with self.assertNumQueries(0):
+                response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=list_response['ETag'])
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            with self.assertNumQueries(1):
+                response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=detail_response['ETag'])
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+            get_serializer.assert_not_called()
+
+    def test_etag_depends_on_query_parameters(self):
+        first = self.client.get(self.list_url)
+        response = self.client.get(self.list_url, {'min_words': 1}, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], first['ETag'])
+
+    def test_if_modified_since_returns_304(self):
+        response = self.client.get(self.detail_url)
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_write_changes_validators(self):
+        list_etag = self.client.get(self.list_url)['ETag']
+        detail_etag = self.client.get(self.detail_url)['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(self.detail_url, {'title': "Edited Article"}, format='json')
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=detail_etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], "Edited Article")
+
+    def test_unknown_item_is_404(self):
+        response = self.client.get(reverse('example-item-detail', args=[self.article.id + 1]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ExampleOfSparseFieldsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(
+            email='fields-admin@example.com',
+            password='adminpass123',
+            is_staff=True,
+            is_superuser=True
+        )
+        self.client.force_authenticate(user=self.admin_user)
+        self.article = ExampleOfArticle.objects.create(
+            title="Projected Article",
+            content="Projected content",
+            description="Projected description",
+            url="http://example.com/projected",
+            published_date=timezone.now() - timedelta(days=1),
+            source="Test Source",
+            example_source="Test Client"
+        )
+        self.list_url = reverse('example-item-list')
+        self.detail_url = reverse('example-item-detail', args=[self.article.id])
+
+    def test_list_defaults_to_summary_projection(self):
+        with CaptureQueriesContext(connection) as queries:
+            item = self.client.get(self.list_url).data['results'][0]
+
+        self.assertEqual(set(item), set(ExampleOfCachedListView.SUMMARY_FIELDS))
+        self.assertFalse(any('"content"' in query['sql'] for query in queries))
+
+    def test_retrieve_defaults_to_all_fields(self):
+        item = self.client.get(self.detail_url).data
+
+        self.assertEqual(item['content'], "Projected content")
+        self.assertEqual(item['description'], "Projected description")
+
+    def test_fields_and_omit(self):
+        item = self.client.get(self.list_url, {'fields': 'id,title,content'}).data['results'][0]
+        self.assertEqual(item, {'id': self.article.id, 'title': "Projected Article", 'content': "Projected content"})
+
+        item = self.client.get(self.detail_url, {'omit': 'content,description'}).data
+        self.assertNotIn('content', item)
+        self.assertEqual(item['title'], "Projected Article")
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get(self.list_url, {'fields': 'title,secret'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('secret', str(response.data['fields']))
+
+    def test_writes_return_all_fields(self):
+        response = self.client.patch(self.detail_url + '?fields=id', {'title': "Edited Article"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['content'], "Projected content")
+
+
+class ExampleOfSearchTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(email='search-user@example.com', password='userpass123')
+        self.client.force_authenticate(user=self.user)
+        self.search_url = reverse('example-item-search')
+        self.title_match = self._article("Solar power record", "Panels everywhere", 'title')
+        self.content_match = self._article("Energy news", "A new solar farm opened today", 'content')
+        self._article("Football results", "The match ended in a draw", 'other')
+
+    def _article(self, title, content, slug):
+        return ExampleOfArticle.objects.create(
+            title=title,
+            content=content,
+            url=f"http://example.com/search/{slug}",
+            published_date=timezone.now() - timedelta(days=1),
+            source="Test Source",
+            example_source="Test Client"
+        )
+
+    def test_query_is_required(self):
+        response = self.client.get(self.search_url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('q', response.data)
+
+    @skipIf(connection.vendor == 'postgresql', "Checks the non-PostgreSQL guard")
+    def test_benchmark_requires_postgresql(self):
+        with self.assertRaises(CommandError):
+            call_command(ExampleOfSearchBenchmarkCommand(), '--rows', '0')
+
+    @skipUnless(connection.vendor == 'postgresql', "Full-text search needs PostgreSQL")
+    def test_benchmark_deletes_seeded_articles(self):
+        out = StringIO()
+        call_command(
+            ExampleOfSearchBenchmarkCommand(), '--rows', '10', '--repeat', '1', '--batch-size', '4', stdout=out
+        )
+
+        self.assertIn('Deleted 7 seeded articles', out.getvalue())
+        self.assertEqual(ExampleOfArticle.objects.count(), 3)
+
+    @skipIf(connection.vendor == 'postgresql', "Checks the non-PostgreSQL guard")
+    def test_search_vector_backfill_requires_postgresql(self):
+        with self.assertRaises(CommandError):
+            call_command(ExampleOfSearchVectorCommand())
+
+    @skipUnless(connection.vendor == 'postgresql', "Full-text search needs PostgreSQL")
+    def test_search_vector_backfill_fills_missing_vectors(self):
+        # Rows written before the trigger existed
+        ExampleOfArticle.objects.update(search_vector=None)
+        out = StringIO()
+        call_command(ExampleOfSearchVectorCommand(), '--batch-size', '2', stdout=out)
+
+        self.assertIn('Search vectors backfilled for 3 articles', out.getvalue())
+        self.assertFalse(ExampleOfArticle.objects.filter(search_vector__isnull=True).exists())
+        results = self.client.get(self.search_url, {'q': 'solar'}).data['results']
+        self.assertEqual([item['id'] for item in results], [self.title_match.id, self.content_match.id])
+
+    @skipUnless(connection.vendor == 'postgresql', "Full-text search needs PostgreSQL")
+    def test_results_are_ranked(self):
+        results = self.client.get(self.search_url, {'q': 'solar'}).data['results']
+
+        self.assertEqual([item['id'] for item in results], [self.title_match.id, self.content_match.id])
+        self.assertGreater(results[0]['rank'], results[1]['rank'])
+        self.assertNotIn('content', results[0])
+
+    @skipUnless(connection.vendor == 'postgresql', "Full-text search needs PostgreSQL")
+    def test_results_are_keyset_paginated(self):
+        first = self.client.get(self.search_url, {'q': 'solar', 'page_size': 1}).data
+        second = self.client.get(first['next']).data
+
+        self.assertEqual(first['results'][0]['id'], self.title_match.id)
+        self.assertEqual(second['results'][0]['id'], self.content_match.id)
+        self.assertIsNone(second['next'])
+
+    @skipUnless(connection.vendor == 'postgresql', "Full-text search needs PostgreSQL")
+    def test_vector_follows_bulk_writes(self):
+        ExampleOfArticle.objects.filter(id=self.content_match.id).update(content="Wind turbines only")
+
+        results = self.client.get(self.search_url, {'q': 'solar'}).data['results']
+        self.assertEqual([item['id'] for item in results], [self.title_match.id])
+
+    @skipUnless(connection.vendor == 'postgresql', "Full-text search needs PostgreSQL")
+    def test_fuzzy_matches_title_typos(self):
+        self.assertEqual(self.client.get(self.search_url, {'q': 'Solr power'}).data['results'], [])
+
+        results = self.client.get(self.search_url, {'q': 'Solr power', 'fuzzy': 'true'}).data['results']
+        self.assertEqual(results[0]['id'], self.title_match.id)
+
+
+class ExampleOfBatchProcessingViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(
+            email='batch-admin@example.com',
+            password='adminpass123',
+            is_staff=True,
+            is_superuser=True
+        )
+        self.client.force_authenticate(user=self.admin_user)
+        self.articles = [
+            ExampleOfArticle.objects.create(
+                title=f"Batch View Article {index}",
+                content="Content to process.",
+                url=f"http://example.com/batch-view{index}",
+                published_date=timezone.now(),
+                source="Test Source",
+                example_source="Test Client"
+            )
+            for index in range(3)
+        ]
+
+    def test_batch_request_queues_one_task(self):
+        item_ids = [article.id for article in self.articles] + [999999]
+        with patch('example.tasks.example_of_batch_processing_task.apply_async') as apply_async:
+            response = self.client.post(reverse('example-process-batch'), {'item_ids': item_ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        apply_async.assert_called_once()
+        self.assertEqual([result['item_id'] for result in response.data['results']], item_ids[:3])
+        self.assertEqual(response.data['missing_item_ids'], [999999])
+
+    def test_completed_batch_returns_ok(self):
+        for article in self.articles:
+            ExampleOfSummary.objects.create(
+                example_item=article, processing_model='example-model-v1', status='completed'
+            )
+
+        with patch('example.tasks.example_of_batch_processing_task.apply_async') as apply_async:
+            response = self.client.post(
+                reverse('example-process-batch'), {'item_ids': [article.id for article in self.articles]}, format='json'
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        apply_async.assert_not_called()
+
+    def test_priority_is_passed_to_the_task(self):
+        with patch('example.tasks.example_of_batch_processing_task.apply_async') as apply_async:
+            response = self.client.post(
+                reverse('example-process-batch'),
+                {'item_ids': [self.articles[0].id], 'processing_model': 'example-model-lite', 'priority': 'high'},
+                format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(apply_async.call_args.kwargs['priority'], 0)
+
+        response = self.client.post(
+            reverse('example-process-batch'), {'item_ids': [self.articles[1].id], 'priority': 'urgent'}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_item_ids(self):
+        for payload in ({}, {'item_ids': []}, {'item_ids': 'abc'}, {'item_ids': ['x']}):
+            response = self.client.post(reverse('example-process-batch'), payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        with override_settings(EXAMPLE_AI_MAX_BATCH_ITEMS=2):
+            response = self.client.post(reverse('example-process-batch'), {'item_ids': [1, 2, 3]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ExampleOfCostRollupViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.admin_user = User.objects.create_user(
+            email='cost-admin@example.com',
+            password='adminpass123',
+            is_staff=True,
+            is_superuser=True
+        )
+        self.client.force_authenticate(user=self.admin_user)
+        self.hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        for processing_model, cost in (('example-model-pro', '1.5000'), ('example-model-lite', '0.2500')):
+            ExampleOfCostRollup.objects.create(
+                bucket_start=self.hour, processing_model=processing_model, requested_by=self.admin_user,
+                summary_count=3, total_cost=Decimal(cost)
+            )
+
+    def test_costs_grouped_by_model(self):
+        response = self.client.get(reverse('example-costs'), {
+            'group_by': 'model', 'start': self.hour.isoformat(), 'end': (self.hour + timedelta(hours=1)).isoformat(),
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['summary_count'], 6)
+        self.assertEqual(response.data['total_cost'], Decimal('1.7500'))
+        self.assertEqual([row['processing_model'] for row in response.data['results']],
+                         ['example-model-lite', 'example-model-pro'])
+
+    def test_invalid_parameters(self):
+        for params in ({'group_by': 'model,day'}, {'start': 'yesterday'}):
+            response = self.client.get(reverse('example-costs'), params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ExampleOfStatusStreamTest(TestCase):
+    def setUp(self):
+        self.admin_user = User.objects.create_user(
+            email='stream-admin@example.com',
+            password='adminpass123',
+            is_staff=True,
+            is_superuser=True
+        )
+        self.token = Token.objects.create(user=self.admin_user)
+        self.article = ExampleOfArticle.objects.create(
+            title="Stream Article",
+            content="Content to process.",
+            url="http://example.com/stream",
+            published_date=timezone.now(),
+            source="Test Source",
+            example_source="Test Client"
+        )
+        self.url = reverse('example-status-events', args=[self.article.id])
+
+    async def _events(self, response):
+        """Collect the data of every non-comment event until the stream closes."""
+        events = []
+        async for chunk in response.streaming_content:
+            text = chunk.decode() if isinstance(chunk, bytes) else chunk
+            if not text.startswith(':'):
+                events.append(json.loads(text.split('data: ', 1)[1]))
+        return events
+
+    async def test_stream_pushes_transitions_until_completed(self):
+        summary = await ExampleOfSummary.objects.acreate(
+            example_item=self.article, processing_model='example-model-v1', status='pending'
+        )
+        response = await self.async_client.get(self.url, headers={'Authorization': f'Token {self.token.key}'})
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        stream = aiter(response.streaming_content)
+        first = await anext(stream)
+        self.assertIn('"status": "pending"', first.decode() if isinstance(first, bytes) else first)
+
+        # Subscribed: further transitions arrive without any query from the stream
+        ExampleOfStatusChannel.publish({
+            'example_item_id': self.article.id, 'processing_model': 'example-model-v1', 'status': 'in_progress',
+        })
+        summary.status = 'completed'
+        summary.summary_text = 'Done'
+        ExampleOfStatusChannel.publish(summary)
+
+        remaining = [json.loads((chunk.decode() if isinstance(chunk, bytes) else chunk).split('data: ', 1)[1])
+                     async for chunk in stream]
+        self.assertEqual([event['status'] for event in remaining], ['in_progress', 'completed'])
+        self.assertEqual(remaining[-1]['summary_text'], 'Done')
+
+    async def test_stream_closes_immediately_for_terminal_status(self):
+        await ExampleOfSummary.objects.acreate(
+            example_item=self.article, processing_model='example-model-v1', status='completed'
+        )
+        response = await self.async_client.get(self.url, headers={'Authorization': f'Token {self.token.key}'})
+        events = await self._events(response)
+        self.assertEqual([event['status'] for event in events], ['completed'])
+
+    @override_settings(EXAMPLE_STATUS_STREAM_TIMEOUT=0.2, EXAMPLE_STATUS_STREAM_HEARTBEAT=0.1)
+    async def test_stream_times_out_without_summary(self):
+        response = await self.async_client.get(self.url, headers={'Authorization': f'Token {self.token.key}'})
+        chunks = [chunk async for chunk in response.streaming_content]
+        self.assertIn('event: timeout', (chunks[-1].decode() if isinstance(chunks[-1], bytes) else chunks[-1]))
+
+    async def test_stream_requires_admin_token(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response['WWW-Authenticate'], 'Token')
+        user = await sync_to_async(User.objects.create_user)(email='stream-user@example.com', password='userpass123')
+        user_token = await Token.objects.acreate(user=user)
+        response = await self.async_client.get(self.url, headers={'Authorization': f'Token {user_token.key}'})
+        self.assertEqual(response.status_code, 403)
+        response = await self.async_client.get(
+            reverse('example-status-events', args=[999999]), headers={'Authorization': f'Token {self.token.key}'}
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_task_publishes_status_transitions(self):
+        ExampleOfSummary.objects.create(
+            example_item=self.article, processing_model='example-model-v1', status='pending'
+        )
+
+        with patch('example.tasks.example_of_async_task.ExampleOfStatusChannel.publish') as publish:
+            example_of_async_processing_task.apply(args=(self.article.id, 'example-model-v1'))
+
+        statuses = [
+            call.args[0]['status'] if isinstance(call.args[0], dict) else call.args[0].status
+            for call in publish.call_args_list
+        ]
+        self.assertEqual(statuses, ['in_progress', 'completed'])
@@ -34,6 +34,26 @@ class ExampleOfArticleModelTest(TestCase):
         self.assertEqual(articles[0], article2)
         self.assertEqual(articles[1], self.article)
 
+    def test_text_stats_computed_on_save(self):
+        self.assertEqual(self.article.word_count, 3)
+        self.assertEqual(self.article.char_count, len("Some example content"))
+        self.assertEqual(
+            self.article.content_hash,
+            ExampleOfArticle.compute_content_hash("Test Example Article", "Some example content"),
+        )
+
+        self.article.content = "Edited content with five words"
+        self.article.save(update_fields=['content'])
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.word_count, 5)
+
+        # Saves that do not touch the text leave the stored stats alone
+        ExampleOfArticle.objects.filter(id=self.article.id).update(word_count=0)
+        self.article.author = "Another Author"
+        self.article.save(update_fields=['author'])
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.word_count, 0)
+
     def test_field_constraints(self):
         # url must be unique
         with self.assertRaises(Exception):
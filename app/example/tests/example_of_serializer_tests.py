@@ -44,6 +44,11 @@ class ExampleOfCustomValidationSerializerTest(TestCase):
         self.assertTrue(serializer.is_valid())
         self.assertEqual(serializer.validated_data['title'], 'Test Title')
 
+    def test_sparse_fields(self):
+        article = ExampleOfArticle.objects.create(**self.article_data)
+        serializer = ExampleOfCustomValidationSerializer(article, fields=['id', 'title'])
+        self.assertEqual(serializer.data, {'id': article.id, 'title': 'Test Article'})
+
 
 class ExampleOfReadonlySerializerTest(TestCase):
     def setUp(self):
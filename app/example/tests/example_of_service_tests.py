@@ -1,8 +1,38 @@
-from django.test import TestCase
+import asyncio
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import timedelta
+import httpx
+from celery.exceptions import Retry
+from decimal import Decimal
+from io import StringIO
+from django.core.cache import cache
+from django.core.management import call_command
+from example.management.commands.example_of_replay_command import ExampleOfReplayCommand
+from django.test import TestCase, override_settings
 from django.utils import timezone
 from unittest.mock import patch, MagicMock
-from example.models import ExampleOfArticle, ExampleOfFetchLog, ExampleOfSummary
-from example.services import ExampleOfExternalApiService, ExampleOfAiService
+from example.models import ExampleOfArticle, ExampleOfCostRollup, ExampleOfFetchLog, ExampleOfSummary
+from example.services import (
+    ExampleOfExternalApiService,
+    ExampleOfAiService,
+    ExampleOfPaginatedFetcher,
+    ExampleOfRawDataArchive,
+    ExampleOfFetchLogRecorder,
+    ExampleOfUrlBloomFilter,
+    ExampleOfTokenBucketLimiter,
+    ExampleOfSummaryCache,
+    ExampleOfCostRollupRecorder,
+    ExampleOfAiClient,
+    ExampleOfAiClientRegistry,
+    ExampleServiceError
+)
+from example.services.example_of_paginated_fetcher import run_sync
+from example.tasks import example_of_async_processing_task
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -67,6 +97,920 @@ class ExampleOfExternalApiServiceTest(TestCase):
             self.assertEqual(fetch_logs.count(), 1)
             self.assertEqual(fetch_logs[0].status, ExampleOfFetchLog.Status.SUCCESS)
 
+    def _make_item(self, index):
+        return {
+            'title': f'Bulk Item {index}',
+            'content': f'Bulk content {index}',
+            'url': f'http://example.com/bulk{index}',
+            'publishedAt': timezone.now().isoformat(),
+            'author': 'Test Author',
+            'source': {'name': 'Test Source'},
+        }
+
+    def test_save_items_skips_duplicates(self):
+        ExampleOfArticle.objects.create(
+            title="Existing",
+            content="Existing content",
+            url="http://example.com/bulk0",
+            published_date=timezone.now(),
+            source="Test Source",
+            example_source="Test Client"
+        )
+        items = [self._make_item(i) for i in range(3)] + [self._make_item(1)]
+
+        processed, saved, duplicates = self.service._save_items(items)
+
+        self.assertEqual((processed, saved, duplicates), (4, 2, 2))
+        self.assertEqual(ExampleOfArticle.objects.count(), 3)
+
+    def test_save_items_queries_per_chunk(self):
+        items = [self._make_item(i) for i in range(10)]
+
+        # One lookup, one insert and one verification query per chunk
+        with self.assertNumQueries(3 * 2 + 2):
+            processed, saved, duplicates = self.service._save_items(items, batch_size=5)
+
+        self.assertEqual((processed, saved, duplicates), (10, 10, 0))
+
+
+class ExampleOfPaginatedFetcherTest(TestCase):
+    total_results = 10
+    page_size = 1
+    latency = 0.05
+
+    def _transport(self):
+        async def handler(request):
+            await asyncio.sleep(self.latency)
+            page = int(request.url.params['page'])
+            return httpx.Response(200, json={
+                'status': 'ok',
+                'totalResults': self.total_results,
+                'items': [{'url': f'http://example.com/page{page}'}],
+            })
+        return httpx.MockTransport(handler)
+
+    def _fetch(self, max_concurrency):
+        fetcher = ExampleOfPaginatedFetcher(
+            'https://api.example.com/v1/data',
+            page_size=self.page_size,
+            max_concurrency=max_concurrency,
+            transport=self._transport(),
+        )
+        started = time.perf_counter()
+        result = fetcher.fetch_all({'category': 'example'})
+        return result, time.perf_counter() - started
+
+    def test_fetch_all_merges_pages_in_order(self):
+        result, _ = self._fetch(max_concurrency=5)
+
+        self.assertEqual(result['totalResults'], self.total_results)
+        self.assertEqual(
+            [item['url'] for item in result['items']],
+            [f'http://example.com/page{page}' for page in range(1, self.total_results + 1)]
+        )
+
+    def test_concurrent_paging_is_faster_than_sequential(self):
+        _, sequential = self._fetch(max_concurrency=1)
+        _, concurrent = self._fetch(max_concurrency=5)
+
+        # 10 sequential pages vs. the first page plus two waves of five
+        self.assertLess(concurrent * 2, sequential)
+
+    def test_stream_pages_applies_backpressure(self):
+        requested = []
+
+        def handler(request):
+            requested.append(int(request.url.params['page']))
+            return httpx.Response(200, json={'status': 'ok', 'totalResults': 20, 'items': []})
+
+        fetcher = ExampleOfPaginatedFetcher(
+            'https://api.example.com/v1/data',
+            page_size=1,
+            max_concurrency=2,
+            transport=httpx.MockTransport(handler),
+        )
+        pages = fetcher.stream_pages({}, max_buffered_pages=1)
+        next(pages)
+        time.sleep(0.2)
+
+        # One consumed page, one queued and one held by each blocked worker
+        self.assertLessEqual(len(requested), 4)
+        self.assertEqual(len(list(pages)) + 1, 20)
+        self.assertEqual(sorted(requested), list(range(1, 21)))
+
+    def test_stopping_a_stream_ends_the_producer(self):
+        fetcher = ExampleOfPaginatedFetcher(
+            'https://api.example.com/v1/data',
+            page_size=1,
+            max_concurrency=2,
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={'status': 'ok', 'totalResults': 20, 'items': []})
+            ),
+        )
+        pages = fetcher.stream_pages({}, max_buffered_pages=1)
+        next(pages)
+        time.sleep(0.2)
+        # Stop while the queue is full and the workers are blocked on it
+        pages.close()
+        time.sleep(0.2)
+
+        async def producers():
+            return [task for task in asyncio.all_tasks() if task.get_coro().__name__ == '_produce_pages']
+        self.assertEqual(run_sync(producers()), [])
+
+    def test_fetch_and_save_stream(self):
+        def handler(request):
+            page = int(request.url.params['page'])
+            return httpx.Response(200, json={
+                'status': 'ok',
+                'totalResults': 3,
+                'items': [{
+                    'title': f'Streamed Item {page}',
+                    'content': 'Streamed content',
+                    'url': f'http://example.com/stream{page}',
+                    'publishedAt': timezone.now().isoformat(),
+                    'source': {'name': 'Test Source'},
+                }],
+            })
+
+        service = ExampleOfExternalApiService(transport=httpx.MockTransport(handler))
+        service.fetcher.page_size = 1
+        result = service.fetch_and_save(stream=True)
+
+        fetch_log = ExampleOfFetchLog.objects.get()
+        self.assertEqual(result['items_saved'], 3)
+        self.assertNotIn('items', result)
+        self.assertEqual(ExampleOfArticle.objects.count(), 3)
+        self.assertEqual((fetch_log.items_fetched, fetch_log.items_saved), (3, 3))
+        self.assertEqual(fetch_log.status, ExampleOfFetchLog.Status.SUCCESS)
+
+    def test_stream_fetch_is_conditional_and_archived(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304)
+            page = int(request.url.params['page'])
+            return httpx.Response(200, headers={'ETag': '"v1"'}, json={
+                'status': 'ok',
+                'totalResults': 3,
+                'items': [{
+                    'title': f'Archived Item {page}',
+                    'content': 'Archived content',
+                    'url': f'http://example.com/archived{page}',
+                    'publishedAt': timezone.now().isoformat(),
+                    'source': {'name': 'Test Source'},
+                }],
+            })
+
+        archive_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(archive_dir.cleanup)
+        service = ExampleOfExternalApiService(transport=httpx.MockTransport(handler))
+        service.fetcher.page_size = 1
+        with override_settings(EXAMPLE_RAW_DATA_CAPTURE=True, EXAMPLE_RAW_DATA_DIR=archive_dir.name):
+            service.raw_data_archive = ExampleOfRawDataArchive()
+            first = service.fetch_and_save(stream=True)
+            second = service.fetch_and_save(stream=True)
+
+            ExampleOfArticle.objects.all().delete()
+            call_command(ExampleOfReplayCommand(), '--workers', '1', '--restart', stdout=StringIO())
+
+        first_log = ExampleOfFetchLog.objects.get(id=first['fetch_log_id'])
+        archived = [location for fetch_log_id, location in service.raw_data_archive.iter_index()
+                    if fetch_log_id == first_log.id]
+        self.assertEqual(len(archived), 3)
+        self.assertEqual(first_log.raw_data_file, archived[0])
+        self.assertTrue(second['not_modified'])
+        self.assertEqual(requests[-1].headers['If-None-Match'], '"v1"')
+        # Replay restores the articles from every archived page
+        self.assertEqual(ExampleOfArticle.objects.count(), 3)
+
+    def test_incremental_fetch_uses_high_water_mark(self):
+        published_at = timezone.now().replace(microsecond=0)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get('If-None-Match') == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={'ETag': '"v1"'}, json={
+                'status': 'ok',
+                'totalResults': 1,
+                'items': [{
+                    'title': 'Incremental Item',
+                    'content': 'Incremental content',
+                    'url': 'http://example.com/incremental',
+                    'publishedAt': published_at.isoformat(),
+                    'source': {'name': 'Test Source'},
+                }],
+            })
+
+        service = ExampleOfExternalApiService(transport=httpx.MockTransport(handler))
+        first = service.fetch_and_save()
+        second = service.fetch_and_save()
+
+        self.assertEqual(first['items_saved'], 1)
+        self.assertTrue(second['not_modified'])
+        self.assertEqual(second['items_processed'], 0)
+        self.assertNotIn('from', requests[0].url.params)
+        self.assertEqual(requests[1].url.params['from'], published_at.isoformat())
+
+        latest_log = ExampleOfFetchLog.objects.order_by('-id').first()
+        self.assertEqual(latest_log.status, ExampleOfFetchLog.Status.SUCCESS)
+        self.assertEqual(latest_log.metadata['high_water_mark']['etag'], '"v1"')
+
+        # A full refresh ignores the stored mark
+        service.fetch_and_save(incremental=False)
+        self.assertNotIn('If-None-Match', requests[2].headers)
+
+    def test_http_error_raises_service_error(self):
+        service = ExampleOfExternalApiService(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+        with self.assertRaises(ExampleServiceError):
+            service._fetch_data()
+
+
+class ExampleOfRawDataArchiveTest(TestCase):
+    def setUp(self):
+        self.archive_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.archive_dir.cleanup)
+        self.archive = ExampleOfRawDataArchive(archive_dir=self.archive_dir.name, segment_max_bytes=200)
+
+    def test_append_and_read_round_trip(self):
+        locations = {
+            fetch_log_id: self.archive.append(fetch_log_id, {'items': [{'url': f'http://example.com/{fetch_log_id}'}]})
+            for fetch_log_id in range(1, 6)
+        }
+
+        for fetch_log_id, location in locations.items():
+            record = self.archive.read(location)
+            self.assertEqual(record['fetch_log_id'], fetch_log_id)
+            self.assertEqual(record['payload']['items'][0]['url'], f'http://example.com/{fetch_log_id}')
+
+        self.assertEqual(dict(self.archive.iter_index()), locations)
+
+    def test_segments_roll_over_and_stay_valid_jsonl_gz(self):
+        for fetch_log_id in range(1, 6):
+            self.archive.append(fetch_log_id, {'items': ['x' * 100]})
+
+        segments = [name for name in os.listdir(self.archive_dir.name) if name.endswith('.jsonl.gz')]
+        self.assertGreater(len(segments), 1)
+
+        lines = []
+        for segment in sorted(segments):
+            with gzip.open(os.path.join(self.archive_dir.name, segment), 'rt') as f:
+                lines.extend(json.loads(line)['fetch_log_id'] for line in f)
+        self.assertEqual(lines, [1, 2, 3, 4, 5])
+
+    def test_fetch_and_save_captures_raw_data(self):
+        with override_settings(EXAMPLE_RAW_DATA_CAPTURE=True, EXAMPLE_RAW_DATA_DIR=self.archive_dir.name):
+            service = ExampleOfExternalApiService()
+            service.fetch_and_save()
+
+        fetch_log = ExampleOfFetchLog.objects.get()
+        payload = service.raw_data_archive.read_payload(fetch_log.raw_data_file)
+        self.assertEqual(len(payload['items']), 2)
+
+
+class ExampleOfFetchLogRecorderTest(TestCase):
+    def test_transitions_are_written_in_two_statements(self):
+        with self.assertNumQueries(2):
+            recorder = ExampleOfFetchLogRecorder.start(source="Test Source", flush_interval=60)
+            recorder.progress(items_fetched=10)
+            recorder.set(raw_data_file='segment-000001.jsonl.gz:0:10')
+            recorder.complete(status=ExampleOfFetchLog.Status.SUCCESS, items_saved=8)
+
+        fetch_log = ExampleOfFetchLog.objects.get(id=recorder.id)
+        self.assertEqual(fetch_log.status, ExampleOfFetchLog.Status.SUCCESS)
+        self.assertEqual((fetch_log.items_fetched, fetch_log.items_saved), (10, 8))
+        self.assertIsNotNone(fetch_log.completed_at)
+
+    def test_cache_backend_defers_progress_to_completion(self):
+        recorder = ExampleOfFetchLogRecorder.start(source="Test Source", progress_backend='cache')
+
+        with self.assertNumQueries(0):
+            recorder.progress(items_fetched=5, items_saved=4)
+
+        self.assertEqual(ExampleOfFetchLogRecorder.get_progress(recorder.id), {'items_fetched': 5, 'items_saved': 4})
+        self.assertEqual(ExampleOfFetchLog.objects.get(id=recorder.id).items_fetched, 0)
+
+        recorder.complete(status=ExampleOfFetchLog.Status.SUCCESS)
+        self.assertIsNone(ExampleOfFetchLogRecorder.get_progress(recorder.id))
+        self.assertEqual(ExampleOfFetchLog.objects.get(id=recorder.id).items_fetched, 5)
+
+
+class ExampleOfUrlBloomFilterTest(TestCase):
+    def setUp(self):
+        self.bloom_filter = ExampleOfUrlBloomFilter()
+        self.bloom_filter.clear()
+        self.addCleanup(self.bloom_filter.clear)
+        self.service = ExampleOfExternalApiService()
+
+    def _make_items(self, start, stop):
+        return [{
+            'title': f'Bloom Item {index}',
+            'content': 'Bloom content',
+            'url': f'http://example.com/bloom{index}',
+            'publishedAt': timezone.now().isoformat(),
+            'source': {'name': 'Test Source'},
+        } for index in range(start, stop)]
+
+    def test_unbuilt_filter_reports_maybe_present(self):
+        self.assertEqual(self.bloom_filter.contains_many(['http://example.com/a']), [True])
+
+    def test_no_false_negatives_and_low_false_positive_rate(self):
+        small_filter = ExampleOfUrlBloomFilter(capacity=1000, error_rate=0.01, key='example:url-bloom:test')
+        self.addCleanup(small_filter.clear)
+        urls = [f'http://example.com/present{index}' for index in range(1000)]
+        small_filter.rebuild(urls)
+
+        self.assertTrue(all(small_filter.contains_many(urls)))
+        absent = [f'http://example.com/absent{index}' for index in range(2000)]
+        false_positives = sum(small_filter.contains_many(absent))
+        self.assertLess(false_positives / len(absent), 0.03)
+
+    def test_filter_skips_database_lookup_for_new_items(self):
+        self.service._save_items(self._make_items(0, 95))
+        self.bloom_filter.rebuild(ExampleOfArticle.objects.values_list('url', flat=True))
+        # Replay a duplicate-heavy fetch: 95 known URLs plus 5 new ones
+        replay = self._make_items(0, 100)
+
+        # Insert and verification only: the lookup query is skipped entirely
+        with self.assertNumQueries(2 + 2):
+            processed, saved, duplicates = self.service._save_items(replay[95:])
+        self.assertEqual((processed, saved, duplicates), (5, 5, 0))
+
+        # New URLs were added incrementally, so a full replay is one lookup and no inserts
+        with self.assertNumQueries(1 + 2):
+            processed, saved, duplicates = self.service._save_items(replay)
+        self.assertEqual((processed, saved, duplicates), (100, 0, 100))
+
+    def test_created_article_is_added_incrementally(self):
+        self.bloom_filter.rebuild([])
+        ExampleOfArticle.objects.create(
+            title="Signal Article",
+            content="Content",
+            url="http://example.com/signal",
+            published_date=timezone.now(),
+            source="Test Source",
+            example_source="Test Client"
+        )
+
+        self.assertEqual(self.bloom_filter.contains_many(['http://example.com/signal']), [True])
+
+
+class ExampleOfTokenBucketLimiterTest(TestCase):
+    def setUp(self):
+        self.limiter = ExampleOfTokenBucketLimiter('test-upstream', rate=20, burst=2)
+        self.limiter.reset()
+        self.addCleanup(self.limiter.reset)
+
+    def test_burst_is_free_then_requests_are_spaced_at_the_rate(self):
+        self.assertEqual([self.limiter.acquire() for _ in range(2)], [0.0, 0.0])
+        # Each further caller reserves the next slot, 1/rate apart
+        waits = [self.limiter.acquire() for _ in range(3)]
+        for index, wait in enumerate(waits, start=1):
+            self.assertAlmostEqual(wait, index / 20, delta=0.01)
+
+    def test_block_for_delays_every_caller(self):
+        self.limiter.block_for(0.5)
+        # The block drains the bucket, so the first token is due one interval after it ends
+        self.assertAlmostEqual(self.limiter.block_for(0.1), 0.5, delta=0.01)
+        self.assertAlmostEqual(self.limiter.acquire(), 0.5 + 1 / 20, delta=0.01)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(ExampleOfTokenBucketLimiter.parse_retry_after('3'), 3.0)
+        self.assertEqual(ExampleOfTokenBucketLimiter.parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0.0)
+        self.assertIsNone(ExampleOfTokenBucketLimiter.parse_retry_after('soon'))
+        self.assertIsNone(ExampleOfTokenBucketLimiter.parse_retry_after(None))
+
+    def test_fetcher_throttles_pages_and_honors_retry_after(self):
+        requests_seen = []
+
+        async def handler(request):
+            page = int(request.url.params['page'])
+            requests_seen.append((page, time.monotonic()))
+            if page == 2 and len([seen for seen in requests_seen if seen[0] == 2]) == 1:
+                return httpx.Response(429, headers={'Retry-After': '0.3'})
+            return httpx.Response(200, json={'status': 'ok', 'totalResults': 4, 'items': [{'page': page}]})
+
+        fetcher = ExampleOfPaginatedFetcher(
+            'https://api.example.com/v1/data',
+            page_size=1,
+            max_concurrency=4,
+            transport=httpx.MockTransport(handler),
+            rate_limiter=self.limiter,
+        )
+        result = fetcher.fetch_all({'category': 'example'})
+
+        self.assertEqual([item['page'] for item in result['items']], [1, 2, 3, 4])
+        # Four pages plus the rate-limited attempt, which was retried rather than failing the fetch
+        self.assertEqual(len(requests_seen), 5)
+        # The retry waited out Retry-After
+        first_attempt, retry = [seen_at for page, seen_at in requests_seen if page == 2]
+        self.assertGreaterEqual(retry - first_attempt, 0.29)
+
+    def test_fetcher_gives_up_after_retries(self):
+        async def handler(request):
+            return httpx.Response(429, headers={'Retry-After': '0'})
+
+        fetcher = ExampleOfPaginatedFetcher(
+            'https://api.example.com/v1/data',
+            transport=httpx.MockTransport(handler),
+            rate_limiter=self.limiter,
+            rate_limit_retries=2,
+        )
+        with self.assertRaises(httpx.HTTPStatusError):
+            fetcher.fetch_all({'category': 'example'})
+
+
+class ExampleOfAiBatchProcessingTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='batch@example.com', password='testpass123')
+        self.articles = ExampleOfArticle.objects.bulk_create([
+            ExampleOfArticle(
+                title=f"Batch Article {index}",
+                content="Batch article content to process.",
+                url=f"http://example.com/batch{index}",
+                published_date=timezone.now(),
+                source="Test Source",
+                example_source="Test Client"
+            )
+            for index in range(25)
+        ])
+        self.item_ids = [article.id for article in self.articles]
+        self.service = ExampleOfAiService()
+
+    def test_process_items_batches_model_calls_and_writes(self):
+        completed = ExampleOfSummary.objects.create(
+            example_item=self.articles[0], processing_model="example-model-v1", status="completed",
+            summary_text="Already done",
+        )
+
+        with patch.object(self.service, '_generate_summaries', wraps=self.service._generate_summaries) as generate:
+            # Two loads, one insert of the missing rows (savepoint, insert, read back, release),
+            # one bulk_update per model batch of 20, and one new cost rollup bucket
+            # (update, savepoint, insert, release)
+            with self.assertNumQueries(2 + 4 + 2 + 4):
+                summaries = self.service.process_items(self.item_ids, "example-model-v1", user=self.user)
+
+        self.assertEqual([len(call.args[0]) for call in generate.call_args_list], [20, 4])
+        self.assertEqual(list(summaries), self.item_ids)
+        self.assertEqual(summaries[self.articles[0].id].summary_text, "Already done")
+        self.assertEqual(summaries[self.articles[0].id].id, completed.id)
+        self.assertEqual(ExampleOfSummary.objects.filter(status="completed").count(), 25)
+        self.assertEqual(ExampleOfSummary.objects.get(example_item=self.articles[1]).requested_by, self.user)
+        rollup = ExampleOfCostRollup.objects.get(processing_model="example-model-v1", requested_by=self.user)
+        self.assertEqual(rollup.summary_count, 24)
+
+    def test_process_items_marks_failed_batch_and_skips_missing_items(self):
+        with patch.object(self.service, '_generate_summaries', side_effect=RuntimeError("model down")):
+            summaries = self.service.process_items(self.item_ids[:3] + [999999], "example-model-v1")
+
+        self.assertEqual(len(summaries), 3)
+        self.assertTrue(all(summary.status == "failed" for summary in summaries.values()))
+        self.assertEqual(ExampleOfSummary.objects.filter(status="failed", error_message="model down").count(), 3)
+
+    def test_unbatched_model_calls_once_per_item(self):
+        with patch.object(self.service, '_generate_summary', wraps=self.service._generate_summary) as generate:
+            self.service.process_items(self.item_ids[:3], "example-model-pro")
+        self.assertEqual(generate.call_count, 3)
+
+    def test_process_items_async_queues_new_and_failed_items_once(self):
+        ExampleOfSummary.objects.create(
+            example_item=self.articles[0], processing_model="example-model-v1", status="failed"
+        )
+        ExampleOfSummary.objects.create(
+            example_item=self.articles[1], processing_model="example-model-v1", status="pending"
+        )
+
+        with patch('example.tasks.example_of_batch_processing_task.apply_async') as apply_async:
+            summaries = self.service.process_items_async(self.item_ids[:4], "example-model-v1")
+
+        apply_async.assert_called_once()
+        queued_ids, task_id = apply_async.call_args.args[0][0], apply_async.call_args.kwargs['task_id']
+        self.assertEqual(sorted(queued_ids), [self.item_ids[0], self.item_ids[2], self.item_ids[3]])
+        self.assertEqual(len(summaries), 4)
+        self.assertEqual(
+            [summaries[item_id].task_id == task_id for item_id in self.item_ids[:4]], [True, False, True, True]
+        )
+
+        # A repeated request attaches to the queued task instead of queueing another
+        with patch('example.tasks.example_of_batch_processing_task.apply_async') as apply_async:
+            summaries = self.service.process_items_async(self.item_ids[:4], "example-model-v1")
+        apply_async.assert_not_called()
+        self.assertEqual(summaries[self.item_ids[0]].task_id, task_id)
+
+
+class ExampleOfSummaryCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.service = ExampleOfAiService()
+        self.content = "Syndicated wire story content that appears under many URLs."
+
+    def _make_article(self, index, content=None):
+        return ExampleOfArticle.objects.create(
+            title="Wire Story",
+            content=content or self.content,
+            url=f"http://example.com/wire{index}",
+            published_date=timezone.now(),
+            source="Test Source",
+            example_source="Test Client"
+        )
+
+    def test_content_hash_ignores_whitespace_and_unicode_form(self):
+        self.assertEqual(
+            ExampleOfSummaryCache.content_hash("Caf\u00e9", "One  two\nthree "),
+            ExampleOfSummaryCache.content_hash(" Cafe\u0301", "One two three"),
+        )
+        self.assertNotEqual(
+            ExampleOfSummaryCache.content_hash("Title", "One two"),
+            ExampleOfSummaryCache.content_hash("Title", "One two three"),
+        )
+
+    def test_process_item_reuses_summary_for_identical_content(self):
+        first = self.service.process_item(self._make_article(0).id, "example-model-v1")
+
+        with patch.object(self.service, '_generate_summary') as generate:
+            copy = self.service.process_item(self._make_article(1).id, "example-model-v1")
+        generate.assert_not_called()
+
+        self.assertEqual(copy.status, "completed")
+        self.assertEqual(copy.summary_text, first.summary_text)
+        self.assertEqual(copy.processing_cost, 0)
+        stats = ExampleOfSummaryCache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['credits_saved'], Decimal(str(first.processing_cost)).quantize(Decimal('0.0001')))
+
+    def test_cache_key_includes_model_and_max_words(self):
+        self.service.process_item(self._make_article(0).id, "example-model-v1", max_words=50)
+
+        with patch.object(self.service, '_generate_summary', wraps=self.service._generate_summary) as generate:
+            self.service.process_item(self._make_article(1).id, "example-model-v1", max_words=100)
+            self.service.process_item(self._make_article(2).id, "example-model-v2", max_words=50)
+        self.assertEqual(generate.call_count, 2)
+
+    def test_durable_entries_survive_cache_eviction(self):
+        summary_cache = ExampleOfSummaryCache(use_db=True)
+        content_hash = ExampleOfSummaryCache.content_hash("Wire Story", self.content)
+        summary_cache.set(content_hash, "example-model-v1", 150, "Durable summary", Decimal('0.0100'))
+        cache.clear()
+
+        self.assertEqual(
+            summary_cache.get(content_hash, "example-model-v1", 150),
+            ("Durable summary", Decimal('0.0100')),
+        )
+        # The lookup warmed Redis again, so the table is not queried a second time
+        with self.assertNumQueries(0):
+            self.assertIsNotNone(summary_cache.get(content_hash, "example-model-v1", 150))
+
+    def test_process_items_summarizes_syndicated_copies_once(self):
+        item_ids = [self._make_article(index).id for index in range(3)]
+
+        with patch.object(self.service, '_generate_summaries', wraps=self.service._generate_summaries) as generate:
+            summaries = self.service.process_items(item_ids, "example-model-v1")
+
+        self.assertEqual([len(call.args[0]) for call in generate.call_args_list], [1])
+        self.assertEqual(
+            {summary.summary_text for summary in summaries.values()}, {summaries[item_ids[0]].summary_text}
+        )
+        self.assertEqual([summary.processing_cost == 0 for summary in summaries.values()], [False, True, True])
+
+        # A later batch with another copy is served from the cache
+        with patch.object(self.service, '_generate_summaries') as generate:
+            later = self.service.process_items([self._make_article(3).id], "example-model-v1")
+        generate.assert_not_called()
+        self.assertEqual(list(later.values())[0].status, "completed")
+
+    def test_cache_write_failure_keeps_generated_summaries(self):
+        item_ids = [self._make_article(index, content=f"Distinct content {index}").id for index in range(2)]
+
+        with patch.object(self.service.summary_cache, 'set_many', side_effect=ConnectionError("cache down")):
+            summaries = self.service.process_items(item_ids, "example-model-v1")
+            single = self.service.process_item(self._make_article(2).id, "example-model-v1")
+
+        self.assertEqual({summary.status for summary in summaries.values()}, {"completed"})
+        self.assertEqual(single.status, "completed")
+        self.assertTrue(all(summary.processing_cost > 0 for summary in summaries.values()))
+
+
+@override_settings(EXAMPLE_AI_CHUNK_WORDS=10, EXAMPLE_AI_CHUNK_OVERLAP_WORDS=2)
+class ExampleOfMapReduceSummaryTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.service = ExampleOfAiService()
+        self.words = [f"word{index}" for index in range(30)]
+
+    def test_split_into_overlapping_chunks(self):
+        chunks = [chunk.split() for chunk in self.service._split_into_chunks(' '.join(self.words))]
+
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 10, 6])
+        self.assertEqual(chunks[1][:2], chunks[0][-2:])
+        self.assertEqual(chunks[-1][-1], self.words[-1])
+
+    def test_short_content_keeps_single_call(self):
+        with patch.object(self.service, '_summarize_chunk') as summarize_chunk:
+            self.service._generate_summary("Short", "only a few words", "example-model-v1", 50)
+        summarize_chunk.assert_not_called()
+
+    def test_long_content_is_mapped_then_reduced(self):
+        with patch.object(self.service, '_summarize_chunk', wraps=self.service._summarize_chunk) as summarize_chunk, \
+                patch.object(self.service, '_summarize_text', wraps=self.service._summarize_text) as summarize_text:
+            summary_text, processing_cost = self.service._generate_summary(
+                "Long", ' '.join(self.words), "example-model-v1", 50
+            )
+
+        self.assertEqual(summarize_chunk.call_count, 4)
+        summarize_text.assert_called_once()
+        self.assertIn("'Long'", summary_text)
+        self.assertGreater(processing_cost, 0.001 * len(self.words))
+
+    def test_unchanged_chunks_come_from_the_cache(self):
+        self.service._generate_summary("Long", ' '.join(self.words), "example-model-v1", 50)
+
+        edited = self.words[:-1] + ["edited"]
+        with patch.object(self.service, '_summarize_chunk', wraps=self.service._summarize_chunk) as summarize_chunk:
+            self.service._generate_summary("Long", ' '.join(edited), "example-model-v1", 50)
+        # Only the last chunk contains the edit
+        self.assertEqual([call.args[2] for call in summarize_chunk.call_args_list], [3])
+
+    def test_batches_summarize_long_items_separately(self):
+        articles = [
+            ExampleOfArticle.objects.create(
+                title=f"Mixed {index}",
+                content=' '.join(self.words[:5 + index * 20]),
+                url=f"http://example.com/mixed{index}",
+                published_date=timezone.now(),
+                source="Test Source",
+                example_source="Test Client"
+            )
+            for index in range(2)
+        ]
+        with patch.object(self.service, '_generate_map_reduce_summary',
+                          wraps=self.service._generate_map_reduce_summary) as map_reduce:
+            results = self.service._generate_summaries(articles, "example-model-v1", 50)
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual([call.args[0] for call in map_reduce.call_args_list], ["Mixed 1"])
+
+
+class ExampleOfCostRollupTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='costs@example.com', password='testpass123')
+        self.recorder = ExampleOfCostRollupRecorder()
+        self.hour = timezone.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=2)
+        self.summaries = []
+        for index in range(4):
+            article = ExampleOfArticle.objects.create(
+                title=f"Cost Article {index}",
+                content="Cost content",
+                url=f"http://example.com/cost{index}",
+                published_date=timezone.now(),
+                source="Test Source",
+                example_source="Test Client"
+            )
+            self.summaries.append(ExampleOfSummary.objects.create(
+                example_item=article,
+                processing_model="example-model-pro" if index % 2 else "example-model-lite",
+                status="completed",
+                processing_cost=Decimal('0.0100') * (index + 1),
+                completed_at=self.hour + timedelta(minutes=10 * index),
+                requested_by=self.user if index < 3 else None,
+            ))
+
+    def test_record_adds_to_hourly_buckets(self):
+        self.recorder.record(self.summaries[:2])
+        self.recorder.record(self.summaries[2:])
+
+        lite = ExampleOfCostRollup.objects.get(processing_model="example-model-lite", requested_by=self.user)
+        self.assertEqual((lite.bucket_start, lite.summary_count, lite.total_cost), (self.hour, 2, Decimal('0.0400')))
+        anonymous = ExampleOfCostRollup.objects.get(requested_by=None)
+        self.assertEqual((anonymous.summary_count, anonymous.total_cost), (1, Decimal('0.0400')))
+
+    def test_rebuild_matches_incremental_totals(self):
+        self.recorder.record(self.summaries)
+        incremental = list(ExampleOfCostRollup.objects.values_list(
+            'bucket_start', 'processing_model', 'requested_by', 'summary_count', 'total_cost'
+        ).order_by('processing_model', 'requested_by'))
+
+        # A bucket skewed by hand is corrected by the rebuild
+        ExampleOfCostRollup.objects.update(summary_count=99)
+        count = self.recorder.rebuild(self.hour + timedelta(minutes=5), self.hour + timedelta(minutes=30))
+
+        self.assertEqual(count, 3)
+        self.assertEqual(list(ExampleOfCostRollup.objects.values_list(
+            'bucket_start', 'processing_model', 'requested_by', 'summary_count', 'total_cost'
+        ).order_by('processing_model', 'requested_by')), incremental)
+
+    def test_totals_read_only_the_rollups(self):
+        self.recorder.record(self.summaries)
+        with self.assertNumQueries(1):
+            rows = self.recorder.totals(self.hour, self.hour + timedelta(hours=1), ['processing_model'])
+        self.assertEqual(
+            [(row['processing_model'], row['summary_count'], row['total_cost']) for row in rows],
+            [("example-model-lite", 2, Decimal('0.0400')), ("example-model-pro", 2, Decimal('0.0600'))],
+        )
+
+
+class ExampleOfItemSummariesCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.service = ExampleOfAiService()
+        self.articles = [
+            ExampleOfArticle.objects.create(
+                title=f"Listed Article {index}",
+                content="Listed content",
+                url=f"http://example.com/listed{index}",
+                published_date=timezone.now(),
+                source="Test Source",
+                example_source="Test Client"
+            )
+            for index in range(3)
+        ]
+        self.item_ids = [article.id for article in self.articles]
+        for article in self.articles[:2]:
+            ExampleOfSummary.objects.create(
+                example_item=article, processing_model="example-model-v1", status="completed", summary_text="Done"
+            )
+
+    def test_bulk_lookup_is_one_query_then_cached(self):
+        with self.assertNumQueries(1):
+            results = self.service.get_items_summaries(self.item_ids)
+        self.assertEqual([len(results[item_id]['summaries']) for item_id in self.item_ids], [1, 1, 0])
+        self.assertEqual(results[self.item_ids[0]]['summaries'][0]['summary_text'], "Done")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.service.get_items_summaries(self.item_ids), results)
+            self.assertEqual(self.service.get_item_summaries(self.item_ids[1]), results[self.item_ids[1]])
+
+    def test_status_changes_invalidate_the_item(self):
+        self.service.get_items_summaries(self.item_ids)
+
+        summary = ExampleOfSummary.objects.get(example_item=self.articles[0])
+        summary.status = "failed"
+        summary.save()
+        self.assertEqual(self.service.get_item_summaries(self.item_ids[0])['summaries'][0]['status'], "failed")
+        self.service._claim_summaries([summary], "claim-task")
+
+        with self.assertNumQueries(1):
+            results = self.service.get_items_summaries(self.item_ids)
+        self.assertEqual(results[self.item_ids[0]]['summaries'][0]['status'], "pending")
+
+        self.service.process_items([self.item_ids[2]], "example-model-v1")
+        self.assertEqual(
+            [row['status'] for row in self.service.get_item_summaries(self.item_ids[2])['summaries']], ["completed"]
+        )
+
+
+class ExampleOfSingleFlightProcessingTest(TestCase):
+    def setUp(self):
+        self.article = ExampleOfArticle.objects.create(
+            title="Single Flight Article",
+            content="Content to process.",
+            url="http://example.com/single-flight",
+            published_date=timezone.now(),
+            source="Test Source",
+            example_source="Test Client"
+        )
+        self.service = ExampleOfAiService()
+
+    def _process_async(self):
+        with patch('example.tasks.example_of_async_processing_task.apply_async') as apply_async:
+            summary = self.service.process_item_async(self.article.id, "example-model-v1")
+        return summary, apply_async
+
+    def test_concurrent_requests_share_one_task(self):
+        first, apply_async = self._process_async()
+        apply_async.assert_called_once()
+        self.assertEqual(apply_async.call_args.kwargs['task_id'], first.task_id)
+
+        second, apply_async = self._process_async()
+        apply_async.assert_not_called()
+        self.assertEqual(second.task_id, first.task_id)
+
+    def test_failed_summary_is_claimed_by_one_caller(self):
+        summary = ExampleOfSummary.objects.create(
+            example_item=self.article, processing_model="example-model-v1", status="failed"
+        )
+        # Both callers read the failed row before either claims it
+        self.assertEqual(ExampleOfAiService._claim_summaries([summary], 'task-a'), 1)
+        self.assertEqual(ExampleOfAiService._claim_summaries([summary], 'task-b'), 0)
+
+        summary.refresh_from_db()
+        self.assertEqual((summary.status, summary.task_id), ("pending", 'task-a'))
+
+    def test_failed_summary_is_requeued_once(self):
+        ExampleOfSummary.objects.create(example_item=self.article, processing_model="example-model-v1", status="failed")
+
+        retried, apply_async = self._process_async()
+        apply_async.assert_called_once()
+        self.assertEqual(retried.status, "pending")
+
+        again, apply_async = self._process_async()
+        apply_async.assert_not_called()
+        self.assertEqual(again.task_id, retried.task_id)
+
+    def test_stale_task_is_requeued(self):
+        ExampleOfSummary.objects.create(
+            example_item=self.article, processing_model="example-model-v1", status="in_progress",
+            task_id='lost-task', queued_at=timezone.now() - timedelta(hours=2),
+        )
+
+        summary, apply_async = self._process_async()
+        apply_async.assert_called_once()
+        self.assertNotEqual(summary.task_id, 'lost-task')
+
+    def _fail_task(self, retries):
+        with patch.object(ExampleOfAiService, '_generate_summary', side_effect=RuntimeError("model down")), \
+                patch.object(example_of_async_processing_task, 'retry', side_effect=Retry()):
+            return example_of_async_processing_task.apply(
+                (self.article.id, "example-model-v1"), task_id='failing-task', retries=retries
+            )
+
+    def test_retrying_task_keeps_its_claim(self):
+        result = self._fail_task(retries=0)
+        self.assertIsInstance(result.result, Retry)
+
+        summary = ExampleOfSummary.objects.get(example_item=self.article)
+        self.assertEqual((summary.status, summary.task_id), ("pending", 'failing-task'))
+        # A request inside the retry window attaches to the retrying task
+        attached, apply_async = self._process_async()
+        apply_async.assert_not_called()
+        self.assertEqual(attached.task_id, 'failing-task')
+
+    def test_last_attempt_leaves_summary_failed(self):
+        self._fail_task(retries=example_of_async_processing_task.max_retries)
+
+        summary = ExampleOfSummary.objects.get(example_item=self.article)
+        self.assertEqual((summary.status, summary.error_message), ("failed", "model down"))
+        retried, apply_async = self._process_async()
+        apply_async.assert_called_once()
+        self.assertNotEqual(retried.task_id, 'failing-task')
+
+
+class ExampleOfAiClientRegistryTest(TestCase):
+    def setUp(self):
+        ExampleOfAiClientRegistry.clear()
+        self.addCleanup(ExampleOfAiClientRegistry.clear)
+        ExampleOfAiClient.reset_latency("example-model-v1")
+
+    def test_services_share_one_client_per_model(self):
+        first = ExampleOfAiService()._get_ai_client("example-model-v1")
+        second = ExampleOfAiService()._get_ai_client("example-model-v1")
+
+        self.assertIs(first, second)
+        self.assertEqual(first.batch_size, 20)
+        self.assertIsNot(first, ExampleOfAiService()._get_ai_client("example-model-pro"))
+
+    def test_warm_clients_creates_every_model(self):
+        ExampleOfAiService().warm_clients()
+        with patch('example.services.example_of_ai_client_registry.ExampleOfAiClient') as client_class:
+            ExampleOfAiService()._get_ai_client("example-model-lite")
+        client_class.assert_not_called()
+
+    def test_semaphore_caps_calls_in_flight(self):
+        client = ExampleOfAiClient("example-model-test", "key", max_concurrency=2)
+        self.addCleanup(client.close)
+        self.addCleanup(ExampleOfAiClient.reset_latency, "example-model-test")
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def call():
+            with client.call():
+                with lock:
+                    in_flight.append(1)
+                    peak.append(len(in_flight))
+                time.sleep(0.05)
+                with lock:
+                    in_flight.pop()
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(max(peak), 2)
+
+    def test_latency_histogram_is_cumulative(self):
+        client = ExampleOfAiService()._get_ai_client("example-model-v1")
+        for seconds in (0.01, 0.3, 0.3, 45):
+            client.record_latency(seconds)
+
+        histogram = ExampleOfAiClient.latency_histogram("example-model-v1")
+        self.assertEqual(histogram['count'], 4)
+        self.assertEqual(histogram['buckets']['0.05'], 1)
+        self.assertEqual(histogram['buckets']['0.25'], 1)
+        self.assertEqual(histogram['buckets']['0.5'], 3)
+        self.assertEqual(histogram['buckets']['+Inf'], 4)
+
+    def test_generating_a_summary_records_latency(self):
+        ExampleOfAiService()._generate_summary("Title", "Some content", "example-model-v1", 50)
+        self.assertEqual(ExampleOfAiClient.latency_histogram("example-model-v1")['count'], 1)
+
 
 class ExampleOfAiServiceTest(TestCase):
     def setUp(self):
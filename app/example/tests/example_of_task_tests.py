@@ -0,0 +1,115 @@
+from celery.exceptions import Retry
+from django.core.cache import cache
+from django.test import TestCase
+from unittest.mock import patch
+from example.models import ExampleOfFetchLog
+from example.tasks import (
+    example_of_async_processing_task,
+    example_of_batch_processing_task,
+    example_of_scheduled_fan_out_task,
+    example_of_source_fetch_task,
+    example_of_fan_out_callback_task,
+    example_of_fan_out_error_task,
+)
+from example.tasks.example_of_fan_out_task import _source_slots_key
+from core.celery import app, route_summary_task
+
+
+class ExampleOfFanOutTaskTest(TestCase):
+    def setUp(self):
+        self.config = {'source': 'ExampleService', 'query_params': {'category': 'example'}}
+        cache.delete(_source_slots_key('ExampleService'))
+
+    @patch('example.tasks.example_of_fan_out_task.chord')
+    def test_scheduler_fans_out_one_task_per_source(self, mock_chord):
+        configs = [self.config, {'source': 'OtherService', 'query_params': {'category': 'other'}}]
+
+        result = example_of_scheduled_fan_out_task.apply(args=[configs]).get()
+
+        header = mock_chord.call_args.args[0]
+        self.assertEqual(len(header), 2)
+        self.assertEqual(result['children'], 2)
+        parent_log = ExampleOfFetchLog.objects.get(id=result['parent_log_id'])
+        self.assertEqual(parent_log.status, ExampleOfFetchLog.Status.IN_PROGRESS)
+        callback = mock_chord.return_value.call_args.args[0]
+        self.assertEqual(callback.options['link_error'][0]['task'], example_of_fan_out_error_task.name)
+
+    def test_source_fetch_returns_child_stats(self):
+        result = example_of_source_fetch_task.apply(args=[self.config]).get()
+
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual(result['items_saved'], 2)
+        self.assertTrue(ExampleOfFetchLog.objects.filter(id=result['fetch_log_id']).exists())
+        self.assertEqual(cache.get(_source_slots_key('ExampleService')), 0)
+
+    def test_saturated_source_is_requeued(self):
+        cache.set(_source_slots_key('ExampleService'), 2)
+
+        with patch.object(example_of_source_fetch_task, 'retry', side_effect=Retry()) as mock_retry:
+            with self.assertRaises(Retry):
+                example_of_source_fetch_task({**self.config, 'max_concurrency': 2})
+
+        mock_retry.assert_called_once()
+        self.assertFalse(ExampleOfFetchLog.objects.exists())
+        self.assertEqual(cache.get(_source_slots_key('ExampleService')), 2)
+
+    def test_expired_slot_counter_is_not_an_error(self):
+        def fetch_and_save(*args, **kwargs):
+            # The counter expires while the fetch is running
+            cache.delete(_source_slots_key('ExampleService'))
+            return {'fetch_log_id': 1, 'items_processed': 0, 'items_saved': 0, 'duplicates_skipped': 0}
+
+        with patch('example.tasks.example_of_fan_out_task.ExampleOfExternalApiService') as mock_service:
+            mock_service.return_value.fetch_and_save.side_effect = fetch_and_save
+            result = example_of_source_fetch_task.apply(args=[self.config]).get()
+
+        self.assertEqual(result['status'], 'success')
+        self.assertIsNone(cache.get(_source_slots_key('ExampleService')))
+
+    def test_errback_closes_parent_log(self):
+        parent_log = ExampleOfFetchLog.objects.create(
+            source='ExampleFanOut', status=ExampleOfFetchLog.Status.IN_PROGRESS
+        )
+
+        example_of_fan_out_error_task(None, RuntimeError('worker lost'), None, parent_log.id)
+
+        parent_log.refresh_from_db()
+        self.assertEqual(parent_log.status, ExampleOfFetchLog.Status.ERROR)
+        self.assertIn('worker lost', parent_log.error_message)
+
+    def test_callback_aggregates_into_parent_log(self):
+        parent_log = ExampleOfFetchLog.objects.create(
+            source='ExampleFanOut', status=ExampleOfFetchLog.Status.IN_PROGRESS
+        )
+        results = [
+            {'source': 'ExampleService', 'status': 'success', 'items_fetched': 5, 'items_saved': 3},
+            {'source': 'OtherService', 'status': 'failed', 'error': 'timeout'},
+        ]
+
+        example_of_fan_out_callback_task.apply(args=[results, parent_log.id])
+
+        parent_log.refresh_from_db()
+        self.assertEqual(parent_log.status, ExampleOfFetchLog.Status.SUCCESS)
+        self.assertEqual((parent_log.items_fetched, parent_log.items_saved), (5, 3))
+        self.assertEqual(parent_log.metadata['failed_sources'], ['OtherService'])
+        self.assertEqual(len(parent_log.metadata['children_stats']), 2)
+
+
+class ExampleOfSummaryRoutingTest(TestCase):
+    def _queue(self, task, args=(), kwargs=None):
+        return app.amqp.router.route({}, task.name, args, kwargs or {})['queue'].name
+
+    def test_summary_tasks_use_the_queue_of_their_model(self):
+        self.assertEqual(self._queue(example_of_async_processing_task, (1, 'example-model-pro')), 'summaries-pro')
+        self.assertEqual(
+            self._queue(example_of_batch_processing_task, ([1, 2], 'example-model-lite')), 'summaries-lite'
+        )
+        self.assertEqual(
+            self._queue(example_of_async_processing_task, (1,), {'processing_model': 'example-model-v2'}), 'summaries'
+        )
+
+    def test_other_tasks_stay_on_the_default_queue(self):
+        self.assertIsNone(
+            route_summary_task(example_of_source_fetch_task.name, ({'source': 'ExampleService'},), {}, {})
+        )
+        self.assertEqual(self._queue(example_of_scheduled_fan_out_task), 'default')
@@ -4,8 +4,13 @@ from example.views import (
     ExampleOfCachedListView,
     ExampleOfManualTriggerView,
     ExampleOfAsyncProcessingView,
+    ExampleOfBatchProcessingView,
     ExampleOfStatusCheckView,
-    example_summary_status
+    example_summary_status,
+    example_summary_cache_stats,
+    example_ai_latency_stats,
+    example_cost_rollups,
+    example_summary_status_stream
 )
 
 # Create a router for the CRUD views
@@ -21,6 +26,11 @@ urlpatterns = [
     
     # Async examples
     path('process/', ExampleOfAsyncProcessingView.as_view(), name='example-process'),
+    path('process/batch/', ExampleOfBatchProcessingView.as_view(), name='example-process-batch'),
     path('status/<int:item_id>/', ExampleOfStatusCheckView.as_view(), name='example-status'),
+    path('status/<int:item_id>/events/', example_summary_status_stream, name='example-status-events'),
     path('summary-status/<int:summary_id>/', example_summary_status, name='example-summary-status'),
+    path('summary-cache/stats/', example_summary_cache_stats, name='example-summary-cache-stats'),
+    path('ai/latency/', example_ai_latency_stats, name='example-ai-latency-stats'),
+    path('costs/', example_cost_rollups, name='example-costs'),
 ] 
\ No newline at end of file
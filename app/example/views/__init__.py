@@ -1,12 +1,26 @@
 # Example views package
 from .example_of_crud_views import ExampleOfCachedListView
 from .example_of_service_views import ExampleOfManualTriggerView
-from .example_of_async_views import ExampleOfAsyncProcessingView, ExampleOfStatusCheckView, example_summary_status
+from .example_of_async_views import (
+    ExampleOfAsyncProcessingView,
+    ExampleOfBatchProcessingView,
+    ExampleOfStatusCheckView,
+    example_summary_status,
+    example_summary_cache_stats,
+    example_ai_latency_stats,
+    example_cost_rollups
+)
+from .example_of_status_stream_views import example_summary_status_stream
 
 __all__ = [
     'ExampleOfCachedListView',
     'ExampleOfManualTriggerView',
     'ExampleOfAsyncProcessingView',
+    'ExampleOfBatchProcessingView',
     'ExampleOfStatusCheckView',
     'example_summary_status',
+    'example_summary_cache_stats',
+    'example_ai_latency_stats',
+    'example_cost_rollups',
+    'example_summary_status_stream',
 ] 
\ No newline at end of file
@@ -6,8 +6,12 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAdminUser
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.conf import settings
+from core.celery import SUMMARY_PRIORITIES
 from drf_spectacular.utils import extend_schema
-from example.services import ExampleOfAiService
+from example.services import ExampleOfAiService, ExampleOfSummaryCache, ExampleOfAiClient, ExampleOfCostRollupRecorder
 from example.models import ExampleOfSummary, ExampleOfArticle
 from example.serializers import ExampleOfModelSerializer
 import logging
@@ -32,6 +36,7 @@ class ExampleOfAsyncProcessingView(APIView):
                 'item_id': {'type': 'integer'},
                 'processing_model': {'type': 'string'},
                 'max_words': {'type': 'integer'},
+                'priority': {'type': 'string', 'enum': list(SUMMARY_PRIORITIES)},
             },
             'required': ['item_id']
         }
@@ -47,6 +52,7 @@ class ExampleOfAsyncProcessingView(ExampleOfAsyncProcessingView):
         item_id = request.data.get('item_id')
         processing_model = request.data.get('processing_model', 'example-model-v1')
         max_words = request.data.get('max_words', 150)
+        priority = request.data.get('priority')
         if not item_id:
             return Response({'error': 'item_id is required'}, status=status.HTTP_400_BAD_REQUEST)
         user = request.user if request.user.is_authenticated else None
@@ -56,7 +62,8 @@ class ExampleOfAsyncProcessingView(ExampleOfAsyncProcessingView):
                 item_id=item_id,
                 processing_model=processing_model,
                 user=user,
-                max_words=max_words
+                max_words=max_words,
+                priority=priority
             )
         except ExampleOfArticle.DoesNotExist:
             return Response({'error': 'Example item not found'}, status=status.HTTP_404_NOT_FOUND)
@@ -77,6 +84,76 @@ class ExampleOfAsyncProcessingView(ExampleOfAsyncProcessingView):
         elif summary.status == 'failed':
             return Response({'success': False, 'summary': response_data, 'message': 'Processing failed.'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+
+@method_decorator(csrf_exempt, name='dispatch')
+@extend_schema(
+    request={
+        'application/json': {
+            'type': 'object',
+            'properties': {
+                'item_ids': {'type': 'array', 'items': {'type': 'integer'}},
+                'processing_model': {'type': 'string'},
+                'max_words': {'type': 'integer'},
+                'priority': {'type': 'string', 'enum': list(SUMMARY_PRIORITIES)},
+            },
+            'required': ['item_ids']
+        }
+    },
+    responses={200: {'type': 'object'}, 202: {'type': 'object'}}
+)
+class ExampleOfBatchProcessingView(ExampleOfAsyncProcessingView):
+    """Example of a view to queue processing for many items in one request."""
+    def post(self, request):
+        """
+        Create processing requests for a list of items with a single background task.
+        Returns 200 when every summary is already completed, otherwise 202.
+        """
+        item_ids = request.data.get('item_ids')
+        processing_model = request.data.get('processing_model', 'example-model-v1')
+        max_words = request.data.get('max_words', 150)
+        priority = request.data.get('priority')
+        if not isinstance(item_ids, list) or not item_ids:
+            return Response({'error': 'item_ids must be a non-empty list'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(item_ids) > settings.EXAMPLE_AI_MAX_BATCH_ITEMS:
+            return Response(
+                {'error': f'At most {settings.EXAMPLE_AI_MAX_BATCH_ITEMS} item_ids are accepted per request'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            item_ids = [int(item_id) for item_id in item_ids]
+        except (TypeError, ValueError):
+            return Response({'error': 'item_ids must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+        if priority is not None and priority not in SUMMARY_PRIORITIES:
+            return Response(
+                {'error': f"priority must be one of {', '.join(SUMMARY_PRIORITIES)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        user = request.user if request.user.is_authenticated else None
+
+        try:
+            summaries = self.ai_service.process_items_async(
+                item_ids=item_ids,
+                processing_model=processing_model,
+                user=user,
+                max_words=max_words,
+                priority=priority
+            )
+        except Exception as e:
+            logger.error(f"Error in batch processing view: {str(e)}")
+            return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        results = [
+            {'item_id': item_id, 'summary': ExampleOfModelSerializer(summary).data}
+            for item_id, summary in summaries.items()
+        ]
+        missing_item_ids = [item_id for item_id in dict.fromkeys(item_ids) if item_id not in summaries]
+        all_completed = all(summary.status == 'completed' for summary in summaries.values())
+        return Response(
+            {'success': True, 'results': results, 'missing_item_ids': missing_item_ids},
+            status=status.HTTP_200_OK if all_completed else status.HTTP_202_ACCEPTED
+        )
+
+
 @extend_schema(responses={200: {'type': 'object'}})
 class ExampleOfStatusCheckView(ExampleOfAsyncProcessingView):
     """Example of a view to retrieve processing status."""
@@ -136,4 +213,69 @@ def example_summary_status(request, summary_id):
         return Response({'error': 'Processing summary not found'}, status=status.HTTP_404_NOT_FOUND)
     except Exception as e:
         logger.error(f"Error in summary status view: {str(e)}")
-        return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR) 
\ No newline at end of file
+        return Response({'error': 'Internal server error'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@extend_schema(responses={200: {'type': 'object'}})
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+@authentication_classes([TokenAuthentication])
+def example_summary_cache_stats(request):
+    """Example of exposing summary cache hit/miss counters and the credits saved by hits."""
+    return Response({'success': True, 'stats': ExampleOfSummaryCache.stats()})
+
+
+@extend_schema(responses={200: {'type': 'object'}})
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+@authentication_classes([TokenAuthentication])
+def example_ai_latency_stats(request):
+    """Example of exposing per-model AI call latency histograms, aggregated over all workers."""
+    models = sorted(set(ExampleOfAiService().model_map.values()))
+    return Response({
+        'success': True,
+        'latency': {model: ExampleOfAiClient.latency_histogram(model) for model in models},
+    })
+
+
+# Public names of the cost rollup grouping fields
+COST_GROUP_FIELDS = {'model': 'processing_model', 'user': 'requested_by', 'hour': 'bucket_start'}
+
+
+@extend_schema(responses={200: {'type': 'object'}})
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+@authentication_classes([TokenAuthentication])
+def example_cost_rollups(request):
+    """
+    Example of reporting credits spent from the hourly cost rollups.
+    Query parameters: `start` and `end` (ISO datetimes, default: since midnight UTC) and
+    `group_by`, a comma-separated list of model, user and hour (default: model,user).
+    Reads one row per bucket, never the summaries themselves.
+    """
+    now = timezone.now()
+    start = parse_datetime(request.GET['start']) if 'start' in request.GET else now.replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    end = parse_datetime(request.GET['end']) if 'end' in request.GET else now
+    if start is None or end is None:
+        return Response({'error': 'start and end must be ISO datetimes'}, status=status.HTTP_400_BAD_REQUEST)
+    if timezone.is_naive(start) or timezone.is_naive(end):
+        start, end = (timezone.make_aware(value) if timezone.is_naive(value) else value for value in (start, end))
+
+    group_by = [name for name in request.GET.get('group_by', 'model,user').split(',') if name]
+    if not group_by or any(name not in COST_GROUP_FIELDS for name in group_by):
+        return Response(
+            {'error': f"group_by must list one or more of {', '.join(COST_GROUP_FIELDS)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    rows = ExampleOfCostRollupRecorder.totals(start, end, [COST_GROUP_FIELDS[name] for name in group_by])
+    return Response({
+        'success': True,
+        'start': start,
+        'end': end,
+        'summary_count': sum(row['summary_count'] for row in rows),
+        'total_cost': sum((row['total_cost'] for row in rows), 0),
+        'results': rows,
+    })
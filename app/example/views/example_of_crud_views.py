@@ -1,13 +1,22 @@
+import hashlib
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast, Greatest
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from core.pagination import ExampleOfOptInCursorPagination, ExampleOfSearchCursorPagination
 from core.permissions import ExampleOfCustomPermission
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from rest_framework.authentication import TokenAuthentication
 
 from example.models import ExampleOfArticle
+from example.models.example_of_article import SEARCH_CONFIG
 from example.serializers import ExampleOfCustomValidationSerializer
+from example.services import ExampleOfItemResponseCache
 
 import logging
 
@@ -23,23 +32,170 @@ class ExampleOfCachedListView(viewsets.ModelViewSet):
         - GET {id}/: Retrieve a specific example item by ID
         - PUT {id}/: Update a specific example item by ID
         - DELETE {id}/: Delete a specific example item by ID
+        - GET search/?q=: Full-text search, best matches first
 
     * The items are ordered by their published date in descending order.
-    * Includes caching for GET requests (5 minutes).
+    * The list can be filtered by length with `?min_words=` and `?max_words=`.
+    * List, search and retrieve return the fields named by `?fields=`, minus those in
+      `?omit=`, and load only those columns. List and search default to SUMMARY_FIELDS,
+      without the content and description.
+    * Search runs on the GIN-indexed search_vector (PostgreSQL) and is keyset paginated
+      by rank; `?fuzzy=true` adds typo-tolerant title matches via the trigram index.
+    * The list is paginated by page number; `?pagination=cursor` switches to keyset
+      pagination, whose cost does not grow with page depth.
+    * List and retrieve responses are cached until the next write to the items (see
+      ExampleOfItemResponseCache), for at most EXAMPLE_ITEM_CACHE_TTL seconds.
+    * List and retrieve responses carry a strong ETag and Last-Modified; requests with a
+      matching If-None-Match or If-Modified-Since get a 304 without serializing anything.
     """
 
-    queryset = ExampleOfArticle.objects.all().order_by('-published_date')
+    # id breaks ties between equal dates, matching the (published_date, id) index
+    queryset = ExampleOfArticle.objects.all().order_by('-published_date', '-id')
     serializer_class = ExampleOfCustomValidationSerializer
+    pagination_class = ExampleOfOptInCursorPagination
     permission_classes = [ExampleOfCustomPermission]
     authentication_classes = [TokenAuthentication]
 
-    # Cache GET list endpoint (5 minutes)
-    @method_decorator(cache_page(60 * 5), name='list')
-    @method_decorator(cache_page(60 * 5), name='retrieve')
-    def dispatch(self, *args, **kwargs):
-        return super().dispatch(*args, **kwargs)
+    # Default projection of the list: everything but the heavy text columns
+    SUMMARY_FIELDS = (
+        'id', 'title', 'url', 'published_date', 'author', 'source', 'image_url',
+        'example_source', 'word_count', 'char_count', 'created_at',
+    )
+    # Always loaded by projected reads: the ordering keys, read by cursor pagination
+    PROJECTION_COLUMNS = ('id', 'published_date')
+
+    def get_queryset(self):
+        """Load only the projected columns and filter the list by the stored word count."""
+        queryset = super().get_queryset()
+        projection = self.get_projection()
+        if projection is not None:
+            queryset = queryset.only(*self.PROJECTION_COLUMNS, *projection)
+        if self.action not in ('list', 'search'):
+            return queryset
+        for param, lookup in (('min_words', 'word_count__gte'), ('max_words', 'word_count__lte')):
+            value = self.request.query_params.get(param)
+            if value is not None:
+                try:
+                    queryset = queryset.filter(**{lookup: int(value)})
+                except ValueError:
+                    raise ValidationError({param: 'Must be an integer.'})
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        projection = self.get_projection()
+        if projection is not None:
+            kwargs.setdefault('fields', projection)
+        return super().get_serializer(*args, **kwargs)
+
+    def get_projection(self):
+        """
+        Fields returned by a read: `?fields=` replaces the default (SUMMARY_FIELDS for list
+        and search, every field for retrieve) and `?omit=` removes fields from it.
+        None for writes, which always use the full serializer.
+        """
+        if self.action not in ('list', 'search', 'retrieve') or self.request.method not in ('GET', 'HEAD'):
+            return None
+        available = self.get_serializer_class().Meta.fields
+        requested = self._field_names('fields', available)
+        omitted = self._field_names('omit', available)
+        default = available if self.action == 'retrieve' else self.SUMMARY_FIELDS
+        selected = set(requested or default) - set(omitted)
+        return [name for name in available if name in selected]
+
+    def _field_names(self, param, available):
+        value = self.request.query_params.get(param, '')
+        names = [name.strip() for name in value.split(',') if name.strip()]
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise ValidationError({param: f"Unknown fields: {', '.join(unknown)}."})
+        return names
+
+    def list(self, request, *args, **kwargs):
+        url = request.build_absolute_uri()
+        # The collection version is the time of the last write, so it is both the ETag
+        # seed and Last-Modified, and answering a revalidation costs no query at all
+        version = ExampleOfItemResponseCache.collection_version()
+        etag = self._etag(version, url)
+        last_modified = version // 1_000_000_000
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        key = ExampleOfItemResponseCache.list_key(url, version)
+        data = ExampleOfItemResponseCache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            ExampleOfItemResponseCache.set(key, data)
+        return self._with_validators(Response(data), etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = kwargs[self.lookup_field]
+        url = request.build_absolute_uri()
+        # One indexed lookup of the row version; unknown or malformed ids fall through to the 404
+        try:
+            updated_at = ExampleOfArticle.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+        except (TypeError, ValueError):
+            updated_at = None
+        if updated_at is None:
+            return super().retrieve(request, *args, **kwargs)
+        etag = self._etag(updated_at.isoformat(), url)
+        last_modified = int(updated_at.timestamp())
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        key = ExampleOfItemResponseCache.detail_key(pk, url)
+        data = ExampleOfItemResponseCache.get(key)
+        if data is None:
+            data = super().retrieve(request, *args, **kwargs).data
+            ExampleOfItemResponseCache.set(key, data)
+        return self._with_validators(Response(data), etag, last_modified)
+
+    @staticmethod
+    def _etag(version, url):
+        """Strong ETag from the version and the full URL, which covers the query parameters."""
+        digest = hashlib.sha256(f'{version}:{url}'.encode('utf-8')).hexdigest()[:32]
+        return f'"{digest}"'
+
+    @staticmethod
+    def _with_validators(response, etag, last_modified):
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        # Clients may keep the response but must revalidate it; it depends on the user's token
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    @action(detail=False, methods=['get'], url_path='search')
+    def search(self, request):
+        """
+        Example of a ranked full-text search over title, description and content.
+        `?q=` takes web search syntax ("quoted phrases", or, -excluded); results are not
+        cached, since they have no single version to be keyed by.
+        """
+        text = request.query_params.get('q', '').strip()
+        if not text:
+            raise ValidationError({'q': 'This parameter is required.'})
+        fuzzy = request.query_params.get('fuzzy') in ('1', 'true')
+        queryset = self.search_queryset(self.get_queryset(), text, fuzzy=fuzzy)
+
+        paginator = ExampleOfSearchCursorPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        results = [{**item, 'rank': article.rank} for item, article in zip(serializer.data, page)]
+        return paginator.get_paginated_response(results)
+
+    @staticmethod
+    def search_queryset(queryset, text, fuzzy=False):
+        """Articles of the queryset matching the text, annotated with their `rank`."""
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type='websearch')
+        matches = Q(search_vector=query)
+        rank = SearchRank(F('search_vector'), query)
+        if fuzzy:
+            matches |= Q(title__trigram_similar=text)
+            rank = Greatest(rank, TrigramSimilarity('title', text))
+        # As double precision, so the rank in a cursor compares exactly with the column
+        return queryset.filter(matches).annotate(rank=Cast(rank, FloatField()))
 
-    @method_decorator(cache_page(60 * 5))
     @action(detail=True, methods=['get'], url_path='process')
     def process(self, request, pk=None):
         """Example of a custom action that processes an item asynchronously."""
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import logging
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from asgiref.sync import sync_to_async
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import APIException, AuthenticationFailed, NotAuthenticated
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+
+from example.models import ExampleOfArticle, ExampleOfSummary
+from example.services import ExampleOfStatusChannel
+
+logger = logging.getLogger(__name__)
+
+
+class ExampleOfStatusStreamAccess(APIView):
+    """
+    Example of applying DRF authentication and permissions outside a DRF view.
+    The stream is a plain async view, since DRF views cannot stream asynchronously; the
+    checks still run through APIView, with the same classes as the other admin views.
+    """
+    authentication_classes = [TokenAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def check(self, request):
+        """Return None when the request may open the stream, otherwise the error response."""
+        self.request = self.initialize_request(request)
+        try:
+            self.perform_authentication(self.request)
+            self.check_permissions(self.request)
+        except APIException as exc:
+            # Mirrors APIView.handle_exception: 401 with a challenge, or 403 without one
+            status, headers = exc.status_code, {}
+            if isinstance(exc, (NotAuthenticated, AuthenticationFailed)):
+                auth_header = self.get_authenticate_header(self.request)
+                if auth_header:
+                    headers['WWW-Authenticate'] = auth_header
+                else:
+                    status = 403
+            return JsonResponse({'detail': exc.detail}, status=status, headers=headers)
+        return None
+
+
+def _sse_event(data, event='status'):
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+@require_GET
+async def example_summary_status_stream(request, item_id):
+    """
+    Example of a server-sent events stream of summary status for an item.
+
+    Sends the current status once, then one event per transition published by the workers,
+    and closes after a terminal status ('completed' or 'failed') or after
+    EXAMPLE_STATUS_STREAM_TIMEOUT seconds, when clients reconnect. Waiting costs no queries.
+    Needs an ASGI server (core.asgi:application) to stream; under WSGI the response is
+    only sent once the stream ends.
+    """
+    denied = await sync_to_async(ExampleOfStatusStreamAccess().check)(request)
+    if denied is not None:
+        return denied
+    processing_model = request.GET.get('processing_model', 'example-model-v1')
+
+    if not await ExampleOfArticle.objects.filter(id=item_id).aexists():
+        return JsonResponse({'error': 'Example item not found'}, status=404)
+
+    async def events():
+        async with ExampleOfStatusChannel.subscribe(item_id, processing_model) as messages:
+            # Read the current status only once subscribed, so no transition can slip in between
+            current = await ExampleOfSummary.objects.filter(
+                example_item_id=item_id, processing_model=processing_model
+            ).values('example_item_id', 'processing_model', *ExampleOfStatusChannel.PAYLOAD_FIELDS).afirst()
+            if current is not None:
+                yield _sse_event(ExampleOfStatusChannel.payload(current))
+                if current['status'] in ExampleOfStatusChannel.TERMINAL_STATUSES:
+                    return
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + settings.EXAMPLE_STATUS_STREAM_TIMEOUT
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    message = await asyncio.wait_for(
+                        messages.get(), timeout=min(remaining, settings.EXAMPLE_STATUS_STREAM_HEARTBEAT)
+                    )
+                except asyncio.TimeoutError:
+                    # Comment lines keep proxies from closing an idle connection
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _sse_event(message)
+                if message['status'] in ExampleOfStatusChannel.TERMINAL_STATUSES:
+                    return
+            yield _sse_event({'item_id': item_id, 'processing_model': processing_model}, event='timeout')
+
+    response = StreamingHttpResponse(events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response